@@ -1,7 +1,108 @@
+import datetime
+import threading
+import numpy as np
 import streamlit as st
-import plotly.express as px
-from services.stock_analysis_service import get_breakout_points
+from services.stock_analysis_service import get_breakout_points, get_default_provider
+from services.rate_limiter import PRIORITY_INTERACTIVE, get_shared_rate_limiter, request_priority
 from utils.data_processing import DataProcessor
+from utils.ttl_cache import TTLCache
+from utils.intervals import horizons_to_bars, to_bars
+from utils.downsampling import downsample_indices
+from models.breakout import MISSING_VALUE, UTC_DATE_COLUMN
+from models.price_series import PriceSeries
+from config.constants import (
+    VOLUME_THRESHOLD,
+    PRICE_THRESHOLD,
+    VOLUME_WINDOW,
+    HOLDING_PERIOD,
+    FORWARD_HORIZONS,
+    APP_CACHE_TTL_SECONDS,
+    APP_CACHE_MAX_ENTRIES,
+    APP_WARMUP_TICKERS_FILE,
+    APP_CHART_MAX_POINTS,
+    APP_CHART_CACHE_MAX_BARS,
+    APP_TABLE_PAGE_SIZE,
+    INTERVAL_MINUTES,
+    TRADING_MINUTES_PER_DAY,
+)
+
+def compute_breakout_table(ticker: str, interval: str = "1d"):
+    """
+    Fetches and processes breakout points for a ticker.
+
+    Parameters:
+        ticker (str): The stock ticker symbol.
+        interval (str): The bar interval to analyze (e.g., "1d" or "5m").
+
+    Returns:
+        pd.DataFrame: DataFrame containing breakout points, with the UTC timestamp of each
+        breakout bar in UTC_DATE_COLUMN to place it on the price chart.
+    """
+    breakouts = get_breakout_points(ticker, interval=interval)
+    return DataProcessor.breakouts_to_dataframe(breakouts, include_utc_date=True)
+
+def load_price_series(ticker: str, interval: str = "1d") -> PriceSeries:
+    """
+    Loads the bars of a ticker for the price chart, from the bar cache when it is fresh.
+
+    Parameters:
+        ticker (str): The stock ticker symbol.
+        interval (str): The bar interval (e.g., "1d" or "5m").
+
+    Returns:
+        PriceSeries: The bars, sorted by date.
+    """
+    return get_default_provider().fetch_stock_data(ticker, interval).price_series.sorted()
+
+def result_cache_key(ticker: str, interval: str = "1d") -> tuple:
+    return (ticker, interval, VOLUME_THRESHOLD, PRICE_THRESHOLD, VOLUME_WINDOW, HOLDING_PERIOD, FORWARD_HORIZONS)
+
+def warm_up_result_cache(cache: TTLCache, tickers_file: str = APP_WARMUP_TICKERS_FILE):
+    """
+    Precomputes breakout tables for the tickers listed in `tickers_file`.
+
+    Parameters:
+        cache (TTLCache): The result cache to populate.
+        tickers_file (str): Path to a file with one ticker per line.
+    """
+    from export_stock_analysis import read_tickers
+
+    try:
+        tickers = read_tickers(tickers_file)
+    except FileNotFoundError:
+        return
+
+    for ticker in tickers:
+        try:
+            cache.get_or_compute(result_cache_key(ticker), lambda: compute_breakout_table(ticker))
+        except Exception:
+            continue  # Failed tickers are computed again on demand
+
+@st.cache_resource
+def get_result_cache() -> TTLCache:
+    """
+    Returns the result cache shared by every session of this server process.
+
+    The first call starts a background thread that warms the cache from the tickers file.
+    """
+    cache = TTLCache(max_entries=APP_CACHE_MAX_ENTRIES, ttl_seconds=APP_CACHE_TTL_SECONDS)
+    threading.Thread(target=warm_up_result_cache, args=(cache,), daemon=True).start()
+    return cache
+
+@st.cache_resource
+def get_chart_cache() -> TTLCache:
+    """
+    Returns the cache of chart bars shared by every session of this server process.
+
+    It is bounded by the total number of bars held, not the number of tickers, since one
+    intraday history can be as large as thousands of daily ones.
+    """
+    return TTLCache(
+        max_entries=APP_CACHE_MAX_ENTRIES,
+        ttl_seconds=APP_CACHE_TTL_SECONDS,
+        max_size=APP_CHART_CACHE_MAX_BARS,
+        sizeof=len,
+    )
 
 class BreakoutAnalysisApp:
     """
@@ -13,6 +114,7 @@ class BreakoutAnalysisApp:
         Initializes the app with any necessary configurations or state variables.
         """
         self.ticker = None
+        self.interval = "1d"
 
     def display_breakout_results(self, breakout_df):
         """
@@ -21,48 +123,183 @@ class BreakoutAnalysisApp:
         Parameters:
             breakout_df (pd.DataFrame): DataFrame containing breakout points.
         """
+        import plotly.express as px
+
+        self.display_price_chart(breakout_df)
+
         st.subheader(f"Breakout Points for {self.ticker}:")
-        st.dataframe(breakout_df)
+        self.display_breakout_table(breakout_df)
 
-        # Scatter Plot: Returns After 20 Days
-        st.subheader("Returns After 20 Days (Scatter Plot)")
+        # Scatter Plot: Returns after the holding period
+        holding_bars = to_bars(HOLDING_PERIOD, self.interval)
+        holding_period = f"{holding_bars} Days" if self.interval == "1d" else f"{holding_bars} Bars ({self.interval})"
+        st.subheader(f"Returns After {holding_period} (Scatter Plot)")
         fig = px.scatter(
             breakout_df,
             x="Breakout Date",
             y="Return (%)",
-            title="Returns After 20 Days",
+            title=f"Returns After {holding_period}",
             labels={"Breakout Date": "Date", "Return (%)": "Return (%)"},
-            hover_data=["Breakout Day Close", "Price After 20 Days"],
+            hover_data=["Breakout Day Close", "Price After Holding Period"],
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+        if FORWARD_HORIZONS:
+            self.display_horizon_results(breakout_df)
+
+    def display_price_chart(self, breakout_df):
+        """
+        Displays the price and volume history with the breakout bars marked.
+
+        Only the date range selected with the slider is plotted, downsampled on the server to
+        at most APP_CHART_MAX_POINTS points per trace (keeping each bucket's extremes and every
+        breakout bar) and rendered with WebGL, so the page stays fast for any history length.
+
+        Parameters:
+            breakout_df (pd.DataFrame): DataFrame containing breakout points.
+        """
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+
+        series = self.load_chart_series()
+        if len(series) < 2:
+            return
+
+        st.subheader(f"Price History for {self.ticker}")
+        intraday = INTERVAL_MINUTES.get(self.interval, TRADING_MINUTES_PER_DAY) < TRADING_MINUTES_PER_DAY
+        first, last = (_to_datetime(utc_date) for utc_date in (series.utc_dates[0], series.utc_dates[-1]))
+        start, end = st.slider(
+            "Date Range",
+            min_value=first,
+            max_value=last,
+            value=(first, last),
+            step=datetime.timedelta(minutes=INTERVAL_MINUTES[self.interval]) if intraday else datetime.timedelta(days=1),
+            format="YYYY-MM-DD HH:mm" if intraday else "YYYY-MM-DD",
+        )
+
+        # Zooming slices the visible range here, so the browser only ever gets downsampled points
+        lo = int(np.searchsorted(series.utc_dates, _to_timestamp(start), side="left"))
+        hi = int(np.searchsorted(series.utc_dates, _to_timestamp(end), side="right"))
+        visible = series[lo:hi]
+        if len(visible) == 0:
+            st.write("No bars in the selected range.")
+            return
+
+        # Bars are sorted by utc_date, so breakout bars are found by binary search
+        breakout_utc_dates = breakout_df[UTC_DATE_COLUMN].to_numpy(dtype=np.int64)
+        positions = np.searchsorted(visible.utc_dates, breakout_utc_dates)
+        found = positions < len(visible)
+        found[found] = visible.utc_dates[positions[found]] == breakout_utc_dates[found]
+        breakout_positions = positions[found]
+        indices = downsample_indices([visible.closes, visible.volumes], APP_CHART_MAX_POINTS, keep=breakout_positions)
+
+        fig = make_subplots(rows=2, cols=1, shared_xaxes=True, row_heights=[0.75, 0.25], vertical_spacing=0.03)
+        fig.add_trace(
+            go.Scattergl(x=visible.dates[indices], y=visible.closes[indices], mode="lines", name="Close"),
+            row=1, col=1,
+        )
+        fig.add_trace(
+            go.Scattergl(
+                x=visible.dates[breakout_positions],
+                y=visible.closes[breakout_positions],
+                mode="markers",
+                name="Breakout",
+                marker={"symbol": "triangle-up", "size": 10, "color": "green"},
+            ),
+            row=1, col=1,
+        )
+        fig.add_trace(
+            go.Scattergl(x=visible.dates[indices], y=visible.volumes[indices], mode="lines", fill="tozeroy", name="Volume"),
+            row=2, col=1,
+        )
+        fig.update_layout(hovermode="x unified", margin={"t": 30})
+        fig.update_yaxes(title_text="Close", row=1, col=1)
+        fig.update_yaxes(title_text="Volume", row=2, col=1)
+        st.plotly_chart(fig, use_container_width=True)
+        st.caption(f"Showing {len(indices)} of {len(visible)} bars; every breakout bar is shown.")
+
+    def display_breakout_table(self, breakout_df):
+        """
+        Displays the breakout table one page of APP_TABLE_PAGE_SIZE rows at a time.
+
+        Parameters:
+            breakout_df (pd.DataFrame): DataFrame containing breakout points.
+        """
+        pages = -(-len(breakout_df) // APP_TABLE_PAGE_SIZE)
+        page = 1
+        if pages > 1:
+            page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, step=1)
+        start = (page - 1) * APP_TABLE_PAGE_SIZE
+        page_df = breakout_df.iloc[start:start + APP_TABLE_PAGE_SIZE].drop(columns=UTC_DATE_COLUMN, errors="ignore")
+        # Columns stay numeric; missing values are only rendered as text
+        st.dataframe(page_df.style.format(na_rep=MISSING_VALUE, precision=2))
+        if pages > 1:
+            st.caption(f"Breakouts {start + 1}-{start + len(page_df)} of {len(breakout_df)}")
+
+    def display_horizon_results(self, breakout_df):
+        """
+        Displays the return of each breakout over a selected forward horizon, with its MFE and MAE.
+
+        Parameters:
+            breakout_df (pd.DataFrame): DataFrame containing breakout points.
+        """
+        import plotly.express as px
+
+        st.subheader("Returns by Horizon")
+        horizons = horizons_to_bars(FORWARD_HORIZONS, self.interval)
+        horizon = st.selectbox(f"Horizon ({self.interval} bars)", horizons, index=len(horizons) - 1)
+        return_column = f"Return {horizon} Bars (%)"
+        fig = px.scatter(
+            breakout_df,
+            x="Breakout Date",
+            y=return_column,
+            title=f"Returns After {horizon} Bars",
+            labels={"Breakout Date": "Date", return_column: "Return (%)"},
+            hover_data=[f"MFE {horizon} Bars (%)", f"MAE {horizon} Bars (%)"],
         )
         st.plotly_chart(fig, use_container_width=True)
 
     def analyze_ticker(self):
         """
-        Fetches and processes breakout points for the given ticker.
+        Fetches and processes breakout points for the given ticker, reusing cached results.
+
+        API requests made here are interactive, so they are served before batch exports and
+        the cache warm-up when the shared rate limit is saturated.
 
         Returns:
             pd.DataFrame: DataFrame containing breakout points.
         """
+        cache = get_result_cache()
+        ticker, interval = self.ticker, self.interval
+        with request_priority(PRIORITY_INTERACTIVE):
+            return cache.get_or_compute(result_cache_key(ticker, interval), lambda: compute_breakout_table(ticker, interval))
 
-        # Call the service function to get breakouts
-        breakouts = get_breakout_points(self.ticker)
-
-        # Convert breakouts to DataFrame
-        breakout_data = [breakout.to_dict() for breakout in breakouts]
-        breakout_df = DataProcessor.format_breakout_data(breakout_data)
+    def load_chart_series(self) -> PriceSeries:
+        """
+        Returns the bars of the analyzed ticker for the price chart, reusing cached results.
 
-        return breakout_df
-        
+        Returns:
+            PriceSeries: The bars, sorted by date.
+        """
+        cache = get_chart_cache()
+        ticker, interval = self.ticker, self.interval
+        with request_priority(PRIORITY_INTERACTIVE):
+            return cache.get_or_compute((ticker, interval), lambda: load_price_series(ticker, interval))
 
     def run(self):
         """
         Main entry point for the app, handling user input and displaying results.
         """
+        # Create the shared result cache (and start its warm-up) on the first session
+        get_result_cache()
+
         st.title("Breakout Points Analysis")
         st.write("Analyze stock data for breakout points and visualize the results.")
 
         # Input for stock ticker
         self.ticker = st.text_input("Enter Stock Ticker (e.g., TSLA):")
+        intervals = list(INTERVAL_MINUTES)
+        self.interval = st.selectbox("Bar Interval", intervals, index=intervals.index("1d"))
 
         # Button to trigger analysis
         if st.button("Analyze"):
@@ -70,8 +307,11 @@ class BreakoutAnalysisApp:
                 st.error("Please enter a valid stock ticker.")
                 return
 
-            # Ensure the ticker is uppercase
-            self.ticker = self.ticker.upper()
+            # Ensure the ticker is uppercase and keep it across reruns triggered by other widgets
+            st.session_state["analyzed_ticker"] = self.ticker.upper()
+
+        if st.session_state.get("analyzed_ticker"):
+            self.ticker = st.session_state["analyzed_ticker"]
 
             try:
                 # Analyze the ticker
@@ -83,12 +323,22 @@ class BreakoutAnalysisApp:
                 else:
                     self.display_breakout_results(breakout_df)
 
+                remaining_quota = get_shared_rate_limiter().remaining_quota()
+                if remaining_quota is not None:
+                    st.caption(f"Remaining API requests this month: {remaining_quota}")
+
             except ValueError as e:
                 st.error(e)
             except Exception as e:
                 st.error(f"Something went wrong while fetching breakout points for ticker {self.ticker}")
 
 
+def _to_datetime(utc_date: int) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(int(utc_date), datetime.timezone.utc).replace(tzinfo=None)
+
+def _to_timestamp(value: datetime.datetime) -> int:
+    return int(value.replace(tzinfo=datetime.timezone.utc).timestamp())
+
 if __name__ == "__main__":
     app = BreakoutAnalysisApp()
     app.run()
@@ -0,0 +1,55 @@
+import argparse
+import time
+from export_stock_analysis import read_tickers
+from services.bar_cache import BarCache
+from services.bulk_file_provider import BulkFileProvider
+from config.constants import BAR_CACHE_PATH
+
+def backfill(provider: BulkFileProvider, bar_cache: BarCache, tickers: list = None) -> dict:
+    """
+    Copies the bars of every ticker in the provider's files into the bar cache.
+
+    Every bar is upserted, so history older than the bars already cached is filled in and
+    bars present in both are replaced by the files' values. The series is marked as
+    refreshed, so later runs read it from the cache without calling the API.
+
+    Parameters:
+        provider (BulkFileProvider): Provider reading the bulk files.
+        bar_cache (BarCache): Cache to write to.
+        tickers (list): Only backfill these tickers. Defaults to every ticker in the files.
+
+    Returns:
+        dict: Mapping of ticker to the number of bars written.
+    """
+    wanted = set(tickers) if tickers is not None else None
+    written = {}
+    for ticker, stock_summary in provider.iter_stock_data():
+        if wanted is not None and ticker not in wanted:
+            continue
+        written[ticker] = bar_cache.merge(ticker, provider.interval, stock_summary, append_only=False)
+    return written
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill the bar cache from local CSV, Parquet or Arrow OHLCV files.")
+    parser.add_argument("files", nargs="+", help="Files or glob patterns with rows of ticker, date, open, high, low, close, volume.")
+    parser.add_argument("--interval", default="1d", help="Bar interval of the data in the files.")
+    parser.add_argument("--currency", default="USD", help="Currency of tickers without a currency column.")
+    parser.add_argument("--tickers", help="Optional file with one ticker per line to backfill (default: all tickers in the files).")
+    parser.add_argument("--cache", default=BAR_CACHE_PATH, help="Path of the bar cache database.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    provider = BulkFileProvider(args.files, interval=args.interval, currency=args.currency)
+    bar_cache = BarCache(args.cache)
+    try:
+        written = backfill(provider, bar_cache, read_tickers(args.tickers) if args.tickers else None)
+    finally:
+        bar_cache.close()
+
+    print(
+        f"Backfilled {sum(written.values())} {args.interval} bars for {len(written)} tickers "
+        f"in {time.perf_counter() - start:.1f}s."
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import argparse
+from export_stock_analysis import read_tickers
+from services.backtest_service import BacktestService
+from config.constants import (
+    BAR_CACHE_PATH,
+    VOLUME_THRESHOLD,
+    PRICE_THRESHOLD,
+    VOLUME_WINDOW,
+    HOLDING_PERIOD,
+    BACKTEST_INITIAL_CAPITAL,
+    BACKTEST_POSITION_SIZE,
+    BACKTEST_MAX_POSITIONS,
+)
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtest buying breakouts and holding them, using cached price data only.")
+    parser.add_argument("--tickers", default="tickers.txt", help="File with one ticker per line.")
+    parser.add_argument("--interval", default="1d", help="Bar interval of the cached data.")
+    parser.add_argument("--cache", default=BAR_CACHE_PATH, help="Path of the bar cache database.")
+    parser.add_argument("--volume-threshold", type=float, default=VOLUME_THRESHOLD)
+    parser.add_argument("--price-threshold", type=float, default=PRICE_THRESHOLD)
+    parser.add_argument("--window", type=int, default=VOLUME_WINDOW, help="Volume lookback window, in bars.")
+    parser.add_argument("--hold", type=int, default=HOLDING_PERIOD, help="Holding period, in bars.")
+    parser.add_argument("--capital", type=float, default=BACKTEST_INITIAL_CAPITAL, help="Initial capital.")
+    parser.add_argument("--position-size", type=float, default=BACKTEST_POSITION_SIZE, help="Fraction of equity per position.")
+    parser.add_argument("--max-positions", type=int, default=BACKTEST_MAX_POSITIONS, help="Maximum open positions.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument("--equity-output", help="Optional CSV file to write the equity curve to.")
+    args = parser.parse_args()
+
+    backtest = BacktestService(
+        cache_path=args.cache,
+        interval=args.interval,
+        volume_threshold=args.volume_threshold,
+        price_threshold=args.price_threshold,
+        volume_window=args.window,
+        holding_period=args.hold,
+        max_workers=args.workers,
+    )
+    result = backtest.run(
+        read_tickers(args.tickers),
+        initial_capital=args.capital,
+        position_size=args.position_size,
+        max_positions=args.max_positions,
+    )
+
+    for key, value in result.to_dict().items():
+        print(f"{key}: {value}")
+
+    if args.equity_output:
+        import pandas as pd
+
+        pd.DataFrame({
+            "Date": pd.to_datetime(result.utc_dates, unit="s"),
+            "Equity": result.equity,
+            "Drawdown (%)": result.drawdowns,
+        }).to_csv(args.equity_output, index=False)
+
+if __name__ == "__main__":
+    main()
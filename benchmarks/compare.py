@@ -0,0 +1,50 @@
+# benchmarks/compare.py
+"""
+Compares two benchmark JSON files stage by stage.
+
+Usage (from the repository root):
+    python -m benchmarks.compare baseline.json candidate.json --threshold 1.10
+
+Exits with status 1 if any stage's minimum time grew by more than the threshold ratio.
+"""
+
+import argparse
+import json
+import sys
+
+def compare(baseline: dict, candidate: dict, threshold: float) -> bool:
+    """
+    Prints per-stage time and memory ratios and reports whether any stage regressed.
+
+    Returns:
+        bool: True if no stage is slower than `threshold` times its baseline.
+    """
+    ok = True
+    print(f"{'stage':<20}{'baseline s':>12}{'candidate s':>13}{'time x':>9}{'memory x':>10}")
+    for stage, base in baseline["stages"].items():
+        new = candidate["stages"].get(stage)
+        if new is None:
+            continue
+        time_ratio = new["seconds_min"] / base["seconds_min"] if base["seconds_min"] else float("inf")
+        memory_ratio = new["peak_bytes"] / base["peak_bytes"] if base["peak_bytes"] else float("inf")
+        flag = "  REGRESSION" if time_ratio > threshold else ""
+        ok = ok and not flag
+        print(f"{stage:<20}{base['seconds_min']:>12.6f}{new['seconds_min']:>13.6f}{time_ratio:>9.2f}{memory_ratio:>10.2f}{flag}")
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=1.10, help="Allowed slowdown ratio per stage.")
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+
+    sys.exit(0 if compare(baseline, candidate, args.threshold) else 1)
+
+if __name__ == "__main__":
+    main()
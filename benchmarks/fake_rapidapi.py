@@ -0,0 +1,81 @@
+# benchmarks/fake_rapidapi.py
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict
+from urllib.parse import parse_qs, urlparse
+
+class FakeRapidAPIServer:
+    """
+    Local HTTP server that stands in for the RapidAPI history endpoint.
+
+    Responses are produced by `payload_factory(symbol, interval)` and serialized once per
+    (symbol, interval), so repeated requests measure the client, not the server.
+    """
+    def __init__(self, payload_factory: Callable[[str, str], dict], host: str = "127.0.0.1", port: int = 0):
+        """
+        Initializes the FakeRapidAPIServer.
+
+        Parameters:
+            payload_factory (Callable[[str, str], dict]): Builds the response for a symbol and interval.
+            host (str): Interface to bind to.
+            port (int): Port to bind to; 0 picks a free port.
+        """
+        self.payload_factory = payload_factory
+        self.request_count = 0
+        self._responses: Dict[tuple, bytes] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/v1/markets/stock/history"
+
+    def start(self) -> "FakeRapidAPIServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeRapidAPIServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _response_for(self, symbol: str, interval: str) -> bytes:
+        key = (symbol, interval)
+        with self._lock:
+            self.request_count += 1
+            if key not in self._responses:
+                self._responses[key] = json.dumps(self.payload_factory(symbol, interval)).encode()
+            return self._responses[key]
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                symbol = query.get("symbol", [""])[0]
+                interval = query.get("interval", ["1d"])[0]
+                body = server._response_for(symbol, interval)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,161 @@
+# benchmarks/fake_sheets.py
+
+import re
+from collections import Counter
+
+_A1_CELL = re.compile(r"^([A-Z]+)(\d+)$")
+
+class _FakeWorksheet:
+    def __init__(self, title: str, sheet_id: int):
+        self.title = title
+        self.id = sheet_id
+
+class _FakeGrid:
+    """
+    Cells of one worksheet, with the grid size Sheets enforces on writes.
+    """
+    def __init__(self, sheet_id: int, row_count: int, column_count: int):
+        self.id = sheet_id
+        self.row_count = row_count
+        self.column_count = column_count
+        self.cells = {}  # (row, column), zero-based -> value
+
+    def resize(self, row_count: int, column_count: int):
+        self.row_count = row_count
+        self.column_count = column_count
+        self.cells = {(r, c): value for (r, c), value in self.cells.items() if r < row_count and c < column_count}
+
+    def values(self) -> list:
+        """
+        Returns the rows up to the last non-empty cell, like gspread's `get_values`.
+        """
+        if not self.cells:
+            return []
+        rows = max(r for r, _ in self.cells) + 1
+        columns = max(c for _, c in self.cells) + 1
+        return [[self.cells.get((r, c), "") for c in range(columns)] for r in range(rows)]
+
+class FakeSpreadsheet:
+    """
+    In-memory stand-in for a gspread Spreadsheet that records API calls instead of sending them.
+
+    The batch requests used by the exporter (addSheet, updateSheetProperties, updateCells,
+    appendDimension) and batched values updates are applied to in-memory grids, and writes
+    outside a sheet's grid fail as they do in Sheets, so tests can check the final contents.
+    """
+    # Size Sheets gives a new sheet when the request does not set one
+    DEFAULT_ROWS = 1000
+    DEFAULT_COLUMNS = 26
+
+    def __init__(self):
+        self.calls = Counter()
+        self.cells_written = 0
+        self._sheets = {}  # title -> _FakeGrid
+        self._next_id = 1
+
+    def worksheets(self):
+        self.calls["worksheets"] += 1
+        return [_FakeWorksheet(title, grid.id) for title, grid in self._sheets.items()]
+
+    def grid_size(self, title: str) -> tuple:
+        """
+        Returns (rowCount, columnCount) of a worksheet. Not an API call.
+        """
+        grid = self._sheets[title]
+        return grid.row_count, grid.column_count
+
+    def get_values(self, title: str) -> list:
+        """
+        Returns the stored cell values of a worksheet. Not an API call.
+        """
+        return self._sheets[title].values()
+
+    def batch_update(self, body: dict) -> dict:
+        self.calls["batch_update"] += 1
+        replies = []
+        for request in body["requests"]:
+            if "addSheet" in request:
+                properties = request["addSheet"]["properties"]
+                title = properties["title"]
+                if title in self._sheets:
+                    raise ValueError(f"A sheet with the name \"{title}\" already exists")
+                grid_properties = properties.get("gridProperties", {})
+                self._sheets[title] = _FakeGrid(
+                    self._next_id,
+                    grid_properties.get("rowCount", self.DEFAULT_ROWS),
+                    grid_properties.get("columnCount", self.DEFAULT_COLUMNS),
+                )
+                replies.append({"addSheet": {"properties": {"title": title, "sheetId": self._next_id}}})
+                self._next_id += 1
+                continue
+
+            if "updateSheetProperties" in request:
+                properties = request["updateSheetProperties"]["properties"]
+                grid = self._grid_by_id(properties["sheetId"])
+                grid_properties = properties.get("gridProperties", {})
+                grid.resize(
+                    grid_properties.get("rowCount", grid.row_count),
+                    grid_properties.get("columnCount", grid.column_count),
+                )
+            elif "updateCells" in request:
+                # Without `rows`, the listed fields of every cell in the range are cleared
+                update = request["updateCells"]
+                if "rows" in update or set(update["range"]) != {"sheetId"}:
+                    raise NotImplementedError("FakeSpreadsheet only clears whole sheets with updateCells")
+                self._grid_by_id(update["range"]["sheetId"]).cells.clear()
+            elif "appendDimension" in request:
+                append = request["appendDimension"]
+                grid = self._grid_by_id(append["sheetId"])
+                if append["dimension"] == "ROWS":
+                    grid.row_count += append["length"]
+                else:
+                    grid.column_count += append["length"]
+            else:
+                raise NotImplementedError(f"FakeSpreadsheet does not support {sorted(request)}")
+            replies.append({})
+        return {"replies": replies}
+
+    def values_batch_update(self, body: dict) -> dict:
+        self.calls["values_batch_update"] += 1
+        for data in body["data"]:
+            grid, top, left = self._parse_range(data["range"])
+            for r, row in enumerate(data["values"]):
+                for c, value in enumerate(row):
+                    if top + r >= grid.row_count or left + c >= grid.column_count:
+                        raise ValueError(f"Range {data['range']} exceeds grid limits")
+                    grid.cells[(top + r, left + c)] = value
+                self.cells_written += len(row)
+        return {}
+
+    def _grid_by_id(self, sheet_id: int) -> _FakeGrid:
+        for grid in self._sheets.values():
+            if grid.id == sheet_id:
+                return grid
+        raise ValueError(f"No grid with id: {sheet_id}")
+
+    def _parse_range(self, a1_range: str) -> tuple:
+        """
+        Parses a "'Title'!B3" range into the grid and the zero-based top-left cell.
+        """
+        title, _, cell = a1_range.rpartition("!")
+        if title.startswith("'") and title.endswith("'"):
+            title = title[1:-1].replace("''", "'")
+        if title not in self._sheets:
+            raise ValueError(f"Unable to parse range: {a1_range}")
+        match = _A1_CELL.match(cell)
+        if match is None:
+            raise NotImplementedError(f"FakeSpreadsheet only supports single-cell ranges, not {cell}")
+        column = 0
+        for letter in match.group(1):
+            column = column * 26 + ord(letter) - ord("A") + 1
+        return self._sheets[title], int(match.group(2)) - 1, column - 1
+
+class FakeSheetsClient:
+    """
+    In-memory stand-in for an authorized gspread client.
+    """
+    def __init__(self):
+        self.spreadsheet = FakeSpreadsheet()
+
+    def open(self, name: str) -> FakeSpreadsheet:
+        return self.spreadsheet
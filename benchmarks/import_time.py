@@ -0,0 +1,87 @@
+# benchmarks/import_time.py
+"""
+Measures how long the CLI, app and service entry modules take to import in a fresh
+interpreter, and guards that heavy optional dependencies are not loaded at import time.
+
+Exits with status 1 if an entry module imports a dependency it must only load lazily, or
+if `--max-seconds` is given and an import takes longer than that.
+
+Usage (from the repository root):
+    python -m benchmarks.import_time --repeat 5 --max-seconds 1.0
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+# Entry module -> dependencies that must not be imported until a code path needs them
+ENTRY_MODULES = {
+    "services.stock_analysis_service": ("pandas", "plotly", "gspread", "oauth2client", "dotenv"),
+    "services.backtest_service": ("pandas", "plotly", "gspread", "oauth2client", "requests"),
+    "services.sweep_service": ("pandas", "plotly", "gspread", "oauth2client", "requests"),
+    "export_stock_analysis": ("pandas", "plotly", "gspread", "oauth2client", "dotenv"),
+    "scan_breakouts": ("pandas", "plotly", "gspread", "oauth2client"),
+    "sweep_breakouts": ("pandas", "plotly", "gspread", "oauth2client"),
+    "backtest_breakouts": ("pandas", "plotly", "gspread", "oauth2client"),
+    "serve_breakouts": ("pandas", "plotly", "gspread", "oauth2client", "dotenv"),
+    "app": ("gspread", "oauth2client"),  # streamlit itself imports pandas and plotly
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+def measure_import(module: str, repeat: int) -> dict:
+    """
+    Imports `module` in `repeat` fresh interpreters.
+
+    Returns:
+        dict: Minimum import time in seconds and the top-level packages loaded by the import.
+    """
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module)], capture_output=True, text=True, check=True
+        ).stdout
+        probe = json.loads(output.strip().splitlines()[-1])
+        timings.append(probe["seconds"])
+    loaded = sorted({name.split(".")[0] for name in probe["modules"]})
+    return {"seconds_min": round(min(timings), 6), "packages": loaded}
+
+def run(repeat: int, max_seconds: float = None) -> dict:
+    """
+    Measures every entry module and checks it against its forbidden dependencies and the time budget.
+
+    Returns:
+        dict: Per-module measurements and the list of violations.
+    """
+    results = {}
+    violations = []
+    for module, forbidden in ENTRY_MODULES.items():
+        measurement = measure_import(module, repeat)
+        results[module] = {"seconds_min": measurement["seconds_min"]}
+        for dependency in forbidden:
+            if dependency in measurement["packages"]:
+                violations.append(f"{module} imports {dependency} at import time")
+        if max_seconds is not None and measurement["seconds_min"] > max_seconds:
+            violations.append(f"{module} takes {measurement['seconds_min']:.3f}s to import (budget {max_seconds}s)")
+    return {"modules": results, "violations": violations}
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure and guard import time of the entry modules.")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per module.")
+    parser.add_argument("--max-seconds", type=float, help="Fail if any entry module takes longer to import.")
+    args = parser.parse_args()
+
+    results = run(args.repeat, args.max_seconds)
+    print(json.dumps(results, indent=2))
+    if results["violations"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# benchmarks/ingest_benchmark.py
+"""
+Compares the ways a history response can be decoded into a PriceSeries on multi-megabyte
+synthetic payloads: `json` followed by `StockSummary.from_api_response`, whole-document
+decoding with `utils.json_ingest.ingest_history_bytes` (orjson when installed), and
+incremental decoding with `ingest_history_stream` (ijson when installed).
+
+Usage (from the repository root):
+    python -m benchmarks.ingest_benchmark --years 2 --interval 5m --output ingest.json
+"""
+
+import argparse
+import io
+import json
+import platform
+
+from benchmarks.run_benchmarks import measure
+from benchmarks.synthetic_data import generate_payload
+from models.stock_summary import StockSummary
+from utils import json_ingest
+
+def run(years: float, interval: str, repeat: int) -> dict:
+    """
+    Benchmarks each decoding path on one synthetic payload of `years` of `interval` bars.
+
+    Returns:
+        dict: Benchmark metadata and per-path measurements.
+    """
+    content = json.dumps(generate_payload("SYM0000", years, interval, seed=0)).encode()
+
+    paths = {
+        "json_from_api_response": lambda: StockSummary.from_api_response(json.loads(content)),
+        "ingest_bytes": lambda: json_ingest.ingest_history_bytes(content),
+        "ingest_stream": lambda: json_ingest.ingest_history_stream(io.BytesIO(content)),
+    }
+    results = {name: measure(path, repeat) for name, path in paths.items()}
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "years": years,
+            "interval": interval,
+            "bars": len(json_ingest.ingest_history_bytes(content)[1]),
+            "payload_bytes": len(content),
+            "orjson": json_ingest.orjson is not None,
+            "ijson": json_ingest.ijson is not None,
+            "repeat": repeat,
+        },
+        "stages": results,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark decoding of history responses into PriceSeries.")
+    parser.add_argument("--years", type=float, default=2, help="Years of history in the payload.")
+    parser.add_argument("--interval", default="5m", help="Bar interval of the synthetic data.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per decoding path.")
+    parser.add_argument("--output", help="File to write the JSON results to (default: stdout).")
+    args = parser.parse_args()
+
+    results = run(args.years, args.interval, args.repeat)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
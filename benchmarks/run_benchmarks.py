@@ -0,0 +1,162 @@
+# benchmarks/run_benchmarks.py
+"""
+Times each pipeline stage (fetch, parse, sort, detect, to_dict, export) and the full
+pipeline on synthetic data served by a local fake RapidAPI server, and reports the
+results as JSON.
+
+Usage (from the repository root):
+    python -m benchmarks.run_benchmarks --tickers 20 --years 20 --interval 1d --output bench.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from typing import Callable
+
+import numpy as np
+
+from benchmarks.fake_rapidapi import FakeRapidAPIServer
+from benchmarks.fake_sheets import FakeSheetsClient
+from benchmarks.synthetic_data import generate_payload
+from config.constants import VOLUME_THRESHOLD, PRICE_THRESHOLD, FORWARD_HORIZONS
+from export_stock_analysis import GoogleSheetsManager
+from models.stock_summary import StockSummary
+from services.breakout_service import BreakoutService
+from services.stock_analysis_service import get_breakout_points
+from services.rate_limiter import RateLimiter
+from services.yahoo_finance_service import YahooFinanceService
+from utils.data_processing import DataProcessor
+
+def measure(stage: Callable[[], object], repeat: int) -> dict:
+    """
+    Runs a stage `repeat` times for timing, then once more under tracemalloc for peak memory.
+
+    Parameters:
+        stage (Callable[[], object]): The work to measure.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        dict: Minimum and median wall time in seconds, and peak traced memory in bytes.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        stage()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    stage()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "seconds_min": round(min(timings), 6),
+        "seconds_median": round(statistics.median(timings), 6),
+        "peak_bytes": peak,
+    }
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def run(tickers: int, years: float, interval: str, repeat: int) -> dict:
+    """
+    Benchmarks every stage for `tickers` synthetic symbols of `years` of `interval` bars.
+
+    Returns:
+        dict: Benchmark metadata and per-stage measurements.
+    """
+    symbols = [f"SYM{i:04d}" for i in range(tickers)]
+    seeds = {symbol: i for i, symbol in enumerate(symbols)}
+
+    def payload_factory(symbol, bar_interval):
+        return generate_payload(symbol, years, bar_interval, seed=seeds.get(symbol, 0))
+
+    with FakeRapidAPIServer(payload_factory) as server:
+        # The local server has no plan limits; keep the shared API budget out of the timings
+        unlimited = RateLimiter(rate=1e9, burst=1e9, monthly_quota=None)
+        yahoo_service = YahooFinanceService("benchmark-key", base_url=server.url, rate_limiter=unlimited)
+        params = lambda symbol: {"symbol": symbol, "interval": interval, "diffandsplits": "false"}
+
+        # Warm the server's response cache so fetch timings measure the client only
+        payloads = {symbol: yahoo_service._get(params(symbol)).json() for symbol in symbols}
+        summaries = {symbol: StockSummary.from_api_response(payload) for symbol, payload in payloads.items()}
+        series = {symbol: DataProcessor.sort_stock_data_by_date(summary.stock_data) for symbol, summary in summaries.items()}
+        loop_service = BreakoutService(VOLUME_THRESHOLD, PRICE_THRESHOLD, engine="loop")
+        vectorized_service = BreakoutService(VOLUME_THRESHOLD, PRICE_THRESHOLD, engine="vectorized")
+        horizons_service = BreakoutService(VOLUME_THRESHOLD, PRICE_THRESHOLD, engine="vectorized", horizons=FORWARD_HORIZONS)
+        breakouts = {symbol: horizons_service.identify_breakouts(series[symbol], "USD") for symbol in symbols}
+        shuffled = {
+            symbol: s.take(np.random.default_rng(seeds[symbol]).permutation(len(s))) for symbol, s in series.items()
+        }
+        tables = {symbol: [breakout.to_dict() for breakout in breakouts[symbol]] for symbol in symbols}
+
+        def export():
+            manager = GoogleSheetsManager(None, "benchmark", client=FakeSheetsClient(), snapshot_path=None)
+            manager.write_worksheets(tables)
+
+        def end_to_end():
+            manager = GoogleSheetsManager(None, "benchmark", client=FakeSheetsClient(), snapshot_path=None)
+            manager.write_worksheets({
+                symbol: [breakout.to_dict() for breakout in get_breakout_points(symbol, provider=yahoo_service, interval=interval)]
+                for symbol in symbols
+            })
+
+        stages = {
+            "fetch": lambda: [yahoo_service._get(params(symbol)).json() for symbol in symbols],
+            "parse": lambda: [StockSummary.from_api_response(payload) for payload in payloads.values()],
+            "sort": lambda: [DataProcessor.sort_stock_data_by_date(s) for s in shuffled.values()],
+            "detect_loop": lambda: [loop_service.identify_breakouts(series[symbol], "USD") for symbol in symbols],
+            "detect_vectorized": lambda: [vectorized_service.identify_breakouts(series[symbol], "USD") for symbol in symbols],
+            "detect_horizons": lambda: [horizons_service.identify_breakouts(series[symbol], "USD") for symbol in symbols],
+            "to_dict": lambda: [[breakout.to_dict() for breakout in items] for items in breakouts.values()],
+            "to_dataframe": lambda: [DataProcessor.breakouts_to_dataframe(items) for items in breakouts.values()],
+            "export": export,
+            "end_to_end": end_to_end,
+        }
+
+        results = {name: measure(stage, repeat) for name, stage in stages.items()}
+
+    bars = sum(len(s) for s in series.values())
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "tickers": tickers,
+            "years": years,
+            "interval": interval,
+            "bars": bars,
+            "breakouts": sum(len(items) for items in breakouts.values()),
+            "repeat": repeat,
+        },
+        "stages": results,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the fetch/parse/detect/export pipeline on synthetic data.")
+    parser.add_argument("--tickers", type=int, default=10, help="Number of synthetic tickers.")
+    parser.add_argument("--years", type=float, default=20, help="Years of history per ticker.")
+    parser.add_argument("--interval", default="1d", help="Bar interval of the synthetic data.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage.")
+    parser.add_argument("--output", help="File to write the JSON results to (default: stdout).")
+    args = parser.parse_args()
+
+    results = run(args.tickers, args.years, args.interval, args.repeat)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
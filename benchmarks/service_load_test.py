@@ -0,0 +1,228 @@
+# benchmarks/service_load_test.py
+"""
+Load-tests the breakout HTTP service and reports throughput and latency percentiles as JSON.
+
+By default the service runs in this process (on a background event loop thread) against a
+local fake RapidAPI server with synthetic data, so no API key or network is needed. Pass
+`--url` to load-test a service that is already running, e.g. `serve_breakouts.py --stub`.
+
+Usage (from the repository root):
+    python -m benchmarks.service_load_test --tickers 50 --connections 16 --requests 2000
+    python -m benchmarks.service_load_test --cache-ttl 0 --batch-ratio 0.1 --batch-size 20
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import threading
+import time
+from typing import List, Optional
+from urllib.parse import urlsplit
+
+from benchmarks.fake_rapidapi import FakeRapidAPIServer
+from benchmarks.synthetic_data import generate_payload
+from services.breakout_api import BreakoutAPIServer
+from services.rate_limiter import RateLimiter
+from services.yahoo_finance_service import YahooFinanceService
+from config.constants import SERVICE_MAX_WORKERS
+
+class _InProcessService:
+    """
+    Runs a BreakoutAPIServer backed by a fake RapidAPI server on a background event loop.
+    """
+    def __init__(self, tickers: List[str], years: float, workers: int, cache_ttl: float):
+        seeds = {symbol: i for i, symbol in enumerate(tickers)}
+        self.stub = FakeRapidAPIServer(
+            lambda symbol, interval: generate_payload(symbol, years, interval, seed=seeds.get(symbol, 0))
+        )
+        self.workers = workers
+        self.cache_ttl = cache_ttl
+        self.server = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    def __enter__(self) -> "_InProcessService":
+        self.stub.start()
+        unlimited = RateLimiter(rate=1e9, burst=1e9, monthly_quota=None)
+        yahoo_service = YahooFinanceService("benchmark-key", base_url=self.stub.url, rate_limiter=unlimited)
+        self.server = BreakoutAPIServer(
+            yahoo_service, port=0, max_workers=self.workers, cache_ttl_seconds=self.cache_ttl
+        )
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self._loop).result()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        asyncio.run_coroutine_threadsafe(self.server.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self.stub.stop()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.server.host}:{self.server.port}"
+
+async def _send(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str, body: bytes, host: str) -> int:
+    """
+    Sends one request on a kept-alive connection and reads the whole response.
+
+    Returns:
+        int: The response status.
+    """
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ")[1])
+    length = 0
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+async def _client(
+    url: str,
+    tickers: List[str],
+    interval: str,
+    requests: int,
+    counter: list,
+    batch_ratio: float,
+    batch_size: int,
+    rng: random.Random,
+    samples: dict
+) -> None:
+    """
+    Sends requests on one connection until `counter` (shared by all clients) runs out.
+    """
+    parts = urlsplit(url)
+    reader, writer = await asyncio.open_connection(parts.hostname, parts.port)
+    try:
+        while counter[0] < requests:
+            counter[0] += 1
+            if rng.random() < batch_ratio:
+                kind = "batch"
+                body = json.dumps({"tickers": rng.sample(tickers, min(batch_size, len(tickers))), "interval": interval}).encode()
+                request = ("POST", "/breakouts/batch", body)
+            else:
+                kind = "single"
+                request = ("GET", f"/breakouts/{rng.choice(tickers)}?interval={interval}", b"")
+
+            start = time.perf_counter()
+            status = await _send(reader, writer, *request, host=parts.netloc)
+            samples[kind].append(time.perf_counter() - start)
+            if status != 200:
+                samples["errors"] += 1
+    finally:
+        writer.close()
+
+def _summarize(latencies: List[float], seconds: float) -> dict:
+    if not latencies:
+        return {"requests": 0}
+    ordered = sorted(latencies)
+    percentile = lambda p: ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+    return {
+        "requests": len(ordered),
+        "requests_per_second": round(len(ordered) / seconds, 1),
+        "latency_ms": {
+            "mean": round(statistics.fmean(ordered) * 1000, 3),
+            "p50": round(percentile(50) * 1000, 3),
+            "p90": round(percentile(90) * 1000, 3),
+            "p99": round(percentile(99) * 1000, 3),
+            "max": round(ordered[-1] * 1000, 3),
+        },
+    }
+
+async def _load(url: str, tickers: List[str], interval: str, requests: int, connections: int, batch_ratio: float, batch_size: int, seed: int) -> dict:
+    samples = {"single": [], "batch": [], "errors": 0}
+    counter = [0]
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(url, tickers, interval, requests, counter, batch_ratio, batch_size, random.Random(seed + i), samples)
+        for i in range(connections)
+    ))
+    seconds = time.perf_counter() - start
+    return {
+        "seconds": round(seconds, 3),
+        "errors": samples["errors"],
+        "overall": _summarize(samples["single"] + samples["batch"], seconds),
+        "single": _summarize(samples["single"], seconds),
+        "batch": _summarize(samples["batch"], seconds),
+    }
+
+def run(
+    tickers: int,
+    years: float,
+    interval: str,
+    requests: int,
+    connections: int,
+    batch_ratio: float,
+    batch_size: int,
+    workers: int,
+    cache_ttl: float,
+    url: Optional[str] = None,
+    seed: int = 0
+) -> dict:
+    """
+    Sends `requests` requests over `connections` concurrent kept-alive connections.
+
+    Returns:
+        dict: Settings, throughput and latency percentiles overall and per endpoint, and the
+        number of requests that reached the fake RapidAPI server.
+    """
+    symbols = [f"SYM{i:04d}" for i in range(tickers)]
+    meta = {
+        "tickers": tickers,
+        "years": years,
+        "interval": interval,
+        "requests": requests,
+        "connections": connections,
+        "batch_ratio": batch_ratio,
+        "batch_size": batch_size,
+    }
+    if url:
+        return {"meta": dict(meta, url=url), **asyncio.run(_load(url, symbols, interval, requests, connections, batch_ratio, batch_size, seed))}
+
+    with _InProcessService(symbols, years, workers, cache_ttl) as service:
+        results = asyncio.run(_load(service.url, symbols, interval, requests, connections, batch_ratio, batch_size, seed))
+        upstream_requests = service.stub.request_count
+    return {
+        "meta": dict(meta, workers=workers, cache_ttl=cache_ttl),
+        **results,
+        "upstream_requests": upstream_requests,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the breakout HTTP service.")
+    parser.add_argument("--url", help="Base URL of a running service (default: start one in-process with a fake API).")
+    parser.add_argument("--tickers", type=int, default=50, help="Number of synthetic tickers queried.")
+    parser.add_argument("--years", type=float, default=10, help="Years of synthetic history per ticker.")
+    parser.add_argument("--interval", default="1d", help="Bar interval queried.")
+    parser.add_argument("--requests", type=int, default=2000, help="Total requests sent.")
+    parser.add_argument("--connections", type=int, default=16, help="Concurrent kept-alive connections.")
+    parser.add_argument("--batch-ratio", type=float, default=0.0, help="Fraction of requests sent to the batch endpoint.")
+    parser.add_argument("--batch-size", type=int, default=20, help="Tickers per batch request.")
+    parser.add_argument("--workers", type=int, default=SERVICE_MAX_WORKERS, help="Worker threads of the in-process service.")
+    parser.add_argument("--cache-ttl", type=float, default=60, help="Result cache TTL of the in-process service (0 disables it).")
+    parser.add_argument("--output", help="File to write the JSON results to (default: stdout).")
+    args = parser.parse_args()
+
+    results = run(
+        args.tickers, args.years, args.interval, args.requests, args.connections,
+        args.batch_ratio, args.batch_size, args.workers, args.cache_ttl, url=args.url,
+    )
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# benchmarks/synthetic_data.py
+
+import numpy as np
+
+BARS_PER_YEAR = {
+    "1m": 252 * 390,
+    "5m": 252 * 78,
+    "15m": 252 * 26,
+    "30m": 252 * 13,
+    "1h": 252 * 7,
+    "1d": 252,
+    "1wk": 52,
+    "1mo": 12,
+}
+
+INTERVAL_SECONDS = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "1d": 86400,
+    "1wk": 7 * 86400,
+    "1mo": 30 * 86400,
+}
+
+def generate_payload(symbol: str, years: float, interval: str = "1d", seed: int = 0) -> dict:
+    """
+    Generates a RapidAPI-shaped history response with a random-walk price series.
+
+    Roughly 2% of bars get a volume spike, so breakout detection has work to do.
+
+    Parameters:
+        symbol (str): The ticker symbol placed in the metadata.
+        years (float): Length of the history in years.
+        interval (str): Bar interval, one of BARS_PER_YEAR.
+        seed (int): Random seed, for reproducible payloads.
+
+    Returns:
+        dict: A payload with "meta" and "body" keys, like the API response.
+    """
+    rng = np.random.default_rng(seed)
+    n = max(1, int(years * BARS_PER_YEAR[interval]))
+    closes = 100 * np.cumprod(1 + rng.normal(0.0002, 0.02, n))
+    opens = closes * (1 + rng.normal(0, 0.005, n))
+    highs = np.maximum(opens, closes) * (1 + rng.random(n) * 0.01)
+    lows = np.minimum(opens, closes) * (1 - rng.random(n) * 0.01)
+    volumes = rng.integers(100_000, 1_000_000, n) * np.where(rng.random(n) < 0.02, 5, 1)
+    utc_dates = 946_684_800 + np.arange(n) * INTERVAL_SECONDS[interval]
+
+    body = {}
+    for i, utc_date in enumerate(utc_dates.tolist()):
+        body[str(utc_date)] = {
+            "date": np.datetime_as_string(np.datetime64(utc_date, "s"), unit="D" if interval in ("1d", "1wk", "1mo") else "m"),
+            "date_utc": utc_date,
+            "open": round(float(opens[i]), 4),
+            "high": round(float(highs[i]), 4),
+            "low": round(float(lows[i]), 4),
+            "close": round(float(closes[i]), 4),
+            "volume": int(volumes[i]),
+        }
+
+    return {
+        "meta": {"currency": "USD", "symbol": symbol, "dataGranularity": interval},
+        "body": body,
+    }
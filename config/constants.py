@@ -5,4 +5,80 @@ YAHOO_FINANCE_HOST = "yahoo-finance15.p.rapidapi.com"
 VOLUME_THRESHOLD = 3  
 PRICE_THRESHOLD = 0.02  
 GOOGLE_SCOPES = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
-GOOGLE_SHEET_NAME = "Breakout Strategy Results"
\ No newline at end of file
+GOOGLE_SHEET_NAME = "Breakout Strategy Results"
+MAX_CONCURRENT_TICKERS = 8
+
+REQUEST_TIMEOUT = (5, 30)  # (connect, read) seconds
+MAX_RETRIES = 4
+BACKOFF_FACTOR = 0.5
+MAX_BACKOFF = 30
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+HTTP_POOL_SIZE = 16
+STREAM_INGEST_MIN_BYTES = 8 * 1024 * 1024  # Larger responses are decoded incrementally when ijson is installed
+
+# RapidAPI plan limits, enforced by a token bucket shared by every YahooFinanceService
+API_RATE_LIMIT_PER_SECOND = 5
+API_RATE_BURST = 5  # Requests that may be sent back to back after an idle period
+API_MONTHLY_QUOTA = None  # Requests per calendar month (UTC), or None for no quota
+RATE_LIMIT_BACKEND = "sqlite"  # "sqlite" shares the budget across processes, "memory" keeps it per process
+RATE_LIMIT_PATH = ".cache/rate_limit.sqlite3"
+
+# Where bars come from: "yahoo" fetches them from RapidAPI, "files" reads the local OHLCV files
+# (CSV, Parquet or Arrow; paths or glob patterns) in MARKET_DATA_FILES, so nothing calls the API.
+# Either way they are served through the bar cache.
+MARKET_DATA_PROVIDER = "yahoo"
+MARKET_DATA_FILES = ()
+MARKET_DATA_FILES_INTERVAL = "1d"  # Bar interval of the data in MARKET_DATA_FILES
+
+BAR_CACHE_PATH = ".cache/bars.sqlite3"
+BAR_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+BREAKOUT_ENGINE = "vectorized"  # "loop" or "vectorized"
+
+VOLUME_WINDOW = 20  # Bars averaged for the breakout volume condition
+HOLDING_PERIOD = 20  # Bars held after a breakout when measuring its return
+BREAKOUT_CHUNK_SIZE = 100_000  # Bars processed at a time, bounding memory on long intraday histories
+
+# Trading minutes covered by one bar of each supported interval; windows and horizons given as
+# durations ("90m", "4h", "20d", "2wk", "3mo") are converted to bars with these, counting a day
+# as one regular session
+TRADING_MINUTES_PER_DAY = 390
+INTERVAL_MINUTES = {
+    "1m": 1,
+    "5m": 5,
+    "15m": 15,
+    "30m": 30,
+    "1h": 60,
+    "1d": TRADING_MINUTES_PER_DAY,
+    "1wk": 5 * TRADING_MINUTES_PER_DAY,
+    "1mo": 21 * TRADING_MINUTES_PER_DAY,
+}
+
+SHEETS_BATCH_SIZE = 25  # Tickers written per spreadsheet-level batch request
+SHEETS_SNAPSHOT_PATH = ".cache/sheets_snapshot.json"  # Row hashes last exported per ticker
+
+EXPORT_DATASET_PATH = "exports/breakouts"  # Parquet/Arrow dataset partitioned by run date and ticker
+EXPORT_CSV_PATH = "exports/breakouts.csv"
+
+APP_CACHE_TTL_SECONDS = 15 * 60  # Streamlit result cache expiry
+APP_CACHE_MAX_ENTRIES = 500
+APP_WARMUP_TICKERS_FILE = "tickers.txt"  # Tickers precomputed when the app starts
+APP_CHART_MAX_POINTS = 2000  # Points per price chart trace after downsampling the visible range
+APP_CHART_CACHE_MAX_BARS = 2_000_000  # Total bars kept in memory for price charts (roughly 120 bytes each)
+APP_TABLE_PAGE_SIZE = 100  # Breakout table rows sent to the browser at a time
+
+SCANNER_MAX_WORKERS = 16  # Tickers scanned at the same time
+
+SERVICE_HOST = "127.0.0.1"  # Breakout HTTP service (serve_breakouts.py)
+SERVICE_PORT = 8080
+SERVICE_MAX_WORKERS = 8  # Worker threads fetching and analyzing tickers off the event loop
+SERVICE_CACHE_TTL_SECONDS = 15 * 60
+SERVICE_CACHE_MAX_ENTRIES = 1000
+SERVICE_MAX_BATCH_TICKERS = 500  # Tickers accepted in one batch request
+
+FORWARD_HORIZONS = (1, 5, 10, 20, 60)  # Bars after a breakout for multi-horizon return, MFE and MAE
+
+BACKTEST_INITIAL_CAPITAL = 100_000.0
+BACKTEST_POSITION_SIZE = 0.1  # Fraction of current equity allocated to each new position
+BACKTEST_MAX_POSITIONS = 10
+TRADING_DAYS_PER_YEAR = 252  # Sessions per year, used to annualize Sharpe ratios at any interval
@@ -1,6 +1,33 @@
-from dotenv import load_dotenv
 import os
+import threading
 
-load_dotenv()  # Load variables from .env file
+_environment_loaded = False
+_environment_lock = threading.Lock()
 
-api_key = os.getenv("YAHOO_FINANCE_API_KEY")
\ No newline at end of file
+def _load_environment():
+    """
+    Loads variables from the .env file on first use, so importing this module stays cheap.
+    """
+    global _environment_loaded
+    with _environment_lock:
+        if not _environment_loaded:
+            from dotenv import load_dotenv
+
+            load_dotenv()  # Load variables from .env file
+            _environment_loaded = True
+
+def get_api_key():
+    _load_environment()
+    return os.getenv("YAHOO_FINANCE_API_KEY")
+
+def get_metrics_sink():
+    _load_environment()
+    return os.getenv("METRICS_SINK")  # "log", "memory" or "prometheus:<path>"; unset disables metrics
+
+_LAZY_SETTINGS = {"api_key": get_api_key, "metrics_sink": get_metrics_sink}
+
+def __getattr__(name):
+    # Keeps `from config.settings import api_key` working, reading the value only when it is imported
+    if name in _LAZY_SETTINGS:
+        return _LAZY_SETTINGS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
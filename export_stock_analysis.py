@@ -1,28 +1,61 @@
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import hashlib
+import json
+import os
 from services.stock_analysis_service import get_breakout_points
+from services.rate_limiter import get_shared_rate_limiter
+from services.export_sinks import ExportSink, MultiSink, CsvSink, ArrowDatasetSink
+from models.breakout import MISSING_VALUE
 from utils.data_processing import DataProcessor
-from config.constants import GOOGLE_SCOPES, GOOGLE_SHEET_NAME
+from models.processing_report import (
+    ProcessingReport, TickerResult, OUTCOME_WRITTEN, OUTCOME_EMPTY, OUTCOME_UNCHANGED,
+)
+from utils import metrics
+from config.settings import get_metrics_sink
+from config.constants import (
+    GOOGLE_SCOPES, GOOGLE_SHEET_NAME, MAX_CONCURRENT_TICKERS, SHEETS_BATCH_SIZE,
+    SHEETS_SNAPSHOT_PATH, EXPORT_DATASET_PATH, EXPORT_CSV_PATH,
+)
 
-class GoogleSheetsManager:
-    def __init__(self, credentials_file: str, spreadsheet_name: str):
+class GoogleSheetsManager(ExportSink):
+    """
+    Export sink writing one worksheet per ticker to a Google Spreadsheet.
+    """
+    def __init__(self, credentials_file: str, spreadsheet_name: str, client=None, snapshot_path: str = SHEETS_SNAPSHOT_PATH):
         """
         Initializes the Google Sheets Manager.
 
         Parameters:
             credentials_file (str): Path to the Google credentials JSON file.
             spreadsheet_name (str): Name of the Google Spreadsheet.
+            client: Optional pre-authorized gspread client; if given, the credentials file is not read.
+            snapshot_path (str): File holding a hash of each row last exported per ticker, used to
+                send only changed rows. It is written by `flush` (and `close`). Pass None to always
+                rewrite whole worksheets.
         """
         self.spreadsheet_name = spreadsheet_name
         self.scope = GOOGLE_SCOPES
-        self.credentials = ServiceAccountCredentials.from_json_keyfile_name(credentials_file, self.scope)
-        self.client = gspread.authorize(self.credentials)
+        if client is None:
+            # Imported here so that runs that never authorize (tests, other sinks) skip their import cost
+            import gspread
+            from oauth2client.service_account import ServiceAccountCredentials
+
+            self.credentials = ServiceAccountCredentials.from_json_keyfile_name(credentials_file, self.scope)
+            client = gspread.authorize(self.credentials)
+        self.client = client
         self.spreadsheet = self._get_or_create_spreadsheet()
+        self._sheet_ids = None
+        self.snapshot_path = snapshot_path
+        self._snapshots = self._load_snapshots()
+        self._snapshots_changed = False
 
     def _get_or_create_spreadsheet(self):
         """
         Retrieves the spreadsheet by name or creates a new one if it doesn't exist.
         """
+        import gspread
+
         try:
             return self.client.open(self.spreadsheet_name)
         except gspread.SpreadsheetNotFound:
@@ -36,26 +69,195 @@ class GoogleSheetsManager:
             ticker (str): The stock ticker name.
             breakout_data (list): A list of breakout dictionaries to write to the sheet.
         """
-        try:
-            # Delete the worksheet if it already exists
-            worksheet = self.spreadsheet.worksheet(ticker)
-            self.spreadsheet.del_worksheet(worksheet)
-        except gspread.WorksheetNotFound:
-            pass
-
-        # Create a new worksheet
-        worksheet = self.spreadsheet.add_worksheet(title=ticker, rows="100", cols="10")
-
-        # Write data
-        if breakout_data:
-            headers = breakout_data[0].keys()
-            worksheet.append_row(list(headers))
-            for row in breakout_data:
-                worksheet.append_row(list(row.values()))
-            print(f"Breakout data written for {ticker}.")
-        else:
-            worksheet.append_row(["No breakout points found."])
-            print(f"No breakout points for {ticker}.")
+        with metrics.span("create_or_update_worksheet"):
+            self.write_worksheets({ticker: breakout_data})
+
+    def write_worksheets(self, tables: dict) -> dict:
+        """
+        Creates or updates one worksheet per ticker using spreadsheet-level batch requests.
+
+        Each table is compared with the snapshot of the row hashes last exported: unchanged
+        tickers are skipped, tickers whose existing rows are unchanged or edited in place
+        only receive the changed and appended rows, and anything else (new tickers,
+        changed headers, fewer rows) gets its worksheet resized, cleared and rewritten.
+        All tickers share at most one batch update and one batched values update.
+
+        Parameters:
+            tables (dict): Mapping of ticker to a list of breakout dictionaries.
+
+        Returns:
+            dict: OUTCOME_UNCHANGED for each ticker that was skipped; the others were written.
+        """
+        if not tables:
+            return {}
+
+        with metrics.span("write_worksheets"):
+            return self._write_worksheets(tables)
+
+    def write_batch(self, tables: dict) -> dict:
+        return self.write_worksheets(tables)
+
+    def flush(self):
+        """
+        Stores the snapshots of the tables written since the last flush.
+        """
+        if self._snapshots_changed:
+            self._save_snapshots()
+            self._snapshots_changed = False
+
+    def close(self):
+        self.flush()
+
+    def _write_worksheets(self, tables: dict) -> dict:
+        """
+        Builds and sends the batched requests for `write_worksheets`.
+        """
+        sheet_ids = self._get_sheet_ids()
+        requests = []
+        data = []
+        written = {}
+        unchanged = {}
+
+        for ticker, breakout_data in tables.items():
+            values = self._to_values(breakout_data)
+            row_hashes = [self._row_hash(row) for row in values]
+            digest = self._digest(row_hashes)
+            columns = max(len(row) for row in values)
+            snapshot = self._snapshots.get(ticker) if ticker in sheet_ids else None
+
+            if snapshot is not None and snapshot["hash"] == digest:
+                unchanged[ticker] = OUTCOME_UNCHANGED
+                continue
+
+            if snapshot is not None and self._can_patch(snapshot, row_hashes, columns):
+                previous = snapshot["rows"]
+                if len(values) > len(previous):
+                    requests.append({"appendDimension": {
+                        "sheetId": sheet_ids[ticker], "dimension": "ROWS", "length": len(values) - len(previous),
+                    }})
+                for start, rows in self._changed_row_runs(previous, row_hashes, values):
+                    data.append({"range": f"{self._quote_title(ticker)}!A{start + 1}", "values": rows})
+            else:
+                grid_properties = {"rowCount": len(values), "columnCount": columns}
+                if ticker in sheet_ids:
+                    requests.append({"updateSheetProperties": {
+                        "properties": {"sheetId": sheet_ids[ticker], "gridProperties": grid_properties},
+                        "fields": "gridProperties(rowCount,columnCount)",
+                    }})
+                    requests.append({"updateCells": {"range": {"sheetId": sheet_ids[ticker]}, "fields": "userEnteredValue"}})
+                else:
+                    requests.append({"addSheet": {"properties": {"title": ticker, "gridProperties": grid_properties}}})
+                data.append({"range": f"{self._quote_title(ticker)}!A1", "values": values})
+
+            written[ticker] = {"hash": digest, "rows": row_hashes, "columns": columns}
+
+        if requests:
+            metrics.incr("sheets_calls")
+            response = self.spreadsheet.batch_update({"requests": requests})
+            for reply in response.get("replies", []):
+                if "addSheet" in reply:
+                    properties = reply["addSheet"]["properties"]
+                    sheet_ids[properties["title"]] = properties["sheetId"]
+
+        if data:
+            metrics.incr("sheets_calls")
+            self.spreadsheet.values_batch_update({"valueInputOption": "RAW", "data": data})
+
+        if written:
+            self._snapshots.update(written)
+            self._snapshots_changed = True
+
+        return unchanged
+
+    @staticmethod
+    def _can_patch(snapshot: dict, row_hashes: list, columns: int) -> bool:
+        """
+        Checks whether a worksheet holding the snapshot's table can be brought to the new one
+        (given by its row hashes and width) by rewriting rows in place and appending new ones.
+        """
+        previous = snapshot["rows"]
+        return len(row_hashes) >= len(previous) and previous[0] == row_hashes[0] and columns <= snapshot["columns"]
+
+    @staticmethod
+    def _changed_row_runs(previous: list, row_hashes: list, values: list) -> list:
+        """
+        Groups rows whose hash differs from the previous table (or that extend it) into contiguous runs.
+
+        Returns:
+            list: (start_row_index, rows) tuples, zero-based.
+        """
+        runs = []
+        for i, row in enumerate(values):
+            if i < len(previous) and previous[i] == row_hashes[i]:
+                continue
+            if runs and runs[-1][0] + len(runs[-1][1]) == i:
+                runs[-1][1].append(row)
+            else:
+                runs.append((i, [row]))
+        return runs
+
+    @staticmethod
+    def _row_hash(row: list) -> str:
+        return hashlib.blake2b(json.dumps(row, default=str).encode(), digest_size=8).hexdigest()
+
+    @staticmethod
+    def _digest(row_hashes: list) -> str:
+        return hashlib.sha256("".join(row_hashes).encode()).hexdigest()
+
+    def _load_snapshots(self) -> dict:
+        """
+        Loads the row hashes last exported to this spreadsheet from the snapshot file.
+        """
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return {}
+        with open(self.snapshot_path, "r") as f:
+            return json.load(f).get(self.spreadsheet_name, {})
+
+    def _save_snapshots(self):
+        """
+        Stores the row hashes last exported to this spreadsheet in the snapshot file.
+        """
+        if not self.snapshot_path:
+            return
+        snapshots = {}
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "r") as f:
+                snapshots = json.load(f)
+        snapshots[self.spreadsheet_name] = self._snapshots
+
+        directory = os.path.dirname(self.snapshot_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary_path = f"{self.snapshot_path}.tmp"
+        with open(temporary_path, "w") as f:
+            json.dump(snapshots, f)
+        os.replace(temporary_path, self.snapshot_path)
+
+    def _get_sheet_ids(self) -> dict:
+        """
+        Returns a mapping of worksheet title to sheet id, fetched once and kept up to date.
+        """
+        if self._sheet_ids is None:
+            metrics.incr("sheets_calls")
+            self._sheet_ids = {worksheet.title: worksheet.id for worksheet in self.spreadsheet.worksheets()}
+        return self._sheet_ids
+
+    @staticmethod
+    def _to_values(breakout_data: list) -> list:
+        """
+        Converts breakout dictionaries to a header row followed by one row per breakout, showing
+        missing values as MISSING_VALUE.
+        """
+        if not breakout_data:
+            return [["No breakout points found."]]
+        headers = list(breakout_data[0].keys())
+        return [headers] + [
+            [MISSING_VALUE if value is None else value for value in row.values()] for row in breakout_data
+        ]
+
+    @staticmethod
+    def _quote_title(title: str) -> str:
+        return "'" + title.replace("'", "''") + "'"
 
 def read_tickers(file_path: str) -> list:
     """
@@ -73,39 +275,157 @@ def read_tickers(file_path: str) -> list:
     except FileNotFoundError:
         raise FileNotFoundError(f"Error: {file_path} not found in the root directory.")
 
-def process_tickers(tickers: list, sheets_manager: GoogleSheetsManager):
+def _fetch_breakout_rows(ticker: str, interval: str = "1d") -> list:
     """
-    Processes a list of tickers, retrieves breakout points, and writes to Google Sheets.
+    Retrieves breakout points for a ticker and converts them to dictionaries.
+
+    Parameters:
+        ticker (str): The stock ticker symbol.
+        interval (str): The bar interval to analyze (e.g., "1d").
+
+    Returns:
+        list: A list of breakout dictionaries.
+    """
+    breakouts = get_breakout_points(ticker, interval=interval)
+    return [breakout.to_dict() for breakout in breakouts]
+
+def process_tickers(
+    tickers: list,
+    sink: ExportSink,
+    max_workers: int = MAX_CONCURRENT_TICKERS,
+    batch_size: int = SHEETS_BATCH_SIZE,
+    interval: str = "1d"
+) -> ProcessingReport:
+    """
+    Processes a list of tickers concurrently, retrieves breakout points, and writes them to a sink.
+
+    Fetching and breakout detection run in a bounded thread pool, while sink writes
+    happen on the calling thread as tickers complete, so exports overlap with the
+    remaining fetches. Completed tickers are written together in batches, and the sink
+    is flushed once at the end, including when the run fails partway.
 
     Parameters:
         tickers (list): List of stock tickers.
-        sheets_manager (GoogleSheetsManager): Instance of GoogleSheetsManager to handle Sheets operations.
+        sink (ExportSink): Destination of the breakout tables (Google Sheets, CSV, Parquet/Arrow, or several).
+        max_workers (int): Maximum number of tickers fetched and analyzed at the same time.
+        batch_size (int): Number of completed tickers written to the sink per batch.
+        interval (str): The bar interval to analyze (e.g., "1d").
+
+    Returns:
+        ProcessingReport: Per-ticker results and errors.
     """
-    for ticker in tickers:
-        try:
-            # Get breakout points
-            breakouts = get_breakout_points(ticker)
-            breakout_data = [breakout.to_dict() for breakout in breakouts]
-            sheets_manager.create_or_update_worksheet(ticker, breakout_data)
-        except Exception as e:
-            print(f"Error processing ticker {ticker}: {e}")
+    report = ProcessingReport()
+    pending = {}
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {executor.submit(_fetch_breakout_rows, ticker, interval): ticker for ticker in tickers}
+
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    pending[ticker] = future.result()
+                except Exception as e:
+                    report.add(TickerResult(ticker, error=str(e)))
+                    continue
+
+                if len(pending) >= batch_size:
+                    _write_batch(sink, pending, report)
+                    pending = {}
+
+        _write_batch(sink, pending, report)
+    finally:
+        sink.flush()
+    return report
+
+def _write_batch(sink: ExportSink, tables: dict, report: ProcessingReport):
+    """
+    Writes a batch of ticker tables to the sink and records the outcome of each ticker.
+    """
+    if not tables:
+        return
+    try:
+        outcomes = sink.write_batch(tables) or {}
+    except Exception as e:
+        for ticker in tables:
+            report.add(TickerResult(ticker, error=str(e)))
+        return
+    for ticker, breakout_data in tables.items():
+        outcome = outcomes.get(ticker) or (OUTCOME_WRITTEN if breakout_data else OUTCOME_EMPTY)
+        report.add(TickerResult(ticker, breakout_count=len(breakout_data), outcome=outcome))
+
+def create_sink(names: list, credentials_file: str, dataset_path: str, csv_path: str) -> ExportSink:
+    """
+    Builds the export sink for the given sink names, combining them if there are several.
+
+    Parameters:
+        names (list): Sink names: "sheets", "parquet", "arrow" or "csv".
+        credentials_file (str): Google credentials file, used by the Sheets sink.
+        dataset_path (str): Root directory of the Parquet/Arrow dataset.
+        csv_path (str): Path of the CSV file.
+
+    Returns:
+        ExportSink: The sink to pass to `process_tickers`.
+    """
+    sinks = []
+    for name in dict.fromkeys(names):
+        if name == "sheets":
+            sinks.append(GoogleSheetsManager(credentials_file, GOOGLE_SHEET_NAME))
+        elif name in ArrowDatasetSink.FORMATS:
+            sinks.append(ArrowDatasetSink(dataset_path, file_format=name))
+        elif name == "csv":
+            sinks.append(CsvSink(csv_path))
+        else:
+            raise ValueError(f"Unknown export sink '{name}'")
+    return sinks[0] if len(sinks) == 1 else MultiSink(sinks)
 
 def main():
-    credentials_file = "credentials.json"
-    tickers_file = "tickers.txt"
+    parser = argparse.ArgumentParser(description="Find breakout points for a list of tickers and export them.")
+    parser.add_argument(
+        "--sink", action="append", choices=("sheets", "parquet", "arrow", "csv"),
+        help="Where to export the breakouts; repeat to write to several sinks (default: sheets).",
+    )
+    parser.add_argument("--tickers", default="tickers.txt", help="File with one ticker per line.")
+    parser.add_argument("--interval", default="1d", help="Bar interval to analyze.")
+    parser.add_argument("--credentials", default="credentials.json", help="Google credentials file for the Sheets sink.")
+    parser.add_argument("--dataset-path", default=EXPORT_DATASET_PATH, help="Root directory of the Parquet/Arrow dataset.")
+    parser.add_argument("--csv-path", default=EXPORT_CSV_PATH, help="Path of the CSV file.")
+    args = parser.parse_args()
+
+    metrics_sink = get_metrics_sink()
+    if metrics_sink:
+        metrics.configure(metrics.create_sink(metrics_sink))
 
     try:
-        # Initialize Google Sheets Manager
-        sheets_manager = GoogleSheetsManager(credentials_file, GOOGLE_SHEET_NAME)
+        # Initialize the export sinks
+        sink = create_sink(args.sink or ["sheets"], args.credentials, args.dataset_path, args.csv_path)
 
         # Read tickers from file
-        tickers = read_tickers(tickers_file)
+        tickers = read_tickers(args.tickers)
+
+        # Process tickers and write the breakouts to the sinks
+        with sink:
+            report = process_tickers(tickers, sink, interval=args.interval)
+
+        for result in report.results:
+            if not result.succeeded:
+                print(f"Error processing ticker {result.ticker}: {result.error}")
+            elif result.outcome == OUTCOME_UNCHANGED:
+                print(f"Breakout data unchanged for {result.ticker}.")
+            elif result.outcome == OUTCOME_EMPTY:
+                print(f"No breakout points for {result.ticker}.")
+            else:
+                print(f"Breakout data written for {result.ticker}.")
+        print(f"Processed {len(report.results)} tickers: {len(report.succeeded)} succeeded, {len(report.failed)} failed.")
 
-        # Process tickers and write data to Google Sheets
-        process_tickers(tickers, sheets_manager)
+        remaining_quota = get_shared_rate_limiter().remaining_quota()
+        if remaining_quota is not None:
+            print(f"Remaining API requests this month: {remaining_quota}")
 
     except Exception as e:
         print(f"An error occurred: {e}")
+    finally:
+        metrics.flush()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,85 @@
+import math
+from typing import List
+import numpy as np
+
+class BacktestResult:
+    """
+    Represents the outcome of a portfolio backtest: equity curve, trades and summary statistics.
+    """
+    def __init__(
+        self,
+        utc_dates: np.ndarray,
+        equity: np.ndarray,
+        trade_returns: List[float],
+        signals: int,
+        initial_capital: float,
+        periods_per_year: float
+    ):
+        """
+        Initializes a BacktestResult instance.
+
+        Parameters:
+            utc_dates (np.ndarray): Calendar of the equity curve (UTC timestamps).
+            equity (np.ndarray): Portfolio value at the close of each calendar date.
+            trade_returns (List[float]): Return in percent of every trade taken.
+            signals (int): Number of breakout signals, including those skipped for lack of capacity.
+            initial_capital (float): Starting portfolio value.
+            periods_per_year (float): Bars per trading year at the backtested interval, used to annualize the Sharpe ratio.
+        """
+        self.utc_dates = utc_dates
+        self.equity = equity
+        self.trade_returns = trade_returns
+        self.signals = signals
+        self.initial_capital = initial_capital
+        self.periods_per_year = periods_per_year
+
+    @property
+    def drawdowns(self) -> np.ndarray:
+        """
+        Percentage drop of the equity curve from its running peak at each date.
+        """
+        if not len(self.equity):
+            return np.empty(0)
+        peaks = np.maximum.accumulate(self.equity)
+        return (self.equity - peaks) / peaks * 100
+
+    @property
+    def max_drawdown(self) -> float:
+        return float(self.drawdowns.min()) if len(self.equity) else 0.0
+
+    @property
+    def sharpe_ratio(self) -> float:
+        """
+        Annualized Sharpe ratio of per-period equity returns, assuming a zero risk-free rate.
+        """
+        if len(self.equity) < 2:
+            return 0.0
+        returns = np.diff(self.equity) / self.equity[:-1]
+        deviation = returns.std(ddof=1)
+        if deviation == 0:
+            return 0.0
+        return float(returns.mean() / deviation * math.sqrt(self.periods_per_year))
+
+    @property
+    def total_return(self) -> float:
+        final_equity = self.equity[-1] if len(self.equity) else self.initial_capital
+        return float((final_equity - self.initial_capital) / self.initial_capital * 100)
+
+    def to_dict(self) -> dict:
+        """
+        Converts the summary statistics of the BacktestResult to a dictionary.
+        """
+        trades = len(self.trade_returns)
+        return {
+            "Signals": self.signals,
+            "Trades": trades,
+            "Win Rate (%)": round(sum(r > 0 for r in self.trade_returns) / trades * 100, 2) if trades else None,
+            "Average Trade Return (%)": round(sum(self.trade_returns) / trades, 2) if trades else None,
+            "Final Equity": round(float(self.equity[-1]), 2) if len(self.equity) else self.initial_capital,
+            "Total Return (%)": round(self.total_return, 2),
+            "Max Drawdown (%)": round(self.max_drawdown, 2),
+            "Sharpe Ratio": round(self.sharpe_ratio, 2),
+        }
+
+    def __repr__(self) -> str:
+        return f"BacktestResult({self.to_dict()})"
@@ -1,48 +1,128 @@
-from typing import Optional
+from typing import Dict, List, Optional, Sequence
+
+MISSING_VALUE = "Data Not Available"  # Shown in place of missing values by the app and Sheets export
+
+# Columns of `Breakout.to_dict` that are not float; every other column is a float (or None)
+TEXT_COLUMNS = ("Breakout Date", "Currency", "Date After Holding Period")
+INTEGER_COLUMNS = ("Volume on Breakout Day",)
+UTC_DATE_COLUMN = "Breakout UTC Date"  # Optional column of `DataProcessor.breakouts_to_dataframe`
 
 class Breakout:
     """
     Represents a breakout point in stock data.
+
+    `avg_volume` is the average volume over the service's volume window, and the date, price
+    and return after the holding period are taken that many bars after the breakout; both
+    spans are configurable, so column labels do not name them.
+
+    Values that are not known yet (the price after the holding period near the end of the
+    series, or a horizon that runs past the last bar) are None rather than a placeholder
+    string, so every field keeps a single type.
     """
+    __slots__ = (
+        "breakout_date",
+        "breakout_day_open",
+        "breakout_day_close",
+        "volume_on_breakout_day",
+        "avg_volume",
+        "currency",
+        "date_after_holding_period",
+        "price_after_holding_period",
+        "return_percentage",
+        "horizon_metrics",
+        "breakout_utc_date",
+    )
+
     def __init__(
         self,
         breakout_date: str,
         breakout_day_open: float,
         breakout_day_close: float,
         volume_on_breakout_day: int,
-        avg_volume_last_20_days: float,
-        currency: str,  
-        date_after_20_days: Optional[str] = None,
-        price_after_20_days: Optional[float] = None,
-        return_percentage: Optional[float] = None
+        avg_volume: float,
+        currency: str,
+        date_after_holding_period: Optional[str] = None,
+        price_after_holding_period: Optional[float] = None,
+        return_percentage: Optional[float] = None,
+        horizon_metrics: Optional[Dict[int, Dict[str, Optional[float]]]] = None,
+        breakout_utc_date: Optional[int] = None
     ):
         self.breakout_date = breakout_date
         self.breakout_day_open = breakout_day_open
         self.breakout_day_close = breakout_day_close
         self.volume_on_breakout_day = volume_on_breakout_day
-        self.avg_volume_last_20_days = avg_volume_last_20_days
-        self.currency = currency 
-        self.date_after_20_days = date_after_20_days or "Data Not Available"
-        self.price_after_20_days = price_after_20_days or "Data Not Available"
-        self.return_percentage = (
-            round(return_percentage, 2) if return_percentage is not None else "Data Not Available"
-        )
+        self.avg_volume = avg_volume
+        self.currency = currency
+        self.horizon_metrics = horizon_metrics or {}  # horizon -> {"return", "mfe", "mae"} in percent
+        self.breakout_utc_date = breakout_utc_date  # UTC timestamp of the breakout bar; not exported
+        self.resolve(date_after_holding_period, price_after_holding_period, return_percentage)
+
+    def resolve(
+        self,
+        date_after_holding_period: Optional[str],
+        price_after_holding_period: Optional[float],
+        return_percentage: Optional[float]
+    ) -> None:
+        """
+        Sets the forward date, price and return of the breakout once they are known.
+        """
+        self.date_after_holding_period = date_after_holding_period
+        self.price_after_holding_period = price_after_holding_period
+        self.return_percentage = return_percentage
 
     def to_dict(self) -> dict:
         """
-        Converts the Breakout object to a dictionary.
+        Converts the Breakout object to a dictionary, with None for values that are not known.
         """
-        return {
+        data = {
             "Breakout Date": self.breakout_date,
             "Breakout Day Open": self.breakout_day_open,
             "Breakout Day Close": self.breakout_day_close,
             "Volume on Breakout Day": self.volume_on_breakout_day,
-            "Average Volume (Last 20 Days)": self.avg_volume_last_20_days,
-            "Currency": self.currency,  
-            "Date After 20 Days": self.date_after_20_days,
-            "Price After 20 Days": self.price_after_20_days,
-            "Return (%)": self.return_percentage,
+            "Average Volume (Window)": self.avg_volume,
+            "Currency": self.currency,
+            "Date After Holding Period": self.date_after_holding_period,
+            "Price After Holding Period": self.price_after_holding_period,
+            "Return (%)": _round(self.return_percentage),
         }
+        for horizon, metrics in sorted(self.horizon_metrics.items()):
+            for key, label in _HORIZON_LABELS:
+                data[f"{label} {horizon} Bars (%)"] = _round(metrics.get(key))
+        return data
+
+    @staticmethod
+    def to_columns(breakouts: Sequence["Breakout"]) -> Dict[str, List]:
+        """
+        Converts breakouts to one list per `to_dict` column, reading each attribute across all
+        breakouts at once instead of building a dictionary per breakout.
+
+        Parameters:
+            breakouts (Sequence[Breakout]): Breakouts that share the same horizons.
+
+        Returns:
+            Dict[str, List]: Column name to values, with None for values that are not known.
+        """
+        columns = {
+            "Breakout Date": [b.breakout_date for b in breakouts],
+            "Breakout Day Open": [b.breakout_day_open for b in breakouts],
+            "Breakout Day Close": [b.breakout_day_close for b in breakouts],
+            "Volume on Breakout Day": [b.volume_on_breakout_day for b in breakouts],
+            "Average Volume (Window)": [b.avg_volume for b in breakouts],
+            "Currency": [b.currency for b in breakouts],
+            "Date After Holding Period": [b.date_after_holding_period for b in breakouts],
+            "Price After Holding Period": [b.price_after_holding_period for b in breakouts],
+            "Return (%)": [_round(b.return_percentage) for b in breakouts],
+        }
+        horizons = sorted(breakouts[0].horizon_metrics) if breakouts else []
+        for horizon in horizons:
+            for key, label in _HORIZON_LABELS:
+                columns[f"{label} {horizon} Bars (%)"] = [_round(b.horizon_metrics[horizon].get(key)) for b in breakouts]
+        return columns
 
     def __repr__(self) -> str:
         return f"Breakout({self.to_dict()})"
+
+_HORIZON_LABELS = (("return", "Return"), ("mfe", "MFE"), ("mae", "MAE"))
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 2) if value is not None else None
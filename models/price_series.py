@@ -0,0 +1,170 @@
+from typing import Dict, Iterator, List, Sequence, Union
+import numpy as np
+from models.stock_data import StockData
+
+class PriceSeries:
+    """
+    Represents a series of OHLCV bars stored as typed column arrays.
+
+    Rows are exposed lazily as StockData objects, so code written against a list of
+    StockData keeps working, while bulk consumers can use the arrays directly.
+    """
+    def __init__(
+        self,
+        dates: np.ndarray,
+        utc_dates: np.ndarray,
+        opens: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        volumes: np.ndarray
+    ):
+        """
+        Initializes a PriceSeries instance.
+
+        Parameters:
+            dates (np.ndarray): Date labels (object array of strings).
+            utc_dates (np.ndarray): UTC timestamps (int64).
+            opens (np.ndarray): Opening prices (float64).
+            highs (np.ndarray): Highest prices (float64).
+            lows (np.ndarray): Lowest prices (float64).
+            closes (np.ndarray): Closing prices (float64).
+            volumes (np.ndarray): Trading volumes (int64).
+        """
+        self.dates = np.asarray(dates, dtype=object)
+        self.utc_dates = np.asarray(utc_dates, dtype=np.int64)
+        self.opens = np.asarray(opens, dtype=np.float64)
+        self.highs = np.asarray(highs, dtype=np.float64)
+        self.lows = np.asarray(lows, dtype=np.float64)
+        self.closes = np.asarray(closes, dtype=np.float64)
+        self.volumes = np.asarray(volumes, dtype=np.int64)
+
+    @classmethod
+    def empty(cls) -> "PriceSeries":
+        return cls(*([] for _ in range(7)))
+
+    @classmethod
+    def from_api_body(cls, body: Dict[str, Dict]) -> "PriceSeries":
+        """
+        Creates a PriceSeries from the `body` of an API response, sorted by `utc_date`.
+
+        Parameters:
+            body (Dict[str, Dict]): Mapping of keys to per-bar dictionaries.
+
+        Returns:
+            PriceSeries: The parsed and sorted series.
+        """
+        n = len(body)
+        dates = np.empty(n, dtype=object)
+        utc_dates = np.empty(n, dtype=np.int64)
+        opens = np.empty(n, dtype=np.float64)
+        highs = np.empty(n, dtype=np.float64)
+        lows = np.empty(n, dtype=np.float64)
+        closes = np.empty(n, dtype=np.float64)
+        volumes = np.empty(n, dtype=np.int64)
+
+        for i, entry in enumerate(body.values()):
+            dates[i] = entry["date"]
+            utc_dates[i] = int(entry["date_utc"])
+            opens[i] = float(entry["open"])
+            highs[i] = float(entry["high"])
+            lows[i] = float(entry["low"])
+            closes[i] = float(entry["close"])
+            volumes[i] = int(entry["volume"])
+
+        return cls(dates, utc_dates, opens, highs, lows, closes, volumes).sorted()
+
+    @classmethod
+    def from_stock_data(cls, stock_data: Sequence[StockData]) -> "PriceSeries":
+        """
+        Creates a PriceSeries from a sequence of StockData objects, keeping their order.
+        """
+        if isinstance(stock_data, PriceSeries):
+            return stock_data
+        n = len(stock_data)
+        return cls(
+            np.array([stock.date for stock in stock_data], dtype=object),
+            np.fromiter((stock.utc_date for stock in stock_data), dtype=np.int64, count=n),
+            np.fromiter((stock.open_price for stock in stock_data), dtype=np.float64, count=n),
+            np.fromiter((stock.high_price for stock in stock_data), dtype=np.float64, count=n),
+            np.fromiter((stock.low_price for stock in stock_data), dtype=np.float64, count=n),
+            np.fromiter((stock.close_price for stock in stock_data), dtype=np.float64, count=n),
+            np.fromiter((stock.volume for stock in stock_data), dtype=np.int64, count=n),
+        )
+
+    @classmethod
+    def concat(cls, parts: Sequence["PriceSeries"]) -> "PriceSeries":
+        """
+        Joins several series end to end.
+        """
+        return cls(*(np.concatenate(columns) for columns in zip(*(part.columns() for part in parts))))
+
+    @property
+    def is_sorted(self) -> bool:
+        return bool(np.all(self.utc_dates[1:] >= self.utc_dates[:-1]))
+
+    def sorted(self) -> "PriceSeries":
+        """
+        Returns the series ordered by `utc_date`, or the series itself if it is already sorted.
+        """
+        if self.is_sorted:
+            return self
+        return self.take(np.argsort(self.utc_dates, kind="stable"))
+
+    def take(self, indices: np.ndarray) -> "PriceSeries":
+        """
+        Returns a new series containing the rows at the given indices or boolean mask.
+        """
+        return PriceSeries(*(column[indices] for column in self.columns()))
+
+    def chunks(self, size: int) -> Iterator["PriceSeries"]:
+        """
+        Yields consecutive slices of at most `size` bars, as views of this series.
+        """
+        for start in range(0, len(self), size):
+            yield self[start:start + size]
+
+    def columns(self) -> List[np.ndarray]:
+        return [self.dates, self.utc_dates, self.opens, self.highs, self.lows, self.closes, self.volumes]
+
+    def to_dataframe(self):
+        """
+        Converts the series to a Pandas DataFrame without copying the column arrays.
+
+        Returns:
+            pd.DataFrame: A DataFrame with one column per field.
+        """
+        import pandas as pd
+
+        return pd.DataFrame({
+            "Date": self.dates,
+            "UTC Date": self.utc_dates,
+            "Open": self.opens,
+            "High": self.highs,
+            "Low": self.lows,
+            "Close": self.closes,
+            "Volume": self.volumes,
+        }, copy=False)
+
+    def __len__(self) -> int:
+        return len(self.utc_dates)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[StockData, "PriceSeries"]:
+        if isinstance(index, slice):
+            return PriceSeries(*(column[index] for column in self.columns()))
+        return StockData(
+            date=self.dates[index],
+            utc_date=int(self.utc_dates[index]),
+            open_price=float(self.opens[index]),
+            high_price=float(self.highs[index]),
+            low_price=float(self.lows[index]),
+            close_price=float(self.closes[index]),
+            volume=int(self.volumes[index]),
+        )
+
+    def __iter__(self) -> Iterator[StockData]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"PriceSeries(bars={len(self)})"
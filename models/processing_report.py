@@ -0,0 +1,84 @@
+from typing import List, Optional
+
+# Export outcomes of a successfully processed ticker
+OUTCOME_WRITTEN = "written"  # Breakouts were written to the sinks
+OUTCOME_EMPTY = "empty"  # No breakouts were found; sinks recorded that
+OUTCOME_UNCHANGED = "unchanged"  # Breakouts matched the last export, so nothing was sent
+
+class TickerResult:
+    """
+    Represents the outcome of processing a single ticker.
+    """
+    def __init__(
+        self,
+        ticker: str,
+        breakout_count: int = 0,
+        error: Optional[str] = None,
+        outcome: Optional[str] = None
+    ):
+        """
+        Initializes a TickerResult instance.
+
+        Parameters:
+            ticker (str): The stock ticker symbol.
+            breakout_count (int): Number of breakout points found for the ticker.
+            error (Optional[str]): Error message if processing failed, otherwise None.
+            outcome (Optional[str]): OUTCOME_WRITTEN, OUTCOME_EMPTY or OUTCOME_UNCHANGED if the
+                ticker was exported, otherwise None.
+        """
+        self.ticker = ticker
+        self.breakout_count = breakout_count
+        self.error = error
+        self.outcome = outcome
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> dict:
+        """
+        Converts the TickerResult object to a dictionary.
+        """
+        return {
+            "Ticker": self.ticker,
+            "Status": "OK" if self.succeeded else "Error",
+            "Breakouts": self.breakout_count,
+            "Outcome": self.outcome,
+            "Error": self.error,
+        }
+
+    def __repr__(self) -> str:
+        return f"TickerResult({self.to_dict()})"
+
+
+class ProcessingReport:
+    """
+    Collects per-ticker results of a batch run.
+    """
+    def __init__(self, results: Optional[List[TickerResult]] = None):
+        self.results = results if results is not None else []
+
+    def add(self, result: TickerResult) -> None:
+        self.results.append(result)
+
+    @property
+    def succeeded(self) -> List[TickerResult]:
+        return [result for result in self.results if result.succeeded]
+
+    @property
+    def failed(self) -> List[TickerResult]:
+        return [result for result in self.results if not result.succeeded]
+
+    def to_dict(self) -> dict:
+        """
+        Converts the ProcessingReport object to a dictionary.
+        """
+        return {
+            "Total": len(self.results),
+            "Succeeded": len(self.succeeded),
+            "Failed": len(self.failed),
+            "Results": [result.to_dict() for result in self.results],
+        }
+
+    def __repr__(self) -> str:
+        return f"ProcessingReport(total={len(self.results)}, failed={len(self.failed)})"
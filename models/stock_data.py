@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict
 
 class StockData:
@@ -35,6 +35,13 @@ class StockData:
         self.close_price = close_price
         self.volume = volume
 
+    @property
+    def readable_utc_date(self) -> str:
+        """
+        Returns the UTC timestamp formatted as YYYY-MM-DD HH:MM:SS.
+        """
+        return datetime.fromtimestamp(self.utc_date, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
     @classmethod
     def from_dict(cls, data: Dict[str, float]) -> "StockData":
         """
@@ -1,20 +1,29 @@
-from typing import Dict, List
+from typing import Dict, Sequence
 from models.stock_data import StockData
+from models.price_series import PriceSeries
+from utils import metrics
 
 class StockSummary:
     """
     Represents a summary of stock data, including metadata such as currency.
     """
-    def __init__(self, currency: str, stock_data: List[StockData]):
+    def __init__(self, currency: str, stock_data: Sequence[StockData]):
         """
         Initializes the StockSummary instance.
 
         Parameters:
             currency (str): The currency in which stock prices are listed.
-            stock_data (List[StockData]): A list of StockData objects.
+            stock_data (Sequence[StockData]): A PriceSeries, or a list of StockData objects.
         """
         self.currency = currency
-        self.stock_data = stock_data
+        self.price_series = PriceSeries.from_stock_data(stock_data)
+
+    @property
+    def stock_data(self) -> PriceSeries:
+        """
+        The bars of the summary; indexing or iterating yields StockData objects lazily.
+        """
+        return self.price_series
 
     @classmethod
     def from_api_response(cls, response: Dict) -> "StockSummary":
@@ -27,16 +36,30 @@ class StockSummary:
         Returns:
             StockSummary: An instance of the StockSummary class.
         """
-        # Extract currency from the metadata
-        currency = response["meta"].get("currency", "Unknown Currency")
+        with metrics.span("from_api_response"):
+            # Extract currency from the metadata
+            currency = response["meta"].get("currency", "Unknown Currency")
+
+            # Parse stock data from the body straight into typed columns
+            price_series = PriceSeries.from_api_body(response["body"])
+        metrics.incr("bars_parsed", len(price_series))
+
+        return cls(currency=currency, stock_data=price_series)
+
+    @classmethod
+    def from_price_series(cls, header: Dict, price_series: PriceSeries) -> "StockSummary":
+        """
+        Creates a StockSummary instance from an already decoded PriceSeries.
 
-        # Parse stock data from the body
-        stock_data = [
-            StockData.from_dict(entry)
-            for entry in response["body"].values()
-        ]
+        Parameters:
+            header (Dict): The API response without its body (metadata and status).
+            price_series (PriceSeries): The decoded bars.
 
-        return cls(currency=currency, stock_data=stock_data)
+        Returns:
+            StockSummary: An instance of the StockSummary class.
+        """
+        currency = header["meta"].get("currency", "Unknown Currency")
+        return cls(currency=currency, stock_data=price_series)
 
     def __repr__(self) -> str:
         """
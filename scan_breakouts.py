@@ -0,0 +1,34 @@
+import argparse
+from export_stock_analysis import read_tickers
+from services.scanner_service import UniverseScanner
+from services.stock_analysis_service import get_default_provider
+from config.constants import SCANNER_MAX_WORKERS
+
+def main():
+    parser = argparse.ArgumentParser(description="List the tickers that broke out on their most recent bars.")
+    parser.add_argument("--tickers", default="tickers.txt", help="File with one ticker per line.")
+    parser.add_argument("--interval", default="1d", help="Bar interval to scan.")
+    parser.add_argument("--bars", type=int, default=1, help="Number of most recent bars to check per ticker.")
+    parser.add_argument("--workers", type=int, default=SCANNER_MAX_WORKERS, help="Tickers scanned at the same time.")
+    parser.add_argument("--output", help="Optional CSV file to write the ranked table to.")
+    args = parser.parse_args()
+
+    scanner = UniverseScanner(get_default_provider(), max_workers=args.workers)
+    rows, errors = scanner.scan(read_tickers(args.tickers), interval=args.interval, last_bars=args.bars)
+
+    for ticker, error in errors.items():
+        print(f"Error scanning ticker {ticker}: {error}")
+
+    if not rows:
+        print("No breakouts found.")
+        return
+
+    import pandas as pd
+
+    table = pd.DataFrame(rows)
+    print(table.to_string(index=False))
+    if args.output:
+        table.to_csv(args.output, index=False)
+
+if __name__ == "__main__":
+    main()
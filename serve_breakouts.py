@@ -0,0 +1,66 @@
+import argparse
+import asyncio
+import zlib
+from services.breakout_api import BreakoutAPIServer
+from config.constants import SERVICE_HOST, SERVICE_PORT, SERVICE_MAX_WORKERS, SERVICE_CACHE_TTL_SECONDS
+from config.settings import get_metrics_sink
+from utils import metrics
+
+def create_stub_service(years: float):
+    """
+    Starts a local fake RapidAPI server with synthetic history for any ticker and returns it
+    with a YahooFinanceService pointed at it, so the service can run without an API key.
+
+    Parameters:
+        years (float): Years of synthetic history per ticker.
+
+    Returns:
+        tuple: (FakeRapidAPIServer, YahooFinanceService).
+    """
+    from benchmarks.fake_rapidapi import FakeRapidAPIServer
+    from benchmarks.synthetic_data import generate_payload
+    from services.rate_limiter import RateLimiter
+    from services.yahoo_finance_service import YahooFinanceService
+
+    def payload_factory(symbol, interval):
+        return generate_payload(symbol, years, interval, seed=zlib.crc32(symbol.encode()))
+
+    stub = FakeRapidAPIServer(payload_factory).start()
+    # The stub has no plan limits; keep it out of the shared API budget
+    unlimited = RateLimiter(rate=1e9, burst=1e9, monthly_quota=None)
+    return stub, YahooFinanceService("stub-key", base_url=stub.url, rate_limiter=unlimited)
+
+async def serve(server: BreakoutAPIServer) -> None:
+    await server.start()
+    print(f"Serving breakouts on http://{server.host}:{server.port} (Ctrl+C to stop)")
+    await server.serve_forever()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve breakout queries over HTTP.")
+    parser.add_argument("--host", default=SERVICE_HOST, help="Interface to bind to.")
+    parser.add_argument("--port", type=int, default=SERVICE_PORT, help="Port to listen on (0 picks a free port).")
+    parser.add_argument("--workers", type=int, default=SERVICE_MAX_WORKERS, help="Worker threads fetching and analyzing tickers.")
+    parser.add_argument("--cache-ttl", type=float, default=SERVICE_CACHE_TTL_SECONDS, help="Seconds results are cached.")
+    parser.add_argument("--stub", action="store_true", help="Serve synthetic data from a local fake RapidAPI server.")
+    parser.add_argument("--stub-years", type=float, default=20, help="Years of synthetic history per ticker with --stub.")
+    args = parser.parse_args()
+
+    metrics_sink = get_metrics_sink()
+    if metrics_sink:
+        metrics.configure(metrics.create_sink(metrics_sink))
+
+    stub, provider = create_stub_service(args.stub_years) if args.stub else (None, None)
+    server = BreakoutAPIServer(
+        provider, host=args.host, port=args.port, max_workers=args.workers, cache_ttl_seconds=args.cache_ttl
+    )
+    try:
+        asyncio.run(serve(server))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if stub is not None:
+            stub.stop()
+        metrics.flush()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+# services/backtest_service.py
+
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from typing import List, Optional, Tuple
+import numpy as np
+from models.backtest_result import BacktestResult
+from services.bar_cache import BarCache
+from utils.intervals import periods_per_year
+from utils.rolling import breakout_mask
+from config.constants import (
+    BAR_CACHE_PATH,
+    VOLUME_THRESHOLD,
+    PRICE_THRESHOLD,
+    VOLUME_WINDOW,
+    HOLDING_PERIOD,
+    BACKTEST_INITIAL_CAPITAL,
+    BACKTEST_POSITION_SIZE,
+    BACKTEST_MAX_POSITIONS,
+)
+
+# Event kinds, in the order they are applied on the same date: exits free capital before entries
+EXIT, MARK, ENTRY = 0, 1, 2
+
+_worker_caches = {}
+
+def _get_worker_cache(cache_path: str) -> BarCache:
+    """
+    Returns this process's BarCache for `cache_path`, opening it on first use.
+    """
+    if cache_path not in _worker_caches:
+        _worker_caches[cache_path] = BarCache(cache_path)
+    return _worker_caches[cache_path]
+
+def _generate_signals(args: tuple) -> Tuple[List[tuple], np.ndarray]:
+    """
+    Generates the trades of one ticker from its cached price history.
+
+    Each trade enters at the close of a breakout bar and exits at the close `holding_period`
+    bars later, or at the last available bar if the history ends first.
+
+    Parameters:
+        args (tuple): (cache_path, ticker, interval, volume_threshold, price_threshold, volume_window, holding_period).
+
+    Returns:
+        tuple: (list of (utc_dates, closes) price paths from entry to exit, utc_dates of the ticker's bars).
+    """
+    cache_path, ticker, interval, volume_threshold, price_threshold, volume_window, holding_period = args
+    stock_summary = _get_worker_cache(cache_path).get(ticker, interval)
+    if stock_summary is None:
+        return [], np.empty(0, dtype=np.int64)
+
+    series = stock_summary.price_series
+    n = len(series)
+    mask, _, _ = breakout_mask(series.volumes, series.closes, volume_threshold, price_threshold, volume_window)
+
+    trades = []
+    for i in (np.flatnonzero(mask) + volume_window).tolist():
+        exit_index = min(i + holding_period, n - 1)
+        if exit_index > i:
+            trades.append((series.utc_dates[i:exit_index + 1], series.closes[i:exit_index + 1]))
+    return trades, series.utc_dates
+
+class BacktestService:
+    """
+    Backtests a "buy on breakout, hold N bars" strategy as a portfolio over cached price data.
+    """
+    def __init__(
+        self,
+        cache_path: str = BAR_CACHE_PATH,
+        interval: str = "1d",
+        volume_threshold: float = VOLUME_THRESHOLD,
+        price_threshold: float = PRICE_THRESHOLD,
+        volume_window: int = VOLUME_WINDOW,
+        holding_period: int = HOLDING_PERIOD,
+        max_workers: Optional[int] = None
+    ):
+        """
+        Initializes the BacktestService.
+
+        Parameters:
+            cache_path (str): Path of the BarCache database holding the price history.
+            interval (str): The bar interval to backtest (e.g., "1d").
+            volume_threshold (float): Multiple of the average volume a breakout bar must exceed.
+            price_threshold (float): Minimum close change versus the previous bar for a breakout.
+            volume_window (int): Number of preceding bars averaged for the volume condition.
+            holding_period (int): Number of bars each position is held.
+            max_workers (Optional[int]): Worker processes generating signals. Defaults to the CPU count;
+                1 runs everything in the calling process.
+        """
+        self.cache_path = cache_path
+        self.interval = interval
+        self.volume_threshold = volume_threshold
+        self.price_threshold = price_threshold
+        self.volume_window = volume_window
+        self.holding_period = holding_period
+        self.max_workers = max_workers
+
+    def run(
+        self,
+        tickers: List[str],
+        initial_capital: float = BACKTEST_INITIAL_CAPITAL,
+        position_size: float = BACKTEST_POSITION_SIZE,
+        max_positions: int = BACKTEST_MAX_POSITIONS
+    ) -> BacktestResult:
+        """
+        Generates signals for every ticker and simulates the portfolio.
+
+        Parameters:
+            tickers (List[str]): Tickers to include; tickers without cached data are ignored.
+            initial_capital (float): Starting cash.
+            position_size (float): Fraction of current equity allocated to each new position.
+            max_positions (int): Maximum number of positions held at once; later signals are skipped.
+
+        Returns:
+            BacktestResult: Equity curve, trade returns and summary statistics.
+        """
+        tasks = [
+            (self.cache_path, ticker, self.interval, self.volume_threshold, self.price_threshold,
+             self.volume_window, self.holding_period)
+            for ticker in tickers
+        ]
+        if self.max_workers == 1 or len(tasks) <= 1:
+            per_ticker = [_generate_signals(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                per_ticker = list(executor.map(_generate_signals, tasks, chunksize=max(1, len(tasks) // 64)))
+
+        calendar = np.unique(np.concatenate([dates for _, dates in per_ticker])) if per_ticker else np.empty(0, dtype=np.int64)
+        events = heapq.merge(*self._event_streams(per_ticker))
+        return self._simulate(events, calendar, initial_capital, position_size, max_positions)
+
+    @staticmethod
+    def _event_streams(per_ticker: List[tuple]) -> List[List[tuple]]:
+        """
+        Turns each ticker's trades into a date-ordered list of (utc_date, kind, trade_id, price) events.
+        """
+        streams = []
+        trade_id = 0
+        for trades, _ in per_ticker:
+            events = []
+            for utc_dates, closes in trades:
+                utc_dates, closes = utc_dates.tolist(), closes.tolist()
+                events.append((utc_dates[0], ENTRY, trade_id, closes[0]))
+                events.extend((utc_date, MARK, trade_id, close) for utc_date, close in zip(utc_dates[1:-1], closes[1:-1]))
+                events.append((utc_dates[-1], EXIT, trade_id, closes[-1]))
+                trade_id += 1
+            events.sort()
+            streams.append(events)
+        return streams
+
+    def _simulate(
+        self,
+        events,
+        calendar: np.ndarray,
+        initial_capital: float,
+        position_size: float,
+        max_positions: int
+    ) -> BacktestResult:
+        """
+        Replays the merged event stream, marking open positions to market on every date.
+        """
+        cash = initial_capital
+        positions = {}  # trade_id -> [shares, last_price, entry_price]
+        positions_value = 0.0
+        signals = 0
+        trade_returns = []
+        recorded_dates, recorded_equity = [], []
+
+        for utc_date, day_events in groupby(events, key=lambda event: event[0]):
+            for _, kind, trade_id, price in day_events:
+                if kind == ENTRY:
+                    signals += 1
+                    if len(positions) >= max_positions or price <= 0:
+                        continue
+                    allocation = min(cash, (cash + positions_value) * position_size)
+                    if allocation <= 0:
+                        continue
+                    positions[trade_id] = [allocation / price, price, price]
+                    cash -= allocation
+                    positions_value += allocation
+                elif trade_id in positions:
+                    position = positions[trade_id]
+                    positions_value += position[0] * (price - position[1])
+                    position[1] = price
+                    if kind == EXIT:
+                        del positions[trade_id]
+                        positions_value -= position[0] * price
+                        cash += position[0] * price
+                        trade_returns.append((price - position[2]) / position[2] * 100)
+            recorded_dates.append(utc_date)
+            recorded_equity.append(cash + positions_value)
+
+        # Carry the equity forward over calendar dates without events
+        equity = np.full(len(calendar), np.nan)
+        equity[np.searchsorted(calendar, recorded_dates)] = recorded_equity
+        filled = np.where(~np.isnan(equity), np.arange(len(equity)), -1)
+        filled = np.maximum.accumulate(filled) if len(filled) else filled
+        equity = np.where(filled >= 0, equity[filled], initial_capital)
+
+        return BacktestResult(
+            utc_dates=calendar,
+            equity=equity,
+            trade_returns=trade_returns,
+            signals=signals,
+            initial_capital=initial_capital,
+            periods_per_year=periods_per_year(self.interval),
+        )
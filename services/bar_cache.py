@@ -0,0 +1,292 @@
+# services/bar_cache.py
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterator, Optional, Tuple
+
+from config.constants import BAR_CACHE_PATH, BAR_CACHE_TTL_SECONDS, BREAKOUT_CHUNK_SIZE
+import numpy as np
+from models.price_series import PriceSeries
+from models.stock_summary import StockSummary
+from services.market_data import MarketDataProvider
+from utils.single_flight import SingleFlight
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    utc_date INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    open REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    close REAL NOT NULL,
+    volume INTEGER NOT NULL,
+    PRIMARY KEY (symbol, interval, utc_date)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS series (
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    currency TEXT NOT NULL,
+    refreshed_at REAL NOT NULL,
+    PRIMARY KEY (symbol, interval)
+);
+"""
+
+class BarCache:
+    """
+    On-disk SQLite store of OHLCV bars keyed by (symbol, interval) and indexed by `utc_date`.
+    """
+    def __init__(self, path: str = BAR_CACHE_PATH, ttl_seconds: float = BAR_CACHE_TTL_SECONDS):
+        """
+        Initializes the BarCache, creating the database file if needed.
+
+        Parameters:
+            path (str): Path to the SQLite database file.
+            ttl_seconds (float): Age in seconds after which a cached series is considered stale.
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+
+    def get(self, symbol: str, interval: str, last_bars: Optional[int] = None) -> Optional[StockSummary]:
+        """
+        Loads the cached series for a symbol, sorted by `utc_date`.
+
+        Parameters:
+            symbol (str): The stock ticker symbol.
+            interval (str): The bar interval (e.g., "1d").
+            last_bars (Optional[int]): If given, load only the newest `last_bars` bars.
+
+        Returns:
+            Optional[StockSummary]: The cached data, or None if the series is not cached.
+        """
+        with self._lock:
+            meta = self._connection.execute(
+                "SELECT currency FROM series WHERE symbol = ? AND interval = ?", (symbol, interval)
+            ).fetchone()
+            if meta is None:
+                return None
+            if last_bars is None:
+                rows = self._connection.execute(
+                    "SELECT date, utc_date, open, high, low, close, volume FROM bars "
+                    "WHERE symbol = ? AND interval = ? ORDER BY utc_date",
+                    (symbol, interval),
+                ).fetchall()
+            else:
+                rows = self._connection.execute(
+                    "SELECT date, utc_date, open, high, low, close, volume FROM bars "
+                    "WHERE symbol = ? AND interval = ? ORDER BY utc_date DESC LIMIT ?",
+                    (symbol, interval, last_bars),
+                ).fetchall()[::-1]
+
+        if not rows:
+            return StockSummary(currency=meta[0], stock_data=PriceSeries.empty())
+        return StockSummary(currency=meta[0], stock_data=PriceSeries(*(np.array(column) for column in zip(*rows))))
+
+    def currency(self, symbol: str, interval: str) -> Optional[str]:
+        """
+        Returns the currency of a cached series, or None if the series is not cached.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT currency FROM series WHERE symbol = ? AND interval = ?", (symbol, interval)
+            ).fetchone()
+        return row[0] if row else None
+
+    def iter_chunks(self, symbol: str, interval: str, chunk_size: int = BREAKOUT_CHUNK_SIZE) -> Iterator[PriceSeries]:
+        """
+        Loads the cached bars of a symbol in consecutive chunks sorted by `utc_date`.
+
+        Each chunk is a separate query resuming after the last `utc_date` returned, so the
+        whole series is never held in memory and no lock is kept between chunks.
+
+        Parameters:
+            symbol (str): The stock ticker symbol.
+            interval (str): The bar interval (e.g., "1d").
+            chunk_size (int): Maximum number of bars per chunk.
+
+        Returns:
+            Iterator[PriceSeries]: The chunks, oldest first.
+        """
+        last_utc_date = None
+        while True:
+            with self._lock:
+                if last_utc_date is None:
+                    rows = self._connection.execute(
+                        "SELECT date, utc_date, open, high, low, close, volume FROM bars "
+                        "WHERE symbol = ? AND interval = ? ORDER BY utc_date LIMIT ?",
+                        (symbol, interval, chunk_size),
+                    ).fetchall()
+                else:
+                    rows = self._connection.execute(
+                        "SELECT date, utc_date, open, high, low, close, volume FROM bars "
+                        "WHERE symbol = ? AND interval = ? AND utc_date > ? ORDER BY utc_date LIMIT ?",
+                        (symbol, interval, last_utc_date, chunk_size),
+                    ).fetchall()
+            if not rows:
+                return
+            yield PriceSeries(*(np.array(column) for column in zip(*rows)))
+            if len(rows) < chunk_size:
+                return
+            last_utc_date = rows[-1][1]
+
+    def last_utc_date(self, symbol: str, interval: str) -> Optional[int]:
+        """
+        Returns the newest cached `utc_date` for a symbol, or None if nothing is cached.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT MAX(utc_date) FROM bars WHERE symbol = ? AND interval = ?", (symbol, interval)
+            ).fetchone()
+        return row[0]
+
+    def is_fresh(self, symbol: str, interval: str) -> bool:
+        """
+        Checks whether the cached series was refreshed within the TTL.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT refreshed_at FROM series WHERE symbol = ? AND interval = ?", (symbol, interval)
+            ).fetchone()
+        return row is not None and time.time() - row[0] < self.ttl_seconds
+
+    def merge(self, symbol: str, interval: str, stock_summary: StockSummary, append_only: bool = True) -> int:
+        """
+        Writes fetched bars to the cache and marks the series as refreshed.
+
+        By default only bars from the last cached `utc_date` on are written: the API returns
+        the full history on every refresh, so older bars are already cached, and the last
+        cached bar is rewritten since it may have been an in-progress bar. With
+        `append_only=False` every bar is upserted, so bars older than the cached ones (e.g.
+        from a bulk-file backfill) are added and existing bars are replaced.
+
+        Parameters:
+            symbol (str): The stock ticker symbol.
+            interval (str): The bar interval (e.g., "1d").
+            stock_summary (StockSummary): Freshly fetched data for the symbol.
+            append_only (bool): If True, skip bars older than the last cached bar.
+
+        Returns:
+            int: Number of bars written.
+        """
+        series = stock_summary.price_series
+        last_utc_date = self.last_utc_date(symbol, interval) if append_only else None
+        if last_utc_date is not None:
+            series = series.take(series.utc_dates >= last_utc_date)
+
+        rows = list(zip(
+            [symbol] * len(series), [interval] * len(series), series.utc_dates.tolist(), series.dates.tolist(),
+            series.opens.tolist(), series.highs.tolist(), series.lows.tolist(), series.closes.tolist(),
+            series.volumes.tolist(),
+        ))
+
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._connection.execute(
+                "INSERT OR REPLACE INTO series VALUES (?, ?, ?, ?)",
+                (symbol, interval, stock_summary.currency, time.time()),
+            )
+        return len(rows)
+
+    def invalidate(self, symbol: Optional[str] = None, interval: Optional[str] = None, drop_bars: bool = False) -> None:
+        """
+        Marks cached series as stale so the next lookup refreshes them.
+
+        Parameters:
+            symbol (Optional[str]): Symbol to invalidate. Defaults to all symbols.
+            interval (Optional[str]): Interval to invalidate. Defaults to all intervals.
+            drop_bars (bool): If True, also delete the cached bars so the full history is refetched.
+        """
+        conditions, params = [], []
+        if symbol is not None:
+            conditions.append("symbol = ?")
+            params.append(symbol)
+        if interval is not None:
+            conditions.append("interval = ?")
+            params.append(interval)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self._lock, self._connection:
+            if drop_bars:
+                self._connection.execute(f"DELETE FROM bars{where}", params)
+                self._connection.execute(f"DELETE FROM series{where}", params)
+            else:
+                self._connection.execute(f"UPDATE series SET refreshed_at = 0{where}", params)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class CachedMarketDataProvider(MarketDataProvider):
+    """
+    Serves stock data from a BarCache, refreshing stale series incrementally from another
+    provider (the API, or local files).
+    """
+    def __init__(self, provider: MarketDataProvider, bar_cache: BarCache):
+        """
+        Initializes the CachedMarketDataProvider.
+
+        Parameters:
+            provider (MarketDataProvider): Provider used to fetch data on a cache miss or refresh,
+                usually a YahooFinanceService.
+            bar_cache (BarCache): Store holding previously fetched bars.
+        """
+        self.provider = provider
+        self.bar_cache = bar_cache
+        self._refreshes = SingleFlight()
+
+    def fetch_stock_data(self, ticker: str, interval: str = "1d", last_bars: Optional[int] = None) -> StockSummary:
+        """
+        Returns cached stock data for the ticker, refreshing it first if it is missing or stale.
+
+        Parameters:
+            ticker (str): The stock ticker symbol (e.g., "TSLA").
+            interval (str): The time interval for the data (default: "1d").
+            last_bars (Optional[int]): If given, return only the newest `last_bars` bars.
+
+        Returns:
+            StockSummary: An object containing metadata and stock data sorted by date.
+        """
+        self._refresh_if_stale(ticker, interval)
+        return self.bar_cache.get(ticker, interval, last_bars=last_bars)
+
+    def fetch_stock_data_chunks(
+        self, ticker: str, interval: str = "1d", chunk_size: int = BREAKOUT_CHUNK_SIZE
+    ) -> Tuple[str, Iterator[PriceSeries]]:
+        """
+        Returns cached stock data for the ticker as consecutive date-sorted chunks read from
+        the cache, refreshing it first if it is missing or stale.
+
+        Parameters:
+            ticker (str): The stock ticker symbol (e.g., "TSLA").
+            interval (str): The time interval for the data (default: "1d").
+            chunk_size (int): Maximum number of bars per chunk.
+
+        Returns:
+            Tuple[str, Iterator[PriceSeries]]: The currency and the chunks.
+        """
+        self._refresh_if_stale(ticker, interval)
+        return self.bar_cache.currency(ticker, interval), self.bar_cache.iter_chunks(ticker, interval, chunk_size)
+
+    def _refresh_if_stale(self, ticker: str, interval: str) -> None:
+        """
+        Fetches and merges fresh data if the cached series is missing or stale. Concurrent
+        refreshes of the same series share one fetch and merge.
+        """
+        if not self.bar_cache.is_fresh(ticker, interval):
+            self._refreshes.do((ticker, interval), lambda: self._refresh(ticker, interval))
+
+    def _refresh(self, ticker: str, interval: str) -> None:
+        stock_summary = self.provider.fetch_stock_data(ticker, interval)
+        self.bar_cache.merge(ticker, interval, stock_summary)
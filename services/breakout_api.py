@@ -0,0 +1,337 @@
+# services/breakout_api.py
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from config.constants import (
+    INTERVAL_MINUTES,
+    SERVICE_HOST,
+    SERVICE_PORT,
+    SERVICE_MAX_WORKERS,
+    SERVICE_CACHE_TTL_SECONDS,
+    SERVICE_CACHE_MAX_ENTRIES,
+    SERVICE_MAX_BATCH_TICKERS,
+)
+from models.breakout import Breakout
+from services.market_data import MarketDataProvider
+from services.rate_limiter import PRIORITY_INTERACTIVE, PRIORITY_BATCH, request_priority
+from services.stock_analysis_service import get_breakout_points, get_default_provider
+from utils import metrics
+from utils.single_flight import SingleFlight
+from utils.ttl_cache import TTLCache
+
+_MAX_HEADER_BYTES = 64 * 1024
+_MAX_BODY_BYTES = 1024 * 1024
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+}
+
+class HTTPError(Exception):
+    """
+    Raised while handling a request to answer it with an error status and message.
+    """
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+class BreakoutAPIServer:
+    """
+    Long-running asyncio HTTP/1.1 service answering breakout queries with JSON.
+
+    Endpoints:
+        GET  /health                           Liveness, uptime and cache size.
+        GET  /breakouts/<ticker>?interval=1d   Breakouts of one ticker.
+        POST /breakouts/batch                  Body {"tickers": [...], "interval": "1d"}; breakouts
+                                               per ticker, with failed tickers under "errors".
+
+    Every request shares one market data provider (and its pooled HTTP session), one result
+    cache and one worker pool. Fetching, detection and JSON encoding run in the pool, so the
+    event loop only parses requests and writes responses; concurrent requests for the same
+    ticker share one computation. Connections are kept alive between requests.
+    """
+    def __init__(
+        self,
+        provider: Optional[MarketDataProvider] = None,
+        host: str = SERVICE_HOST,
+        port: int = SERVICE_PORT,
+        max_workers: int = SERVICE_MAX_WORKERS,
+        cache_ttl_seconds: float = SERVICE_CACHE_TTL_SECONDS,
+        cache_max_entries: int = SERVICE_CACHE_MAX_ENTRIES,
+        max_batch_tickers: int = SERVICE_MAX_BATCH_TICKERS
+    ):
+        """
+        Initializes the BreakoutAPIServer.
+
+        Parameters:
+            provider (Optional[MarketDataProvider]): Provider shared by all requests. Defaults to the shared cached instance.
+            host (str): Interface to bind to.
+            port (int): Port to bind to; 0 picks a free port, available as `port` after `start`.
+            max_workers (int): Worker threads fetching and analyzing tickers.
+            cache_ttl_seconds (float): Seconds a ticker's breakouts are served from the result cache.
+            cache_max_entries (int): Maximum number of (ticker, interval) results kept.
+            max_batch_tickers (int): Maximum number of tickers in one batch request.
+        """
+        self.provider = provider or get_default_provider()
+        self.host = host
+        self.port = port
+        self.max_batch_tickers = max_batch_tickers
+        self.cache = TTLCache(max_entries=cache_max_entries, ttl_seconds=cache_ttl_seconds)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="breakout-worker")
+        self._flights = SingleFlight()
+        self._server = None
+        self._connections = set()
+        self._started_at = None
+
+    async def start(self) -> None:
+        """
+        Starts accepting connections.
+        """
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port, limit=_MAX_HEADER_BYTES)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._started_at = time.monotonic()
+
+    async def serve_forever(self) -> None:
+        """
+        Starts the server if needed and serves until the task is cancelled.
+        """
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """
+        Stops accepting connections, closes open ones and shuts the worker pool down.
+        """
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._connections):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def get_breakouts(self, ticker: str, interval: str = "1d") -> bytes:
+        """
+        Returns the breakouts of a ticker as a JSON array, from the result cache if possible.
+
+        Raises:
+            ValueError: If the data for the ticker could not be fetched or processed.
+            RuntimeError: If an unexpected error occurred.
+        """
+        key = (ticker, interval)
+        encoded = self.cache.get(key)
+        if encoded is not None:
+            metrics.incr("service_cache_hits")
+            return encoded
+
+        metrics.incr("service_cache_misses")
+        return await self._flights.do_async(key, lambda: self._compute(ticker, interval), executor=self._executor)
+
+    def _compute(self, ticker: str, interval: str) -> bytes:
+        """
+        Analyzes and encodes a ticker in a worker thread, caching the result before concurrent
+        requests waiting on the same computation are released.
+        """
+        encoded = _encode_breakouts(get_breakout_points(ticker, self.provider, interval))
+        self.cache.set((ticker, interval), encoded)
+        return encoded
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._connections.add(writer)
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                    if request is None:
+                        break
+                    method, target, body, keep_alive = request
+                except HTTPError as e:
+                    self._write_response(writer, e.status, _encode_error(e.message), keep_alive=False)
+                    await writer.drain()
+                    break
+
+                with metrics.span("service_request"):
+                    status, payload = await self._dispatch(method, target, body)
+                metrics.incr("service_requests")
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # The client went away mid-request
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, bytes, bool]]:
+        """
+        Reads one request from the connection.
+
+        Returns:
+            Optional[tuple]: (method, target, body, keep_alive), or None if the client closed
+            the connection between requests.
+        """
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as e:
+            if not e.partial.strip():
+                return None
+            raise HTTPError(400, "Incomplete request")
+        except asyncio.LimitOverrunError:
+            raise HTTPError(400, "Request headers too large")
+
+        lines = head.decode("latin-1").split("\r\n")
+        parts = lines[0].split(" ")
+        if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+            raise HTTPError(400, "Malformed request line")
+        method, target, version = parts
+
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise HTTPError(400, "Chunked request bodies are not supported")
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HTTPError(400, "Invalid Content-Length")
+        if length > _MAX_BODY_BYTES:
+            raise HTTPError(413, f"Request body exceeds {_MAX_BODY_BYTES} bytes")
+        body = await reader.readexactly(length) if length > 0 else b""
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        return method, target, body, keep_alive
+
+    async def _dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, bytes]:
+        """
+        Routes a request to its handler.
+
+        Returns:
+            tuple: (status, JSON response body).
+        """
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        path = url.path.rstrip("/")
+        try:
+            if path == "/health":
+                self._require_method(method, "GET")
+                return 200, self._health()
+            if path == "/breakouts/batch":
+                self._require_method(method, "POST")
+                return 200, await self._batch(body)
+            if path.startswith("/breakouts/"):
+                self._require_method(method, "GET")
+                ticker = _parse_ticker(unquote(path[len("/breakouts/"):]))
+                interval = _parse_interval(query.get("interval", ["1d"])[-1])
+                return 200, await self._single(ticker, interval)
+            raise HTTPError(404, f"No endpoint at {url.path}")
+        except HTTPError as e:
+            return e.status, _encode_error(e.message)
+        except ValueError as e:
+            return 404, _encode_error(str(e))
+        except Exception as e:
+            return 502, _encode_error(str(e))
+
+    def _health(self) -> bytes:
+        return json.dumps({
+            "status": "ok",
+            "uptime_seconds": round(time.monotonic() - self._started_at, 3),
+            "cache_entries": len(self.cache),
+            "connections": len(self._connections),
+        }).encode()
+
+    async def _single(self, ticker: str, interval: str) -> bytes:
+        with request_priority(PRIORITY_INTERACTIVE):
+            encoded = await self.get_breakouts(ticker, interval)
+        return b"".join([
+            b'{"ticker": ', json.dumps(ticker).encode(),
+            b', "interval": ', json.dumps(interval).encode(),
+            b', "breakouts": ', encoded, b"}",
+        ])
+
+    async def _batch(self, body: bytes) -> bytes:
+        try:
+            request = json.loads(body or b"{}")
+        except ValueError:
+            raise HTTPError(400, "Request body is not valid JSON")
+        if not isinstance(request, dict):
+            raise HTTPError(400, 'Request body must be a JSON object with a "tickers" list')
+        tickers = request.get("tickers")
+        if not isinstance(tickers, list) or not tickers or not all(isinstance(t, str) for t in tickers):
+            raise HTTPError(400, '"tickers" must be a non-empty list of strings')
+        tickers = list(dict.fromkeys(_parse_ticker(ticker) for ticker in tickers))
+        if len(tickers) > self.max_batch_tickers:
+            raise HTTPError(400, f"At most {self.max_batch_tickers} tickers are accepted per batch")
+        interval = _parse_interval(request.get("interval", "1d"))
+
+        with request_priority(PRIORITY_BATCH):
+            outcomes = await asyncio.gather(
+                *(self.get_breakouts(ticker, interval) for ticker in tickers), return_exceptions=True
+            )
+
+        results: List[bytes] = []
+        errors: Dict[str, str] = {}
+        for ticker, outcome in zip(tickers, outcomes):
+            if isinstance(outcome, BaseException):
+                errors[ticker] = str(outcome)
+            else:
+                results.append(json.dumps(ticker).encode() + b": " + outcome)
+        return b"".join([
+            b'{"interval": ', json.dumps(interval).encode(),
+            b', "results": {', b", ".join(results),
+            b'}, "errors": ', json.dumps(errors).encode(), b"}",
+        ])
+
+    @staticmethod
+    def _require_method(method: str, allowed: str) -> None:
+        if method != allowed:
+            raise HTTPError(405, f"Use {allowed} for this endpoint")
+
+    @staticmethod
+    def _write_response(writer: asyncio.StreamWriter, status: int, payload: bytes, keep_alive: bool) -> None:
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + payload)
+
+def _parse_ticker(ticker) -> str:
+    if not isinstance(ticker, str):
+        raise HTTPError(400, "Tickers must be strings")
+    ticker = ticker.strip().upper()
+    if not ticker or len(ticker) > 20 or any(c.isspace() or c == "/" for c in ticker):
+        raise HTTPError(400, f"Invalid ticker '{ticker}'")
+    return ticker
+
+def _parse_interval(interval) -> str:
+    if not isinstance(interval, str):
+        raise HTTPError(400, '"interval" must be a string')
+    if interval not in INTERVAL_MINUTES:
+        raise HTTPError(400, f"Unknown interval '{interval}', expected one of {', '.join(INTERVAL_MINUTES)}")
+    return interval
+
+def _encode_breakouts(breakouts: List[Breakout]) -> bytes:
+    return json.dumps([breakout.to_dict() for breakout in breakouts]).encode()
+
+def _encode_error(message: str) -> bytes:
+    return json.dumps({"error": message}).encode()
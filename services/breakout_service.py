@@ -1,42 +1,184 @@
 from collections import deque
-from typing import List
+from typing import Iterable, Iterator, List, Sequence, Tuple, Union
+import numpy as np
 from models.stock_data import StockData
+from models.price_series import PriceSeries
 from models.breakout import Breakout
+from config.constants import VOLUME_WINDOW, HOLDING_PERIOD
+from utils import metrics
+from utils.rolling import breakout_mask, forward_returns, forward_excursions
+from utils.intervals import interval_minutes, to_bars, horizons_to_bars
+
+ENGINES = ("loop", "vectorized")
 
 class BreakoutService:
     """
     Service for identifying breakout points and calculating returns from stock data.
     """
-    def __init__(self, volume_threshold: float, price_threshold: float):
+    def __init__(
+        self,
+        volume_threshold: float,
+        price_threshold: float,
+        engine: str = "loop",
+        volume_window: Union[int, str] = VOLUME_WINDOW,
+        holding_period: Union[int, str] = HOLDING_PERIOD,
+        horizons: Sequence[Union[int, str]] = (),
+        interval: str = "1d"
+    ):
+        """
+        Initializes the BreakoutService.
+
+        Parameters:
+            volume_threshold (float): Multiple of the average volume a breakout day must exceed.
+            price_threshold (float): Minimum day-over-day close change for a breakout day.
+            engine (str): "loop" for the per-bar implementation or "vectorized" for the NumPy one.
+            volume_window (Union[int, str]): Preceding bars averaged for the volume condition.
+            holding_period (Union[int, str]): Bars after the breakout used for the return.
+            horizons (Sequence[Union[int, str]]): Extra forward horizons for which each breakout
+                gets its return and maximum favorable/adverse excursion.
+            interval (str): The bar interval of the data (e.g., "1d" or "5m").
+
+        Windows and horizons are bar counts, or durations such as "4h" or "20d" that are
+        converted to bars of `interval` (see `utils.intervals.to_bars`).
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown breakout engine '{engine}', expected one of {ENGINES}")
+        interval_minutes(interval)  # Validate the interval even when every span is in bars
         self.volume_threshold = volume_threshold
         self.price_threshold = price_threshold
+        self.engine = engine
+        self.interval = interval
+        self.volume_window = to_bars(volume_window, interval)
+        self.holding_period = to_bars(holding_period, interval)
+        self.horizons = horizons_to_bars(horizons, interval)
 
     def identify_breakouts(self, stock_data: List[StockData], currency: str) -> List[Breakout]:
         """
         Identifies breakout points and calculates returns.
 
         Parameters:
-            stock_data (List[StockData]): A list of StockData objects sorted by date.
+            stock_data (List[StockData]): A PriceSeries or list of StockData objects sorted by date.
 
         Returns:
             List[Breakout]: A list of Breakout objects containing breakout details.
         """
-        last_20_volumes = deque(maxlen=20)  # Store the last 20 volumes
+        with metrics.span("identify_breakouts"):
+            hits = self._identify(stock_data, currency)
+        metrics.incr("breakouts_found", len(hits))
+
+        return [breakout for _, breakout in hits]
+
+    def iter_breakouts(self, chunks: Iterable[PriceSeries], currency: str) -> Iterator[Breakout]:
+        """
+        Identifies breakout points in a series delivered as consecutive chunks.
+
+        Only the current chunk plus the bars still needed around it are held: the
+        `volume_window` bars preceding the first unreported bar, and the bars whose
+        holding period or horizons are not yet complete. Memory is therefore bounded by
+        the chunk size, not the history length, and the breakouts (with their returns and
+        horizon metrics) are exactly those `identify_breakouts` finds on the whole series.
+
+        Parameters:
+            chunks (Iterable[PriceSeries]): Consecutive slices of a series sorted by date.
+            currency (str): Currency of the prices.
+
+        Returns:
+            Iterator[Breakout]: Breakouts in date order, yielded as soon as they are final.
+        """
+        window = self.volume_window
+        lookahead = max((self.holding_period,) + self.horizons)
+        buffer = None
+        offset = 0  # Index in the whole series of the first bar in `buffer`
+        reported = 0  # Bars before this index have been fully evaluated
+
+        for chunk in chunks:
+            if not len(chunk):
+                continue
+            buffer = chunk if buffer is None else PriceSeries.concat([buffer, chunk])
+
+            # Bars before `end` have every forward bar they need
+            end = offset + len(buffer) - lookahead
+            if end > reported:
+                yield from self._breakouts_between(buffer, offset, reported, end, currency)
+                reported = end
+
+            keep_from = max(reported - window, offset)
+            buffer = buffer[keep_from - offset:]
+            offset = keep_from
+
+        if buffer is not None and reported < offset + len(buffer):
+            yield from self._breakouts_between(buffer, offset, reported, offset + len(buffer), currency)
+
+    def _breakouts_between(self, buffer: PriceSeries, offset: int, start: int, end: int, currency: str) -> List[Breakout]:
+        """
+        Identifies the breakouts in `buffer` whose index in the whole series is in [start, end).
+        """
+        with metrics.span("identify_breakouts"):
+            hits = [(i, breakout) for i, breakout in self._identify(buffer, currency) if start <= offset + i < end]
+        metrics.incr("breakouts_found", len(hits))
+        return [breakout for _, breakout in hits]
+
+    def _identify(self, stock_data: List[StockData], currency: str) -> List[Tuple[int, Breakout]]:
+        """
+        Runs the configured engine and attaches the horizon metrics.
+        """
+        if self.engine == "vectorized":
+            hits = self._identify_breakouts_vectorized(stock_data, currency)
+        else:
+            hits = self._identify_breakouts_loop(stock_data, currency)
+
+        if self.horizons and hits:
+            self._attach_horizon_metrics(PriceSeries.from_stock_data(stock_data), hits)
+        return hits
+
+    def _attach_horizon_metrics(self, series: PriceSeries, hits: List[Tuple[int, Breakout]]) -> None:
+        """
+        Computes the return, MFE and MAE of every breakout for each configured horizon.
+
+        Each horizon costs one pass over the series (forward returns by array shift, and
+        sliding-window max/min of highs and lows), regardless of the number of breakouts.
+        """
+        indices = np.array([index for index, _ in hits])
+        metrics = {}
+        for horizon in self.horizons:
+            returns = forward_returns(series.closes, horizon)[indices]
+            mfe, mae = forward_excursions(series.closes, series.highs, series.lows, horizon)
+            metrics[horizon] = (returns, mfe[indices], mae[indices])
+
+        for k, (_, breakout) in enumerate(hits):
+            breakout.horizon_metrics = {
+                horizon: {
+                    "return": None if np.isnan(returns[k]) else returns[k].item(),
+                    "mfe": None if np.isnan(mfe[k]) else mfe[k].item(),
+                    "mae": None if np.isnan(mae[k]) else mae[k].item(),
+                }
+                for horizon, (returns, mfe, mae) in metrics.items()
+            }
+
+    def _identify_breakouts_loop(self, stock_data: List[StockData], currency: str) -> List[Tuple[int, Breakout]]:
+        """
+        Identifies breakout points by walking the bars one at a time.
+
+        Returns:
+            List[Tuple[int, Breakout]]: Bar index and Breakout for each breakout.
+        """
+        window = self.volume_window
+        last_volumes = deque(maxlen=window)  # Store the last `window` volumes
         breakouts = []
         previous_close = None  # To keep track of yesterday's close price
 
         for i, stock in enumerate(stock_data):
-            if len(last_20_volumes) < 20:
-                last_20_volumes.append(stock.volume)
+            if len(last_volumes) < window:
+                last_volumes.append(stock.volume)
                 previous_close = stock.close_price  # Update previous day's close price
                 continue
 
-            # Calculate average volume over the last 20 days
-            avg_volume = sum(last_20_volumes) / 20
+            # Calculate average volume over the window
+            avg_volume = sum(last_volumes) / window
 
             # Check breakout conditions (pass previous day's close price)
             if self._is_breakout(stock, avg_volume, previous_close):
-                price_after_20_days, return_pct = self._calculate_return(stock_data, i)
+                future, return_pct = self._calculate_return(stock_data, i)
 
                 # Create a Breakout object
                 breakout = Breakout(
@@ -44,27 +186,70 @@ class BreakoutService:
                     breakout_day_open=stock.open_price,
                     breakout_day_close=stock.close_price,
                     volume_on_breakout_day=stock.volume,
-                    avg_volume_last_20_days=avg_volume,
+                    avg_volume=avg_volume,
                     currency=currency,
-                    date_after_20_days=price_after_20_days["date"] if price_after_20_days else None,
-                    price_after_20_days=price_after_20_days["price"] if price_after_20_days else None,
+                    date_after_holding_period=future["date"] if future else None,
+                    price_after_holding_period=future["price"] if future else None,
                     return_percentage=return_pct,
+                    breakout_utc_date=stock.utc_date,
                 )
-                breakouts.append(breakout)
+                breakouts.append((i, breakout))
 
             # Add current day's volume to the deque and update previous day's close price
-            last_20_volumes.append(stock.volume)
+            last_volumes.append(stock.volume)
             previous_close = stock.close_price
 
         return breakouts
 
+    def _identify_breakouts_vectorized(self, stock_data: List[StockData], currency: str) -> List[Tuple[int, Breakout]]:
+        """
+        Identifies breakout points using array operations over the whole series.
+
+        Produces exactly the same breakouts as the per-bar loop: the first `volume_window`
+        bars only seed the volume window, volume must be strictly greater than the threshold
+        and the price change must be greater than or equal to it.
+        """
+        series = PriceSeries.from_stock_data(stock_data)
+        window, horizon = self.volume_window, self.holding_period
+        n = len(series)
+        if n <= window:
+            return []
+
+        volumes = series.volumes
+        closes = series.closes
+
+        # Rolling volume mean from cumulative sums (exact for integer volumes)
+        mask, avg_volumes, _ = breakout_mask(volumes, closes, self.volume_threshold, self.price_threshold, window)
+
+        # Close `holding_period` bars ahead via array shift
+        returns = forward_returns(closes, horizon)
+
+        breakouts = []
+        for position in np.flatnonzero(mask).tolist():
+            i = position + window
+            has_future = i + horizon < n
+            breakouts.append((i, Breakout(
+                breakout_date=series.dates[i],
+                breakout_day_open=series.opens[i].item(),
+                breakout_day_close=closes[i].item(),
+                volume_on_breakout_day=volumes[i].item(),
+                avg_volume=avg_volumes[position].item(),
+                currency=currency,
+                date_after_holding_period=series.dates[i + horizon] if has_future else None,
+                price_after_holding_period=closes[i + horizon].item() if has_future else None,
+                return_percentage=returns[i].item() if has_future else None,
+                breakout_utc_date=series.utc_dates[i].item(),
+            )))
+
+        return breakouts
+
     def _is_breakout(self, stock: StockData, avg_volume: float, previous_close: float) -> bool:
         """
         Determines whether the current day qualifies as a breakout.
 
         Parameters:
             stock (StockData): The current day's stock data.
-            avg_volume (float): Average volume over the last 20 days.
+            avg_volume (float): Average volume over the volume window.
             previous_close (float): The previous day's close price.
 
         Returns:
@@ -80,17 +265,17 @@ class BreakoutService:
 
     def _calculate_return(self, stock_data: List[StockData], index: int) -> tuple:
         """
-        Calculates the return percentage after 20 days from the breakout point.
+        Calculates the return percentage `holding_period` bars after the breakout point.
 
         Parameters:
             stock_data (List[StockData]): List of stock data.
             index (int): Current index of the breakout.
 
         Returns:
-            tuple: A dictionary with date and price after 20 days, and return percentage.
+            tuple: A dictionary with date and price after the holding period, and return percentage.
         """
-        if index + 20 < len(stock_data):
-            future_stock = stock_data[index + 20]
+        if index + self.holding_period < len(stock_data):
+            future_stock = stock_data[index + self.holding_period]
             return_pct = ((future_stock.close_price - stock_data[index].close_price) / stock_data[index].close_price) * 100
             return {"date": future_stock.date, "price": future_stock.close_price}, return_pct
         return None, None
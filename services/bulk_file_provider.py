@@ -0,0 +1,233 @@
+# services/bulk_file_provider.py
+
+import glob
+import threading
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from config.constants import INTERVAL_MINUTES, TRADING_MINUTES_PER_DAY
+from models.price_series import PriceSeries
+from models.stock_summary import StockSummary
+from services.market_data import MarketDataProvider
+from utils import metrics
+
+# Accepted column names (case-insensitive) for each field of a bulk OHLCV file
+_COLUMN_ALIASES = {
+    "ticker": ("ticker", "symbol"),
+    "date": ("date", "datetime", "timestamp", "time", "date_utc"),
+    "open": ("open",),
+    "high": ("high",),
+    "low": ("low",),
+    "close": ("close",),
+    "volume": ("volume",),
+}
+_CURRENCY_ALIASES = ("currency",)
+
+class BulkFileProvider(MarketDataProvider):
+    """
+    Market data provider reading OHLCV bars for many tickers from local CSV, Parquet or Arrow
+    IPC (Feather) files, so backfills and analyses can run offline without API calls.
+
+    Each file holds rows of (ticker, date, open, high, low, close, volume), and optionally
+    currency, for any number of tickers. On first use every file is read once (Parquet and
+    Arrow files are memory-mapped), the rows of all files are sorted by ticker and date in a
+    single pass, and each ticker's bars become a contiguous slice. `fetch_stock_data` then
+    returns views of that slice; only the date labels are built per call. When files overlap,
+    the row from the file listed last wins. Requires pyarrow.
+    """
+    def __init__(self, paths: Union[str, Sequence[str]], interval: str = "1d", currency: str = "USD"):
+        """
+        Initializes the BulkFileProvider.
+
+        Parameters:
+            paths (Union[str, Sequence[str]]): Files or glob patterns (e.g., "dumps/*.parquet").
+            interval (str): Bar interval of the data in the files.
+            currency (str): Currency of tickers without a currency column.
+        """
+        if isinstance(paths, str):
+            paths = [paths]
+        self.paths = [path for pattern in paths for path in (sorted(glob.glob(pattern)) or [pattern])]
+        self.interval = interval
+        self.currency = currency
+        self._lock = threading.Lock()
+        self._columns = None  # Bar columns of all tickers, sorted by ticker then utc_date
+        self._shards: Dict[str, Tuple[int, int, str]] = {}  # ticker -> (start, stop, currency)
+
+    def tickers(self) -> List[str]:
+        """
+        Returns the tickers found in the files, in sorted order.
+        """
+        self._load()
+        return sorted(self._shards)
+
+    def fetch_stock_data(self, ticker: str, interval: str = "1d") -> StockSummary:
+        """
+        Returns the bars of a ticker, sorted by date, as views of the loaded files.
+
+        Raises:
+            ValueError: If the interval does not match the files or the ticker is not in them.
+        """
+        if interval != self.interval:
+            raise ValueError(f"Market data files hold {self.interval} bars, not {interval}")
+        self._load()
+        shard = self._shards.get(ticker)
+        if shard is None:
+            raise ValueError(f"No bars for ticker {ticker} in {', '.join(self.paths)}")
+        start, stop, currency = shard
+        columns = self._columns
+        utc_dates = columns["utc_date"][start:stop]
+        return StockSummary(currency=currency, stock_data=PriceSeries(
+            self._date_labels(utc_dates), utc_dates, columns["open"][start:stop], columns["high"][start:stop],
+            columns["low"][start:stop], columns["close"][start:stop], columns["volume"][start:stop],
+        ))
+
+    def iter_stock_data(self) -> Iterator[Tuple[str, StockSummary]]:
+        """
+        Yields (ticker, StockSummary) for every ticker in the files, in sorted order.
+        """
+        for ticker in self.tickers():
+            yield ticker, self.fetch_stock_data(ticker, self.interval)
+
+    def _load(self) -> None:
+        """
+        Reads and shards the files, once.
+        """
+        with self._lock:
+            if self._columns is not None:
+                return
+            with metrics.span("load_market_data_files"):
+                columns, self._shards = self._read_all()
+            metrics.incr("bars_loaded", len(columns["utc_date"]))
+            self._columns = columns
+
+    def _read_all(self) -> Tuple[Dict[str, np.ndarray], Dict[str, Tuple[int, int, str]]]:
+        import pyarrow as pa
+
+        parts = [self._read_file(path) for path in self.paths]
+        if not parts:
+            return {name: np.array([]) for name in ("utc_date", "open", "high", "low", "close", "volume")}, {}
+
+        tickers = pa.chunked_array([part["ticker"] for part in parts], type=pa.string()).combine_chunks().dictionary_encode()
+        codes = tickers.indices.to_numpy(zero_copy_only=False)
+        names = tickers.dictionary.to_pylist()
+        utc_dates = np.concatenate([part["utc_date"] for part in parts])
+
+        # One sort groups every ticker's bars into a contiguous, date-ordered slice
+        order = np.lexsort((utc_dates, codes))
+        codes = codes[order]
+        utc_dates = utc_dates[order]
+        # Keep the last row of each (ticker, utc_date); the sort is stable, so later files win
+        keep = np.ones(len(order), dtype=bool)
+        keep[:-1] = (codes[1:] != codes[:-1]) | (utc_dates[1:] != utc_dates[:-1])
+        order, codes, utc_dates = order[keep], codes[keep], utc_dates[keep]
+
+        columns = {
+            name: np.concatenate([part[name] for part in parts])[order]
+            for name in ("open", "high", "low", "close", "volume")
+        }
+        columns["utc_date"] = utc_dates
+
+        currencies = None
+        if any(part["currency"] is not None for part in parts):
+            currencies = np.concatenate([
+                part["currency"] if part["currency"] is not None else np.full(len(part["utc_date"]), None, dtype=object)
+                for part in parts
+            ])[order]
+
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else np.array([], dtype=np.int64)
+        stops = np.r_[starts[1:], len(codes)]
+        shards = {}
+        for start, stop in zip(starts.tolist(), stops.tolist()):
+            currency = currencies[start] if currencies is not None and currencies[start] else self.currency
+            shards[names[codes[start]]] = (start, stop, currency)
+        return columns, shards
+
+    def _read_file(self, path: str) -> dict:
+        """
+        Reads one file into numpy columns: ticker (Arrow array), utc_date, open, high, low, close,
+        volume and currency (None if the file has no currency column). Rows with a missing
+        required value are dropped.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        table = self._read_table(path)
+        names = {name.lower(): name for name in table.column_names}
+        selected = {}
+        for field, aliases in _COLUMN_ALIASES.items():
+            column = next((names[alias] for alias in aliases if alias in names), None)
+            if column is None:
+                raise ValueError(f"{path} has no {field} column (expected one of: {', '.join(aliases)})")
+            selected[field] = column
+        currency_column = next((names[alias] for alias in _CURRENCY_ALIASES if alias in names), None)
+
+        table = table.select(list(selected.values()) + ([currency_column] if currency_column else []))
+        mask = pc.is_valid(table[selected["ticker"]])
+        for column in list(selected.values())[1:]:
+            mask = pc.and_(mask, pc.is_valid(table[column]))
+        table = table.filter(mask)
+
+        return {
+            "ticker": pc.cast(table[selected["ticker"]], pa.string()).combine_chunks(),
+            "utc_date": self._utc_seconds(table[selected["date"]]),
+            "open": table[selected["open"]].to_numpy().astype(np.float64),
+            "high": table[selected["high"]].to_numpy().astype(np.float64),
+            "low": table[selected["low"]].to_numpy().astype(np.float64),
+            "close": table[selected["close"]].to_numpy().astype(np.float64),
+            "volume": table[selected["volume"]].to_numpy().astype(np.int64),
+            "currency": (
+                np.asarray(pc.cast(table[currency_column], pa.string()).to_pylist(), dtype=object)
+                if currency_column else None
+            ),
+        }
+
+    @staticmethod
+    def _read_table(path: str):
+        """
+        Reads a CSV, Parquet or Arrow IPC file into an Arrow table, by file extension.
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError("pyarrow is required to read market data files (pip install pyarrow)")
+
+        name = path.lower()
+        if name.endswith((".parquet", ".pq")):
+            import pyarrow.parquet as pq
+            return pq.read_table(path, memory_map=True)
+        if name.endswith((".arrow", ".feather", ".ipc")):
+            import pyarrow.feather as feather
+            return feather.read_table(path, memory_map=True)
+        if name.endswith((".csv", ".csv.gz", ".csv.bz2")):
+            import pyarrow.csv as pa_csv
+            return pa_csv.read_csv(path)
+        raise ValueError(f"Unsupported market data file '{path}', expected .csv, .parquet or .arrow/.feather")
+
+    @staticmethod
+    def _utc_seconds(column) -> np.ndarray:
+        """
+        Converts a date column to UTC seconds. Integers are taken as epoch seconds, dates and
+        timestamps (or ISO 8601 strings) without a time zone as UTC.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if pa.types.is_integer(column.type):
+            return column.to_numpy().astype(np.int64)
+        if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+            column = pc.cast(column, pa.timestamp("s"))
+        elif pa.types.is_date(column.type):
+            column = pc.cast(column, pa.timestamp("s"))
+        elif pa.types.is_timestamp(column.type):
+            column = pc.cast(column, pa.timestamp("s", tz=column.type.tz), safe=False)
+        else:
+            raise ValueError(f"Unsupported date column type {column.type}")
+        return pc.cast(column, pa.int64()).to_numpy().astype(np.int64)
+
+    def _date_labels(self, utc_dates: np.ndarray) -> np.ndarray:
+        """
+        Formats UTC seconds like the API's date labels: "2024-01-31", or "2024-01-31T14:30" for intraday bars.
+        """
+        unit = "m" if INTERVAL_MINUTES.get(self.interval, TRADING_MINUTES_PER_DAY) < TRADING_MINUTES_PER_DAY else "D"
+        return np.datetime_as_string(utc_dates.astype("datetime64[s]"), unit=unit).astype(object)
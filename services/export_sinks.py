@@ -0,0 +1,217 @@
+# services/export_sinks.py
+
+import csv
+import datetime
+import os
+import uuid
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence
+
+from config.constants import EXPORT_DATASET_PATH, EXPORT_CSV_PATH
+from models.breakout import TEXT_COLUMNS, INTEGER_COLUMNS
+from models.processing_report import OUTCOME_UNCHANGED
+from utils import metrics
+
+
+class ExportSink(ABC):
+    """
+    Destination for the breakout tables produced by `process_tickers`.
+
+    Subclasses implement `write_batch`, which receives a batch of completed tickers, and may
+    implement `flush` to persist state kept across batches (called once per run) and `close`
+    to release resources. Sinks can be used as context managers.
+    """
+    @abstractmethod
+    def write_batch(self, tables: Dict[str, List[dict]]) -> Optional[Dict[str, str]]:
+        """
+        Writes the breakout tables of a batch of tickers.
+
+        Parameters:
+            tables (Dict[str, List[dict]]): Mapping of ticker to a list of breakout dictionaries.
+
+        Returns:
+            Optional[Dict[str, str]]: Outcome of the tickers that were not written, e.g.
+            OUTCOME_UNCHANGED for tables skipped because they match the last export. None if
+            every table was written.
+        """
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class MultiSink(ExportSink):
+    """
+    Writes every batch to several sinks in turn.
+    """
+    def __init__(self, sinks: Sequence[ExportSink]):
+        self.sinks = list(sinks)
+
+    def write_batch(self, tables: Dict[str, List[dict]]) -> Optional[Dict[str, str]]:
+        # A ticker counts as unchanged only if no sink wrote it
+        unchanged = set(tables)
+        for sink in self.sinks:
+            outcomes = sink.write_batch(tables) or {}
+            unchanged &= {ticker for ticker, outcome in outcomes.items() if outcome == OUTCOME_UNCHANGED}
+        return {ticker: OUTCOME_UNCHANGED for ticker in unchanged}
+
+    def flush(self) -> None:
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self) -> None:
+        for sink in self.sinks:
+            sink.close()
+
+class CsvSink(ExportSink):
+    """
+    Appends the breakouts of all tickers to a single CSV file, one row per breakout, with
+    "Run Date" and "Ticker" columns in front and empty cells for missing values. Rows are
+    streamed to the file as batches arrive; an existing file is appended to without repeating
+    the header, provided its header matches the columns being written.
+    """
+    def __init__(self, path: str = EXPORT_CSV_PATH, run_date: Optional[str] = None):
+        """
+        Initializes the CsvSink.
+
+        Parameters:
+            path (str): Path of the CSV file.
+            run_date (Optional[str]): Value of the "Run Date" column. Defaults to today's date (UTC).
+        """
+        self.path = path
+        self.run_date = run_date or datetime.datetime.now(datetime.timezone.utc).date().isoformat()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = None
+        self._writer = None
+
+    def write_batch(self, tables: Dict[str, List[dict]]) -> None:
+        """
+        Appends the breakouts of a batch of tickers to the file.
+
+        Raises:
+            ValueError: If the file already has a header with different columns (e.g. written
+                with other forward horizons).
+        """
+        rows = [
+            {"Run Date": self.run_date, "Ticker": ticker, **row}
+            for ticker, breakout_data in tables.items()
+            for row in breakout_data
+        ]
+        if not rows:
+            return
+
+        with metrics.span("csv_write_batch"):
+            if self._writer is None:
+                fieldnames = list(rows[0].keys())
+                existing_header = self._read_header()
+                if existing_header is not None and existing_header != fieldnames:
+                    raise ValueError(
+                        f"{self.path} has different columns than this export; write to a new file "
+                        f"(--csv-path) instead. Existing: {existing_header}. New: {fieldnames}"
+                    )
+                self._file = open(self.path, "a", newline="")
+                self._writer = csv.DictWriter(self._file, fieldnames=fieldnames)
+                if existing_header is None:
+                    self._writer.writeheader()
+            self._writer.writerows(rows)
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+    def _read_header(self) -> Optional[List[str]]:
+        """
+        Returns the header row of the existing file, or None if the file is missing or empty.
+        """
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, "r", newline="") as f:
+            return next(csv.reader(f), None)
+
+class ArrowDatasetSink(ExportSink):
+    """
+    Writes the breakouts of all tickers into one Parquet or Arrow IPC dataset, partitioned
+    Hive-style by run date and ticker (`run_date=2025-01-31/ticker=TSLA/part-....parquet`).
+
+    Each batch becomes a single Arrow table written as new files with a unique name, so
+    writes are bulk and append-only, and earlier runs are never rewritten. Readers can open
+    the whole directory with `pyarrow.dataset.dataset(path, partitioning="hive")`; Arrow IPC
+    files can also be memory-mapped. Missing values are nulls. Requires pyarrow.
+    """
+    FORMATS = ("parquet", "arrow")
+
+    def __init__(self, path: str = EXPORT_DATASET_PATH, file_format: str = "parquet", run_date: Optional[str] = None):
+        """
+        Initializes the ArrowDatasetSink.
+
+        Parameters:
+            path (str): Root directory of the dataset.
+            file_format (str): "parquet" or "arrow" (Arrow IPC / Feather v2).
+            run_date (Optional[str]): Value of the run_date partition. Defaults to today's date (UTC).
+        """
+        if file_format not in self.FORMATS:
+            raise ValueError(f"Unknown dataset format '{file_format}', expected one of {self.FORMATS}")
+        try:
+            import pyarrow  # noqa: F401  Fail at construction rather than on the first batch
+        except ImportError:
+            raise ImportError("pyarrow is required for Parquet and Arrow exports (pip install pyarrow)")
+        self.path = path
+        self.file_format = file_format
+        self.run_date = run_date or datetime.datetime.now(datetime.timezone.utc).date().isoformat()
+
+    def write_batch(self, tables: Dict[str, List[dict]]) -> None:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        columns = None
+        values = {}
+        tickers = []
+        for ticker, breakout_data in tables.items():
+            for row in breakout_data:
+                if columns is None:
+                    columns = list(row.keys())
+                    values = {column: [] for column in columns}
+                for column in columns:
+                    values[column].append(row.get(column))
+                tickers.append(ticker)
+        if not tickers:
+            return
+
+        arrays = {column: pa.array(column_values, type=self._column_type(column)) for column, column_values in values.items()}
+        arrays["run_date"] = pa.array([self.run_date] * len(tickers), type=pa.string())
+        arrays["ticker"] = pa.array(tickers, type=pa.string())
+        table = pa.table(arrays)
+
+        extension = "parquet" if self.file_format == "parquet" else "arrow"
+        with metrics.span("dataset_write_batch"):
+            ds.write_dataset(
+                table,
+                self.path,
+                format="parquet" if self.file_format == "parquet" else "ipc",
+                partitioning=["run_date", "ticker"],
+                partitioning_flavor="hive",
+                basename_template=f"part-{uuid.uuid4().hex}-{{i}}.{extension}",
+                existing_data_behavior="overwrite_or_ignore",
+            )
+
+    @staticmethod
+    def _column_type(column: str):
+        import pyarrow as pa
+
+        if column in TEXT_COLUMNS:
+            return pa.string()
+        if column in INTEGER_COLUMNS:
+            return pa.int64()
+        return pa.float64()
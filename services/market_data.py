@@ -0,0 +1,48 @@
+# services/market_data.py
+
+from abc import ABC, abstractmethod
+from typing import Iterator, Tuple
+
+from config.constants import BREAKOUT_CHUNK_SIZE
+from models.price_series import PriceSeries
+from models.stock_summary import StockSummary
+
+class MarketDataProvider(ABC):
+    """
+    Source of OHLCV history for `get_breakout_points`, the app and the batch tools.
+
+    Subclasses implement `fetch_stock_data`. `fetch_stock_data_chunks` sorts the fetched series
+    and slices it by default; providers that can read a series piece by piece override it.
+    """
+    @abstractmethod
+    def fetch_stock_data(self, ticker: str, interval: str = "1d") -> StockSummary:
+        """
+        Fetches the bars and currency of a ticker.
+
+        Parameters:
+            ticker (str): The stock ticker symbol (e.g., "TSLA").
+            interval (str): The bar interval (e.g., "1d").
+
+        Returns:
+            StockSummary: An object containing metadata and stock data.
+
+        Raises:
+            ValueError: If the provider has no data for the ticker.
+        """
+
+    def fetch_stock_data_chunks(
+        self, ticker: str, interval: str = "1d", chunk_size: int = BREAKOUT_CHUNK_SIZE
+    ) -> Tuple[str, Iterator[PriceSeries]]:
+        """
+        Fetches stock data for the given ticker and returns it as consecutive date-sorted chunks.
+
+        Parameters:
+            ticker (str): The stock ticker symbol (e.g., "TSLA").
+            interval (str): The time interval for the data (default: "1d").
+            chunk_size (int): Maximum number of bars per chunk.
+
+        Returns:
+            Tuple[str, Iterator[PriceSeries]]: The currency and the chunks.
+        """
+        stock_summary = self.fetch_stock_data(ticker, interval)
+        return stock_summary.currency, stock_summary.price_series.sorted().chunks(chunk_size)
@@ -0,0 +1,246 @@
+# services/rate_limiter.py
+
+import contextlib
+import contextvars
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+from config.constants import (
+    API_RATE_LIMIT_PER_SECOND,
+    API_RATE_BURST,
+    API_MONTHLY_QUOTA,
+    RATE_LIMIT_BACKEND,
+    RATE_LIMIT_PATH,
+)
+from utils import metrics
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 1
+
+# How long a waiting interactive caller keeps batch callers in other processes from taking tokens
+_INTERACTIVE_LEASE_SECONDS = 1.0
+
+_current_priority = contextvars.ContextVar("rate_limit_priority", default=PRIORITY_BATCH)
+
+class QuotaExceededError(RuntimeError):
+    """
+    Raised when the monthly API request quota has been used up.
+    """
+
+@contextlib.contextmanager
+def request_priority(priority: int):
+    """
+    Sets the priority of the API requests made by the current thread or task within the block.
+
+    Parameters:
+        priority (int): PRIORITY_INTERACTIVE or PRIORITY_BATCH.
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+def _current_month() -> str:
+    return time.strftime("%Y-%m", time.gmtime())
+
+class _MemoryBackend:
+    """
+    Keeps the limiter state in this process.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state = None
+
+    def update(self, step: Callable[[Optional[dict]], Tuple[dict, object]]):
+        with self._lock:
+            self._state, result = step(self._state)
+            return result
+
+class _SQLiteBackend:
+    """
+    Keeps the limiter state in a SQLite database, so every process using the file shares it.
+    """
+    def __init__(self, path: str, name: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.name = name
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=30, isolation_level=None)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits ("
+                "name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL, "
+                "month TEXT NOT NULL, used INTEGER NOT NULL, interactive_until REAL NOT NULL)"
+            )
+
+    def update(self, step: Callable[[Optional[dict]], Tuple[dict, object]]):
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock up front, making the read-modify-write atomic across processes
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._connection.execute(
+                    "SELECT tokens, updated_at, month, used, interactive_until FROM rate_limits WHERE name = ?",
+                    (self.name,),
+                ).fetchone()
+                state = dict(zip(("tokens", "updated_at", "month", "used", "interactive_until"), row)) if row else None
+                state, result = step(state)
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO rate_limits (name, tokens, updated_at, month, used, interactive_until) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (self.name, state["tokens"], state["updated_at"], state["month"], state["used"], state["interactive_until"]),
+                )
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            return result
+
+class RateLimiter:
+    """
+    Token-bucket limiter for API requests with a monthly quota and two priority classes.
+
+    Tokens refill continuously at `rate` per second up to `burst`, so a sustained stream of
+    requests runs at exactly `rate` per second. While an interactive request is waiting, batch
+    requests do not take tokens; within a process this is tracked directly, and across
+    processes through a short lease stored with the shared state.
+    """
+    def __init__(
+        self,
+        rate: float = API_RATE_LIMIT_PER_SECOND,
+        burst: float = API_RATE_BURST,
+        monthly_quota: Optional[int] = API_MONTHLY_QUOTA,
+        path: Optional[str] = None,
+        name: str = "rapidapi",
+    ):
+        """
+        Initializes the RateLimiter.
+
+        Parameters:
+            rate (float): Requests allowed per second.
+            burst (float): Maximum number of requests that can be made back to back.
+            monthly_quota (Optional[int]): Requests allowed per calendar month (UTC), or None for no quota.
+            path (Optional[str]): SQLite file holding the state shared by several processes.
+                Defaults to keeping the state in this process only.
+            name (str): Key of the bucket in the SQLite file.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.monthly_quota = monthly_quota
+        self._backend = _SQLiteBackend(path, name) if path else _MemoryBackend()
+        self._waiting_lock = threading.Lock()
+        self._interactive_waiting = 0
+
+    def acquire(self, priority: Optional[int] = None) -> None:
+        """
+        Blocks until a request may be sent and records it against the quota.
+
+        Parameters:
+            priority (Optional[int]): PRIORITY_INTERACTIVE or PRIORITY_BATCH. Defaults to the
+                priority set with `request_priority`, or PRIORITY_BATCH.
+
+        Raises:
+            QuotaExceededError: If the monthly quota has been used up.
+        """
+        if priority is None:
+            priority = _current_priority.get()
+        interactive = priority == PRIORITY_INTERACTIVE
+
+        if interactive:
+            with self._waiting_lock:
+                self._interactive_waiting += 1
+        try:
+            waited = False
+            start = time.monotonic()
+            while True:
+                blocked = not interactive and self._interactive_waiting > 0
+                granted, delay = self._backend.update(lambda state: self._take(state, interactive, blocked))
+                if granted:
+                    break
+                if delay is None:
+                    raise QuotaExceededError(f"Monthly API quota of {self.monthly_quota} requests exhausted")
+                waited = True
+                time.sleep(delay)
+        finally:
+            if interactive:
+                with self._waiting_lock:
+                    self._interactive_waiting -= 1
+
+        if waited:
+            metrics.incr("rate_limit_waits")
+            metrics.incr("rate_limit_wait_ms", int((time.monotonic() - start) * 1000))
+
+    def remaining_quota(self) -> Optional[int]:
+        """
+        Returns the number of requests left in this month's quota, or None if there is no quota.
+        """
+        if self.monthly_quota is None:
+            return None
+        used = self._backend.update(lambda state: self._refresh(state, time.time()))["used"]
+        return max(0, self.monthly_quota - used)
+
+    def _refresh(self, state: Optional[dict], now: float) -> Tuple[dict, dict]:
+        """
+        Refills the bucket up to `now` and starts a new quota month if needed.
+        """
+        month = _current_month()
+        if state is None:
+            state = {"tokens": self.burst, "updated_at": now, "month": month, "used": 0, "interactive_until": 0.0}
+        else:
+            elapsed = max(0.0, now - state["updated_at"])
+            state = dict(state, tokens=min(self.burst, state["tokens"] + elapsed * self.rate), updated_at=now)
+            if state["month"] != month:
+                state.update(month=month, used=0)
+        return state, state
+
+    def _take(self, state: Optional[dict], interactive: bool, blocked: bool) -> Tuple[dict, Tuple[bool, Optional[float]]]:
+        """
+        Takes a token if one is available to this caller.
+
+        Returns:
+            tuple: (new state, (granted, delay)), where delay is the time to wait before trying
+            again, or None if the monthly quota is exhausted.
+        """
+        now = time.time()
+        state, _ = self._refresh(state, now)
+
+        if self.monthly_quota is not None and state["used"] >= self.monthly_quota:
+            return state, (False, None)
+        if not interactive and (blocked or now < state["interactive_until"]):
+            return state, (False, 1 / self.rate)
+        if state["tokens"] >= 1:
+            state["tokens"] -= 1
+            state["used"] += 1
+            if interactive:
+                state["interactive_until"] = 0.0
+            return state, (True, 0.0)
+
+        delay = (1 - state["tokens"]) / self.rate
+        if interactive:
+            state["interactive_until"] = now + delay + _INTERACTIVE_LEASE_SECONDS
+        return state, (False, delay)
+
+_shared_rate_limiter = None
+_shared_rate_limiter_lock = threading.Lock()
+
+def get_shared_rate_limiter() -> RateLimiter:
+    """
+    Returns the process-wide API rate limiter, creating it on first use.
+
+    With RATE_LIMIT_BACKEND set to "sqlite", the limiter state lives in RATE_LIMIT_PATH and is
+    shared with every other process (app, exports, CLIs) using the same file.
+
+    Returns:
+        RateLimiter: The limiter used by every YahooFinanceService that is not given its own.
+    """
+    global _shared_rate_limiter
+    with _shared_rate_limiter_lock:
+        if _shared_rate_limiter is None:
+            path = RATE_LIMIT_PATH if RATE_LIMIT_BACKEND == "sqlite" else None
+            _shared_rate_limiter = RateLimiter(path=path)
+        return _shared_rate_limiter
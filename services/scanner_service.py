@@ -0,0 +1,96 @@
+# services/scanner_service.py
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+import numpy as np
+from utils.rolling import breakout_mask
+from config.constants import VOLUME_THRESHOLD, PRICE_THRESHOLD, VOLUME_WINDOW, SCANNER_MAX_WORKERS
+
+class UniverseScanner:
+    """
+    Finds breakouts on the most recent bars across a universe of tickers.
+    """
+    def __init__(
+        self,
+        data_service,
+        volume_threshold: float = VOLUME_THRESHOLD,
+        price_threshold: float = PRICE_THRESHOLD,
+        volume_window: int = VOLUME_WINDOW,
+        max_workers: int = SCANNER_MAX_WORKERS
+    ):
+        """
+        Initializes the UniverseScanner.
+
+        Parameters:
+            data_service (CachedMarketDataProvider): Cached data service; only the tail of each
+                cached series is read, and stale series are refreshed first.
+            volume_threshold (float): Multiple of the average volume a breakout bar must exceed.
+            price_threshold (float): Minimum close change versus the previous bar for a breakout.
+            volume_window (int): Number of preceding bars averaged for the volume condition.
+            max_workers (int): Number of tickers scanned at the same time.
+        """
+        self.data_service = data_service
+        self.volume_threshold = volume_threshold
+        self.price_threshold = price_threshold
+        self.volume_window = volume_window
+        self.max_workers = max_workers
+
+    def scan(self, tickers: List[str], interval: str = "1d", last_bars: int = 1) -> Tuple[List[dict], Dict[str, str]]:
+        """
+        Evaluates the newest `last_bars` bars of every ticker against its trailing volume window.
+
+        Parameters:
+            tickers (List[str]): Tickers to scan.
+            interval (str): The bar interval (e.g., "1d").
+            last_bars (int): Number of most recent bars to check per ticker.
+
+        Returns:
+            tuple: (breakout rows ranked by volume ratio then price change, mapping of ticker to error message).
+        """
+        rows = []
+        errors = {}
+
+        def scan_one(ticker):
+            try:
+                return ticker, self._scan_ticker(ticker, interval, last_bars), None
+            except Exception as e:
+                return ticker, [], str(e)
+
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            for ticker, ticker_rows, error in executor.map(scan_one, tickers):
+                if error is not None:
+                    errors[ticker] = error
+                rows.extend(ticker_rows)
+
+        rows.sort(key=lambda row: (row["Volume Ratio"], row["Change (%)"]), reverse=True)
+        return rows, errors
+
+    def _scan_ticker(self, ticker: str, interval: str, last_bars: int) -> List[dict]:
+        """
+        Checks the newest bars of one ticker, using the same conditions as BreakoutService.
+        """
+        window = self.volume_window
+        stock_summary = self.data_service.fetch_stock_data(ticker, interval, last_bars=window + last_bars)
+        series = stock_summary.price_series
+        if len(series) <= window:
+            return []
+
+        mask, avg_volumes, price_changes = breakout_mask(
+            series.volumes, series.closes, self.volume_threshold, self.price_threshold, window
+        )
+
+        rows = []
+        for position in np.flatnonzero(mask).tolist():
+            i = position + window
+            avg_volume = avg_volumes[position].item()
+            rows.append({
+                "Ticker": ticker,
+                "Date": series.dates[i],
+                "Close": series.closes[i].item(),
+                "Change (%)": round(price_changes[position].item() * 100, 2),
+                "Volume": series.volumes[i].item(),
+                "Average Volume": avg_volume,
+                "Volume Ratio": round(series.volumes[i].item() / avg_volume, 2) if avg_volume else float("inf"),
+                "Currency": stock_summary.currency,
+            })
+        return rows
@@ -1,38 +1,128 @@
-from config.settings import api_key
-from config.constants import VOLUME_THRESHOLD, PRICE_THRESHOLD
+from config.settings import get_api_key
+from config.constants import (
+    VOLUME_THRESHOLD, PRICE_THRESHOLD, BREAKOUT_ENGINE, VOLUME_WINDOW, HOLDING_PERIOD, FORWARD_HORIZONS,
+    BREAKOUT_CHUNK_SIZE, MARKET_DATA_PROVIDER, MARKET_DATA_FILES, MARKET_DATA_FILES_INTERVAL,
+)
+from services.market_data import MarketDataProvider
 from services.yahoo_finance_service import YahooFinanceService
+from services.bar_cache import BarCache, CachedMarketDataProvider
 from services.breakout_service import BreakoutService
-from utils.data_processing import DataProcessor
 from models.breakout import Breakout
 from models.stock_summary import StockSummary
-from typing import List
+from concurrent.futures import Executor
+from typing import List, Optional
+from utils.single_flight import SingleFlight
+import threading
 
-def get_breakout_points(ticker: str) -> List[Breakout]:
+_default_provider = None
+_default_provider_lock = threading.Lock()
+_breakout_flights = SingleFlight()
+
+def create_provider(name: str = MARKET_DATA_PROVIDER) -> MarketDataProvider:
+    """
+    Creates the market data provider selected by `name`.
+
+    Parameters:
+        name (str): "yahoo" for the RapidAPI endpoint, or "files" for the local files in MARKET_DATA_FILES.
+
+    Returns:
+        MarketDataProvider: The provider, without the bar cache in front of it.
+    """
+    if name == "yahoo":
+        return YahooFinanceService(get_api_key())
+    if name == "files":
+        from services.bulk_file_provider import BulkFileProvider
+        return BulkFileProvider(MARKET_DATA_FILES, interval=MARKET_DATA_FILES_INTERVAL)
+    raise ValueError(f"Unknown market data provider '{name}', expected 'yahoo' or 'files'")
+
+def get_default_provider() -> CachedMarketDataProvider:
+    """
+    Returns the process-wide market data provider, creating it on first use.
+
+    Returns:
+        CachedMarketDataProvider: The provider selected by MARKET_DATA_PROVIDER, behind the on-disk bar cache.
+    """
+    global _default_provider
+    with _default_provider_lock:
+        if _default_provider is None:
+            _default_provider = CachedMarketDataProvider(create_provider(), BarCache())
+        return _default_provider
+
+def _breakout_key(ticker: str, provider: MarketDataProvider, interval: str) -> tuple:
+    """
+    Identifies breakout computations that produce the same result.
+    """
+    return (
+        ticker, interval, provider, VOLUME_THRESHOLD, PRICE_THRESHOLD, BREAKOUT_ENGINE,
+        VOLUME_WINDOW, HOLDING_PERIOD, FORWARD_HORIZONS,
+    )
+
+def get_breakout_points(
+    ticker: str,
+    provider: Optional[MarketDataProvider] = None,
+    interval: str = "1d"
+) -> List[Breakout]:
     """
     Fetches stock data, processes it, and identifies breakout points.
 
+    Concurrent calls for the same ticker, interval and provider share one computation.
+    The bars are processed in chunks of BREAKOUT_CHUNK_SIZE, so long intraday histories
+    are never analyzed in one piece.
+
     Parameters:
         ticker (str): The stock ticker to analyze (e.g., "NVDA").
+        provider (Optional[MarketDataProvider]): Provider used to fetch data. Defaults to the shared cached instance.
+        interval (str): The bar interval to analyze (e.g., "1d" or "5m").
 
     Returns:
         List[Breakout]: A list of breakout objects.
     """
-    try:
-        # Fetch stock summary (includes metadata and stock data)
-        yahoo_service = YahooFinanceService(api_key)
-        stock_summary = yahoo_service.fetch_stock_data(ticker)
+    provider = provider or get_default_provider()
+    breakouts = _breakout_flights.do(
+        _breakout_key(ticker, provider, interval),
+        lambda: _compute_breakout_points(ticker, provider, interval),
+    )
+    return list(breakouts)
 
-        # Extract stock data and sort it
-        sorted_stock_data = DataProcessor.sort_stock_data_by_date(stock_summary.stock_data)
+async def get_breakout_points_async(
+    ticker: str,
+    provider: Optional[MarketDataProvider] = None,
+    interval: str = "1d",
+    executor: Optional[Executor] = None
+) -> List[Breakout]:
+    """
+    Awaitable version of `get_breakout_points`; the work runs in `executor` (the event loop's
+    default executor if None) and is shared with concurrent callers from threads or other tasks.
+    """
+    provider = provider or get_default_provider()
+    breakouts = await _breakout_flights.do_async(
+        _breakout_key(ticker, provider, interval),
+        lambda: _compute_breakout_points(ticker, provider, interval),
+        executor=executor,
+    )
+    return list(breakouts)
 
-        # Identify breakout points
+def _compute_breakout_points(ticker: str, provider: MarketDataProvider, interval: str) -> List[Breakout]:
+    """
+    Runs the fetch and breakout detection for `get_breakout_points`.
+    """
+    try:
+        # Breakout parameters (windows and horizons are converted to bars of the interval)
         breakout_service = BreakoutService(
             volume_threshold=VOLUME_THRESHOLD,
-            price_threshold=PRICE_THRESHOLD
+            price_threshold=PRICE_THRESHOLD,
+            engine=BREAKOUT_ENGINE,
+            volume_window=VOLUME_WINDOW,
+            holding_period=HOLDING_PERIOD,
+            horizons=FORWARD_HORIZONS,
+            interval=interval
         )
-        breakouts = breakout_service.identify_breakouts(sorted_stock_data, stock_summary.currency)
 
-        return breakouts
+        # Fetch the stock data as date-sorted chunks
+        currency, chunks = provider.fetch_stock_data_chunks(ticker, interval, BREAKOUT_CHUNK_SIZE)
+
+        # Identify breakout points
+        return list(breakout_service.iter_breakouts(chunks, currency))
 
     except ValueError as e:
         raise ValueError(f"Failed to fetch or process data for {ticker}: {e}")
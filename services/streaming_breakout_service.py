@@ -0,0 +1,176 @@
+# services/streaming_breakout_service.py
+
+from collections import deque
+from typing import Iterable, List, Optional, Tuple
+from models.stock_data import StockData
+from models.breakout import Breakout
+from config.constants import VOLUME_WINDOW, HOLDING_PERIOD
+
+class StreamingBreakoutDetector:
+    """
+    Incremental breakout detector that processes one bar at a time.
+
+    It keeps only the rolling volume window, the previous close and the breakouts still
+    waiting for their forward price, so each update is O(1) and its state can be saved
+    and restored between runs. It finds the same breakouts as BreakoutService.
+    """
+    def __init__(
+        self,
+        volume_threshold: float,
+        price_threshold: float,
+        currency: str = "Unknown Currency",
+        volume_window: int = VOLUME_WINDOW,
+        holding_period: int = HOLDING_PERIOD
+    ):
+        """
+        Initializes the StreamingBreakoutDetector.
+
+        Parameters:
+            volume_threshold (float): Multiple of the average volume a breakout bar must exceed.
+            price_threshold (float): Minimum close change versus the previous bar for a breakout.
+            currency (str): Currency attached to emitted breakouts.
+            volume_window (int): Number of preceding bars averaged for the volume condition.
+            holding_period (int): Number of bars after the breakout used for the return.
+        """
+        self.volume_threshold = volume_threshold
+        self.price_threshold = price_threshold
+        self.currency = currency
+        self.volume_window = volume_window
+        self.holding_period = holding_period
+
+        self.bar_count = 0
+        self.previous_close: Optional[float] = None
+        self.last_utc_date: Optional[int] = None
+        self._volumes = deque(maxlen=volume_window)
+        self._volume_sum = 0
+        self._pending = deque()  # (bar index, Breakout) awaiting their forward price, oldest first
+
+    @property
+    def pending_breakouts(self) -> List[Breakout]:
+        return [breakout for _, breakout in self._pending]
+
+    def seed(self, stock_data: Iterable[StockData]) -> List[Breakout]:
+        """
+        Feeds historical bars through the detector.
+
+        Parameters:
+            stock_data (Iterable[StockData]): Bars sorted by date.
+
+        Returns:
+            List[Breakout]: Every breakout found in the history, in date order.
+        """
+        breakouts = []
+        for stock in stock_data:
+            new_breakouts, _ = self.update(stock)
+            breakouts.extend(new_breakouts)
+        return breakouts
+
+    def update(self, stock: StockData) -> Tuple[List[Breakout], List[Breakout]]:
+        """
+        Processes the next bar.
+
+        Parameters:
+            stock (StockData): The new bar; it must be newer than every bar seen so far.
+
+        Returns:
+            tuple: (new breakouts on this bar, earlier breakouts whose forward return this bar completed).
+        """
+        if self.last_utc_date is not None and stock.utc_date <= self.last_utc_date:
+            raise ValueError(f"Bar {stock.date} is not newer than the last processed bar")
+
+        index = self.bar_count
+        resolved = []
+        while self._pending and self._pending[0][0] + self.holding_period == index:
+            _, breakout = self._pending.popleft()
+            return_pct = ((stock.close_price - breakout.breakout_day_close) / breakout.breakout_day_close) * 100
+            breakout.resolve(stock.date, stock.close_price, return_pct)
+            resolved.append(breakout)
+
+        new_breakouts = []
+        if len(self._volumes) == self.volume_window:
+            avg_volume = self._volume_sum / self.volume_window
+            if self._is_breakout(stock, avg_volume):
+                breakout = Breakout(
+                    breakout_date=stock.date,
+                    breakout_day_open=stock.open_price,
+                    breakout_day_close=stock.close_price,
+                    volume_on_breakout_day=stock.volume,
+                    avg_volume=avg_volume,
+                    currency=self.currency,
+                    breakout_utc_date=stock.utc_date,
+                )
+                self._pending.append((index, breakout))
+                new_breakouts.append(breakout)
+            self._volume_sum -= self._volumes[0]
+
+        self._volumes.append(stock.volume)
+        self._volume_sum += stock.volume
+        self.previous_close = stock.close_price
+        self.last_utc_date = stock.utc_date
+        self.bar_count += 1
+
+        return new_breakouts, resolved
+
+    def _is_breakout(self, stock: StockData, avg_volume: float) -> bool:
+        """
+        Applies the same conditions as BreakoutService._is_breakout.
+        """
+        previous_close = self.previous_close
+        if previous_close is None or previous_close == 0:
+            return False
+
+        return (
+            stock.volume > self.volume_threshold * avg_volume and
+            (stock.close_price - previous_close) / previous_close >= self.price_threshold
+        )
+
+    def to_state(self) -> dict:
+        """
+        Returns the detector state as a JSON-serializable dictionary.
+        """
+        return {
+            "volume_threshold": self.volume_threshold,
+            "price_threshold": self.price_threshold,
+            "currency": self.currency,
+            "volume_window": self.volume_window,
+            "holding_period": self.holding_period,
+            "bar_count": self.bar_count,
+            "previous_close": self.previous_close,
+            "last_utc_date": self.last_utc_date,
+            "volumes": list(self._volumes),
+            "pending": [
+                {
+                    "index": index,
+                    "breakout_date": breakout.breakout_date,
+                    "breakout_day_open": breakout.breakout_day_open,
+                    "breakout_day_close": breakout.breakout_day_close,
+                    "volume_on_breakout_day": breakout.volume_on_breakout_day,
+                    "avg_volume": breakout.avg_volume,
+                    "breakout_utc_date": breakout.breakout_utc_date,
+                }
+                for index, breakout in self._pending
+            ],
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "StreamingBreakoutDetector":
+        """
+        Restores a detector from a dictionary produced by `to_state`.
+        """
+        detector = cls(
+            volume_threshold=state["volume_threshold"],
+            price_threshold=state["price_threshold"],
+            currency=state["currency"],
+            volume_window=state["volume_window"],
+            holding_period=state["holding_period"],
+        )
+        detector.bar_count = state["bar_count"]
+        detector.previous_close = state["previous_close"]
+        detector.last_utc_date = state["last_utc_date"]
+        detector._volumes.extend(state["volumes"])
+        detector._volume_sum = sum(detector._volumes)
+        for entry in state["pending"]:
+            entry = dict(entry)
+            index = entry.pop("index")
+            detector._pending.append((index, Breakout(currency=detector.currency, **entry)))
+        return detector
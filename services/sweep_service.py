@@ -0,0 +1,134 @@
+# services/sweep_service.py
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from models.price_series import PriceSeries
+from utils.rolling import trailing_mean, day_over_day_change, forward_returns
+
+def _sweep_series(closes: np.ndarray, volumes: np.ndarray, grid: dict) -> dict:
+    """
+    Evaluates every parameter combination over one ticker's series.
+
+    Rolling volume means are computed once per window, price masks once per threshold
+    and forward returns once per holding period, then combined per combination.
+
+    Parameters:
+        closes (np.ndarray): Close prices sorted by date.
+        volumes (np.ndarray): Volumes sorted by date.
+        grid (dict): Lists of "volume_thresholds", "price_thresholds", "volume_windows" and "holding_periods".
+
+    Returns:
+        dict: Maps (volume_threshold, price_threshold, volume_window, holding_period) to a tuple of
+        (breakout count, array of forward returns for breakouts with enough future bars).
+    """
+    n = len(closes)
+    results = {}
+    price_changes, valid = day_over_day_change(closes)
+    price_masks = {pt: valid & (price_changes >= pt) for pt in grid["price_thresholds"]}
+    returns_by_horizon = {h: forward_returns(closes, h) for h in grid["holding_periods"]}
+
+    for window in grid["volume_windows"]:
+        if n <= window:
+            continue
+        avg_volumes = trailing_mean(volumes, window)
+        for vt in grid["volume_thresholds"]:
+            volume_mask = volumes[window:] > vt * avg_volumes
+            for pt in grid["price_thresholds"]:
+                indices = np.flatnonzero(volume_mask & price_masks[pt][window:]) + window
+                for horizon in grid["holding_periods"]:
+                    returns = returns_by_horizon[horizon][indices]
+                    results[(vt, pt, window, horizon)] = (len(indices), returns[~np.isnan(returns)])
+
+    return results
+
+def _sweep_task(args: tuple) -> dict:
+    return _sweep_series(*args)
+
+class BreakoutSweep:
+    """
+    Grid search over breakout thresholds, volume windows and holding periods.
+    """
+    def __init__(
+        self,
+        volume_thresholds: Sequence[float],
+        price_thresholds: Sequence[float],
+        volume_windows: Sequence[int],
+        holding_periods: Sequence[int],
+        max_workers: Optional[int] = None
+    ):
+        """
+        Initializes the BreakoutSweep.
+
+        Parameters:
+            volume_thresholds (Sequence[float]): Volume multipliers to evaluate.
+            price_thresholds (Sequence[float]): Minimum day-over-day close changes to evaluate.
+            volume_windows (Sequence[int]): Volume lookback windows, in bars.
+            holding_periods (Sequence[int]): Holding horizons, in bars.
+            max_workers (Optional[int]): Worker processes to spread tickers over. Defaults to the CPU count;
+                1 runs everything in the calling process.
+        """
+        self.grid = {
+            "volume_thresholds": list(volume_thresholds),
+            "price_thresholds": list(price_thresholds),
+            "volume_windows": list(volume_windows),
+            "holding_periods": list(holding_periods),
+        }
+        self.max_workers = max_workers
+
+    def combinations(self) -> List[tuple]:
+        return list(product(
+            self.grid["volume_thresholds"],
+            self.grid["price_thresholds"],
+            self.grid["volume_windows"],
+            self.grid["holding_periods"],
+        ))
+
+    def run(self, series_by_ticker: Dict[str, PriceSeries]) -> List[dict]:
+        """
+        Evaluates every combination over all tickers and summarizes the results.
+
+        Parameters:
+            series_by_ticker (Dict[str, PriceSeries]): Price series per ticker, sorted by date.
+
+        Returns:
+            List[dict]: One summary row per combination.
+        """
+        tasks = [(series.closes, series.volumes, self.grid) for series in series_by_ticker.values()]
+
+        if self.max_workers == 1 or len(tasks) <= 1:
+            per_ticker = [_sweep_task(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                per_ticker = list(executor.map(_sweep_task, tasks, chunksize=max(1, len(tasks) // 64)))
+
+        return [self._summarize(combination, per_ticker) for combination in self.combinations()]
+
+    @staticmethod
+    def _summarize(combination: tuple, per_ticker: List[dict]) -> dict:
+        """
+        Aggregates one combination's breakouts and returns across tickers.
+        """
+        hits = 0
+        returns = []
+        for results in per_ticker:
+            if combination in results:
+                count, ticker_returns = results[combination]
+                hits += count
+                returns.append(ticker_returns)
+        returns = np.concatenate(returns) if returns else np.empty(0)
+
+        volume_threshold, price_threshold, volume_window, holding_period = combination
+        has_returns = len(returns) > 0
+        return {
+            "Volume Threshold": volume_threshold,
+            "Price Threshold": price_threshold,
+            "Volume Window": volume_window,
+            "Holding Period": holding_period,
+            "Breakouts": hits,
+            "Breakouts With Return": len(returns),
+            "Mean Return (%)": round(float(np.mean(returns)), 2) if has_returns else None,
+            "Median Return (%)": round(float(np.median(returns)), 2) if has_returns else None,
+            "Win Rate (%)": round(float(np.mean(returns > 0)) * 100, 2) if has_returns else None,
+        }
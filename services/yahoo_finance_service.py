@@ -1,31 +1,96 @@
 # services/yahoo_finance_service.py
 
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
 import requests
-from config.constants import YAHOO_FINANCE_BASE_URL, YAHOO_FINANCE_HOST
+from requests.adapters import HTTPAdapter
+from config.constants import (
+    YAHOO_FINANCE_BASE_URL,
+    YAHOO_FINANCE_HOST,
+    REQUEST_TIMEOUT,
+    MAX_RETRIES,
+    BACKOFF_FACTOR,
+    MAX_BACKOFF,
+    RETRY_STATUS_CODES,
+    HTTP_POOL_SIZE,
+)
 from models.stock_summary import StockSummary
+from services.market_data import MarketDataProvider
+from services.rate_limiter import RateLimiter, get_shared_rate_limiter
+from utils import metrics
+from utils.json_ingest import ingest_history_response
+from utils.single_flight import SingleFlight
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
 
-class YahooFinanceService:
+def get_shared_session() -> requests.Session:
     """
-    Service to interact with the Yahoo Finance API for fetching stock data.
+    Returns the process-wide pooled HTTP session, creating it on first use.
+
+    Returns:
+        requests.Session: A session whose connections are reused across requests.
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _shared_session = session
+        return _shared_session
+
+class YahooFinanceService(MarketDataProvider):
     """
-    def __init__(self, api_key: str):
+    Market data provider fetching stock data from the Yahoo Finance API on RapidAPI.
+    """
+    def __init__(
+        self,
+        api_key: str,
+        session: Optional[requests.Session] = None,
+        timeout=REQUEST_TIMEOUT,
+        max_retries: int = MAX_RETRIES,
+        backoff_factor: float = BACKOFF_FACTOR,
+        base_url: str = YAHOO_FINANCE_BASE_URL,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
         """
         Initializes the YahooFinanceService.
 
         Parameters:
             api_key (str): API key for authenticating Yahoo Finance API requests.
+            session (Optional[requests.Session]): HTTP session to use. Defaults to the shared pooled session.
+            timeout: Per-request timeout in seconds, or a (connect, read) tuple.
+            max_retries (int): Maximum number of retries for throttled, failed or timed-out requests.
+            backoff_factor (float): Base delay in seconds for exponential backoff between retries.
+            base_url (str): History endpoint URL; override to point at a local stub server.
+            rate_limiter (Optional[RateLimiter]): Limiter every request (including retries) waits on.
+                Defaults to the shared limiter, so all instances share the plan's rate and quota.
         """
         self.api_key = api_key
-        self.base_url = YAHOO_FINANCE_BASE_URL
+        self.base_url = base_url
         self.headers = {
             "x-rapidapi-host": YAHOO_FINANCE_HOST,
             "x-rapidapi-key": self.api_key,
         }
+        self.session = session if session is not None else get_shared_session()
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.rate_limiter = rate_limiter if rate_limiter is not None else get_shared_rate_limiter()
+        self._flights = SingleFlight()
 
     def fetch_stock_data(self, ticker: str, interval: str = "1d") -> StockSummary:
         """
         Fetches stock data and metadata for the given ticker.
 
+        Concurrent calls for the same ticker and interval share one API request.
+
         Parameters:
             ticker (str): The stock ticker symbol (e.g., "TSLA").
             interval (str): The time interval for the data (default: "1d").
@@ -33,24 +98,105 @@ class YahooFinanceService:
         Returns:
             StockSummary: An object containing metadata and stock data.
         """
+        return self._flights.do((ticker, interval), lambda: self._fetch_stock_data(ticker, interval))
+
+    def _fetch_stock_data(self, ticker: str, interval: str) -> StockSummary:
+        """
+        Sends the history request for `fetch_stock_data` and decodes the response.
+        """
         params = {
             "symbol": ticker,
             "interval": interval,
             "diffandsplits": "false",
         }
 
-        # Make the API request
-        response = requests.get(self.base_url, headers=self.headers, params=params)
-        response.raise_for_status()  # Raise an exception for HTTP errors
+        with metrics.span("fetch_stock_data"):
+            # Make the API request
+            response = self._get(params, stream=True)
+            response.raise_for_status()  # Raise an exception for HTTP errors
 
-        # Parse the JSON response
-        data = response.json()
+            # Decode the JSON response straight into typed columns
+            with metrics.span("json_decode"):
+                header, price_series = ingest_history_response(response, streamed=True)
 
-        # Handle API-specific errors or missing data
-        if not data.get("success", True):
-            raise ValueError(f"Error fetching data for ticker {ticker}: {data.get('message', 'Unknown error')}")
+            # Handle API-specific errors or missing data
+            if not header.get("success", True):
+                raise ValueError(f"Error fetching data for ticker {ticker}: {header.get('message', 'Unknown error')}")
 
-        # Map the response to the StockSummary object
-        stock_summary = StockSummary.from_api_response(data)
+            # Map the response to the StockSummary object
+            stock_summary = StockSummary.from_price_series(header, price_series)
 
         return stock_summary
+
+    def _get(self, params: dict, stream: bool = False) -> requests.Response:
+        """
+        Sends a GET request, retrying throttled, server-error and connection failures.
+
+        Parameters:
+            params (dict): Query parameters for the request.
+            stream (bool): If True, leave the body unread so it can be decoded incrementally.
+
+        Returns:
+            requests.Response: The last response received.
+        """
+        attempt = 0
+        while True:
+            if attempt:
+                metrics.incr("api_retries")
+            self.rate_limiter.acquire()
+            metrics.incr("api_requests")
+            try:
+                response = self.session.get(
+                    self.base_url, headers=self.headers, params=params, timeout=self.timeout, stream=stream
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(self._backoff_delay(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                return response
+
+            delay = self._retry_after_delay(response)
+            if delay is None:
+                delay = self._backoff_delay(attempt)
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Computes an exponential backoff delay with full jitter.
+
+        Parameters:
+            attempt (int): Zero-based retry attempt number.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        return random.uniform(0, min(MAX_BACKOFF, self.backoff_factor * (2 ** attempt)))
+
+    @staticmethod
+    def _retry_after_delay(response: requests.Response) -> Optional[float]:
+        """
+        Reads the delay requested by a `Retry-After` header, if any.
+
+        Parameters:
+            response (requests.Response): The throttled response.
+
+        Returns:
+            Optional[float]: Delay in seconds, or None if the header is missing or invalid.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return None
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(MAX_BACKOFF, max(0.0, delay))
@@ -0,0 +1,71 @@
+import argparse
+from export_stock_analysis import read_tickers
+from services.bar_cache import BarCache
+from services.sweep_service import BreakoutSweep
+from config.constants import VOLUME_THRESHOLD, PRICE_THRESHOLD, VOLUME_WINDOW, HOLDING_PERIOD
+
+def _parse_list(value: str, cast) -> list:
+    return [cast(item) for item in value.split(",") if item.strip()]
+
+def load_price_series(tickers: list, interval: str, refresh: bool) -> dict:
+    """
+    Loads cached price series for the given tickers, optionally refreshing them from the API first.
+
+    Parameters:
+        tickers (list): List of stock tickers.
+        interval (str): The bar interval (e.g., "1d").
+        refresh (bool): If True, fetch missing or stale tickers before reading the cache.
+
+    Returns:
+        dict: Mapping of ticker to PriceSeries, for tickers with cached data.
+    """
+    bar_cache = BarCache()
+    if refresh:
+        from services.stock_analysis_service import get_default_provider
+        data_service = get_default_provider()
+
+    series_by_ticker = {}
+    for ticker in tickers:
+        try:
+            stock_summary = data_service.fetch_stock_data(ticker, interval) if refresh else bar_cache.get(ticker, interval)
+        except Exception as e:
+            print(f"Error loading ticker {ticker}: {e}")
+            continue
+        if stock_summary is None:
+            print(f"No cached data for {ticker}, skipping (use --refresh to fetch it).")
+            continue
+        series_by_ticker[ticker] = stock_summary.price_series
+    return series_by_ticker
+
+def main():
+    parser = argparse.ArgumentParser(description="Grid search over breakout parameters using cached price data.")
+    parser.add_argument("--tickers", default="tickers.txt", help="File with one ticker per line.")
+    parser.add_argument("--interval", default="1d", help="Bar interval of the cached data.")
+    parser.add_argument("--volume-thresholds", default=str(VOLUME_THRESHOLD), help="Comma-separated volume multipliers.")
+    parser.add_argument("--price-thresholds", default=str(PRICE_THRESHOLD), help="Comma-separated price change thresholds.")
+    parser.add_argument("--windows", default=str(VOLUME_WINDOW), help="Comma-separated volume lookback windows, in bars.")
+    parser.add_argument("--horizons", default=str(HOLDING_PERIOD), help="Comma-separated holding periods, in bars.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument("--refresh", action="store_true", help="Fetch missing or stale tickers before sweeping.")
+    parser.add_argument("--output", help="Optional CSV file to write the summary table to.")
+    args = parser.parse_args()
+
+    series_by_ticker = load_price_series(read_tickers(args.tickers), args.interval, args.refresh)
+
+    sweep = BreakoutSweep(
+        volume_thresholds=_parse_list(args.volume_thresholds, float),
+        price_thresholds=_parse_list(args.price_thresholds, float),
+        volume_windows=_parse_list(args.windows, int),
+        holding_periods=_parse_list(args.horizons, int),
+        max_workers=args.workers,
+    )
+    import pandas as pd
+
+    summary = pd.DataFrame(sweep.run(series_by_ticker))
+
+    print(summary.to_string(index=False))
+    if args.output:
+        summary.to_csv(args.output, index=False)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import math
+import statistics
+
+import numpy as np
+import pytest
+
+from services.backtest_service import ENTRY, EXIT, MARK, BacktestService
+
+def simulate(events, calendar, interval="1d", initial_capital=1000.0, position_size=1.0, max_positions=10):
+    return BacktestService(interval=interval)._simulate(
+        iter(sorted(events)), np.array(calendar, dtype=np.int64), initial_capital, position_size, max_positions
+    )
+
+def test_positions_are_sized_from_current_equity():
+    result = simulate([
+        (1, ENTRY, 0, 10.0),  # 50% of 1000 -> 50 shares
+        (1, ENTRY, 1, 20.0),  # 50% of 1000, limited to the 500 cash left -> 25 shares
+        (2, MARK, 0, 12.0),
+        (2, EXIT, 1, 22.0),
+        (3, EXIT, 0, 9.0),
+    ], [1, 2, 3], position_size=0.5)
+
+    assert result.equity.tolist() == [1000.0, 1150.0, 1000.0]
+    assert result.trade_returns == pytest.approx([10.0, -10.0])
+    assert result.signals == 2
+
+def test_entries_beyond_max_positions_are_skipped():
+    result = simulate([
+        (1, ENTRY, 0, 10.0),
+        (1, ENTRY, 1, 10.0),  # Skipped, trade 0 is still open
+        (2, EXIT, 0, 11.0),
+        (2, ENTRY, 2, 10.0),  # Taken, exits free their slot before entries on the same date
+        (3, EXIT, 1, 20.0),
+        (3, EXIT, 2, 12.0),
+    ], [1, 2, 3], max_positions=1)
+
+    assert result.signals == 3
+    assert result.trade_returns == pytest.approx([10.0, 20.0])
+    assert result.equity[-1] == pytest.approx(1320.0)
+
+def test_equity_is_carried_forward_over_dates_without_events():
+    result = simulate([(2, ENTRY, 0, 10.0), (4, EXIT, 0, 12.0)], [1, 2, 3, 4, 5])
+
+    assert result.equity.tolist() == [1000.0, 1000.0, 1000.0, 1200.0, 1200.0]
+
+def test_drawdown_and_sharpe_of_a_known_series():
+    events = [(1, ENTRY, 0, 10.0), (2, MARK, 0, 11.0), (3, MARK, 0, 9.9), (4, EXIT, 0, 12.1)]
+    result = simulate(events, [1, 2, 3, 4])
+
+    assert result.equity.tolist() == pytest.approx([1000.0, 1100.0, 990.0, 1210.0])
+    # From the 1100 peak down to 990
+    assert result.max_drawdown == pytest.approx(-10.0)
+    returns = [0.1, -0.1, 2 / 9]
+    assert result.sharpe_ratio == pytest.approx(statistics.mean(returns) / statistics.stdev(returns) * math.sqrt(252))
+    assert result.total_return == pytest.approx(21.0)
+
+@pytest.mark.parametrize("interval, periods", [("1d", 252), ("1h", 1638), ("1wk", 50.4), ("1mo", 12)])
+def test_sharpe_is_annualized_by_bars_per_year_of_the_interval(interval, periods):
+    result = simulate([(1, ENTRY, 0, 10.0), (2, EXIT, 0, 11.0)], [1, 2], interval=interval)
+
+    assert result.periods_per_year == pytest.approx(periods)
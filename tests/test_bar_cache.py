@@ -0,0 +1,35 @@
+import numpy as np
+
+from models.price_series import PriceSeries
+from models.stock_summary import StockSummary
+from services.bar_cache import BarCache
+
+DAY = 86_400
+
+def make_summary(first_day: int, days: int, close: float = 100.0) -> StockSummary:
+    utc_dates = (first_day + np.arange(days, dtype=np.int64)) * DAY
+    dates = np.datetime_as_string(utc_dates.astype("datetime64[s]"), unit="D").astype(object)
+    closes = np.full(days, close)
+    return StockSummary("USD", PriceSeries(dates, utc_dates, closes, closes, closes, closes, np.full(days, 1_000)))
+
+def test_merge_appends_only_from_the_last_cached_bar(tmp_path):
+    cache = BarCache(str(tmp_path / "bars.sqlite3"))
+    cache.merge("AAA", "1d", make_summary(100, 10))
+
+    written = cache.merge("AAA", "1d", make_summary(90, 30, close=200.0))
+
+    series = cache.get("AAA", "1d").price_series
+    assert written == 11  # The last cached bar and the 10 newer ones
+    assert series.utc_dates.tolist() == ((100 + np.arange(20)) * DAY).tolist()
+    assert series.closes.tolist() == [100.0] * 9 + [200.0] * 11
+
+def test_merge_upserts_every_bar_when_not_append_only(tmp_path):
+    cache = BarCache(str(tmp_path / "bars.sqlite3"))
+    cache.merge("AAA", "1d", make_summary(100, 10))
+
+    written = cache.merge("AAA", "1d", make_summary(50, 55, close=200.0), append_only=False)
+
+    series = cache.get("AAA", "1d").price_series
+    assert written == 55
+    assert series.utc_dates.tolist() == ((50 + np.arange(60)) * DAY).tolist()
+    assert series.closes.tolist() == [200.0] * 55 + [100.0] * 5
@@ -0,0 +1,98 @@
+import asyncio
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from benchmarks.fake_rapidapi import FakeRapidAPIServer
+from benchmarks.synthetic_data import generate_payload
+from services.breakout_api import BreakoutAPIServer
+from services.rate_limiter import RateLimiter
+from services.yahoo_finance_service import YahooFinanceService
+
+def _payload(symbol, interval):
+    if symbol == "MISSING":
+        return {"success": False, "message": "Symbol not found"}
+    return generate_payload(symbol, 2, interval, seed=len(symbol))
+
+@pytest.fixture(scope="module")
+def api_url():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    with FakeRapidAPIServer(_payload) as stub:
+        unlimited = RateLimiter(rate=1e9, burst=1e9, monthly_quota=None)
+        yahoo_service = YahooFinanceService("test-key", base_url=stub.url, rate_limiter=unlimited)
+        server = BreakoutAPIServer(yahoo_service, port=0)
+        thread.start()
+        asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+        try:
+            yield f"http://{server.host}:{server.port}"
+        finally:
+            asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+def _request(url, body=None):
+    """
+    Sends a GET, or a POST when `body` is given, and returns (status, decoded JSON body).
+    """
+    data = body if body is None or isinstance(body, bytes) else json.dumps(body).encode()
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=data), timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+def test_health(api_url):
+    status, body = _request(f"{api_url}/health")
+
+    assert status == 200
+    assert body["status"] == "ok"
+
+def test_single_ticker(api_url):
+    status, body = _request(f"{api_url}/breakouts/aapl?interval=1d")
+
+    assert status == 200
+    assert body["ticker"] == "AAPL"
+    assert body["interval"] == "1d"
+    assert isinstance(body["breakouts"], list)
+
+def test_single_ticker_the_provider_rejects_is_a_404(api_url):
+    status, body = _request(f"{api_url}/breakouts/MISSING")
+
+    assert status == 404
+    assert "Symbol not found" in body["error"]
+
+def test_batch_reports_failed_tickers_in_errors(api_url):
+    status, body = _request(f"{api_url}/breakouts/batch", {"tickers": ["AAPL", "msft", "MISSING"], "interval": "1d"})
+
+    assert status == 200
+    assert body["interval"] == "1d"
+    assert sorted(body["results"]) == ["AAPL", "MSFT"]
+    assert list(body["errors"]) == ["MISSING"]
+    assert "Symbol not found" in body["errors"]["MISSING"]
+
+@pytest.mark.parametrize("body", [
+    b"not json",
+    [],
+    {"tickers": []},
+    {"tickers": "AAPL"},
+    {"tickers": ["AAPL", 1]},
+    {"tickers": ["AAPL"], "interval": ["1d"]},
+    {"tickers": ["AAPL"], "interval": 1},
+    {"tickers": ["AAPL"], "interval": "2d"},
+    {"tickers": ["AA PL"]},
+])
+def test_bad_batch_requests_are_400(api_url, body):
+    status, response = _request(f"{api_url}/breakouts/batch", body)
+
+    assert status == 400
+    assert response["error"]
+
+def test_unknown_interval_on_single_endpoint_is_400(api_url):
+    status, _ = _request(f"{api_url}/breakouts/AAPL?interval=2d")
+
+    assert status == 400
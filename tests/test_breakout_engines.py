@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from models.price_series import PriceSeries
+from services.breakout_service import BreakoutService
+
+DAY = 86_400
+
+def make_series(closes, volumes) -> PriceSeries:
+    """
+    Builds a daily series from closes and volumes; opens, highs and lows are derived from the closes.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    n = len(closes)
+    utc_dates = 1_700_000_000 + np.arange(n, dtype=np.int64) * DAY
+    dates = np.datetime_as_string(utc_dates.astype("datetime64[s]"), unit="D").astype(object)
+    return PriceSeries(dates, utc_dates, closes * 0.99, closes * 1.01, closes * 0.98, closes, volumes)
+
+def random_series(n: int, seed: int) -> PriceSeries:
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.03, n)))
+    volumes = rng.integers(1_000, 5_000, n)
+    volumes[rng.random(n) < 0.05] *= 4  # Volume spikes, so breakouts actually occur
+    return make_series(closes, volumes)
+
+def run_engines(series: PriceSeries, **kwargs) -> tuple:
+    """
+    Returns the breakouts of both engines as lists of (bar timestamp, dictionary).
+    """
+    params = dict(volume_threshold=2.0, price_threshold=0.02, **kwargs)
+    loop = BreakoutService(engine="loop", **params).identify_breakouts(series, "USD")
+    vectorized = BreakoutService(engine="vectorized", **params).identify_breakouts(series, "USD")
+    return (
+        [(b.breakout_utc_date, b.to_dict()) for b in loop],
+        [(b.breakout_utc_date, b.to_dict()) for b in vectorized],
+    )
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("volume_window, holding_period", [(20, 20), (5, 3), (1, 1), (50, 100)])
+def test_engines_match_on_random_series(seed, volume_window, holding_period):
+    loop, vectorized = run_engines(
+        random_series(1_000, seed), volume_window=volume_window, holding_period=holding_period
+    )
+    assert loop, "the synthetic series should contain breakouts"
+    assert loop == vectorized
+
+@pytest.mark.parametrize("n", [0, 1, 19, 20, 21])
+def test_engines_match_during_warm_up(n):
+    # Bar 20 is the first one with a full volume window before it
+    closes = 100 * 1.1 ** np.arange(n)
+    volumes = np.full(n, 1_000)
+    volumes[19:] = 10_000_000
+    loop, vectorized = run_engines(make_series(closes, volumes), volume_window=20)
+    assert loop == vectorized
+    assert len(loop) == (1 if n == 21 else 0)
+
+@pytest.mark.parametrize("volume, close, expected", [
+    (2_000, 102.0, 0),  # Volume equal to the threshold does not qualify
+    (2_001, 102.0, 1),  # A price change equal to the threshold does
+    (2_001, 101.99, 0),
+])
+def test_engines_match_on_threshold_boundaries(volume, close, expected):
+    window = 5
+    series = make_series([100.0] * window + [close], [1_000] * window + [volume])
+    loop, vectorized = run_engines(series, volume_window=window, holding_period=1)
+    assert loop == vectorized
+    assert len(loop) == expected
+
+def test_engines_match_with_zero_previous_close():
+    window = 3
+    closes = [10.0, 10.0, 10.0, 0.0, 50.0, 0.0, 0.0, 60.0, 70.0]
+    volumes = [1_000, 1_000, 1_000, 1_000, 50_000, 50_000, 1_000, 90_000, 300_000]
+    loop, vectorized = run_engines(make_series(closes, volumes), volume_window=window, holding_period=1)
+    assert loop == vectorized
+    # Bars following a zero close never qualify, whatever their volume
+    assert [b["Breakout Day Close"] for _, b in loop] == [70.0]
+
+def test_engines_match_when_holding_period_runs_past_end():
+    window, holding = 5, 10
+    closes = [100.0] * window + [110.0, 111.0, 112.0]
+    volumes = [1_000] * window + [5_000, 1_000, 1_000]
+    series = make_series(closes, volumes)
+    loop, vectorized = run_engines(series, volume_window=window, holding_period=holding)
+    assert loop == vectorized
+    assert len(loop) == 1
+    utc_date, breakout = loop[0]
+    assert utc_date == series.utc_dates[window]
+    assert breakout["Return (%)"] is None
+    assert breakout["Price After Holding Period"] is None
+
+def test_engines_match_with_horizons():
+    loop, vectorized = run_engines(random_series(500, 7), horizons=(1, 5, 400))
+    assert loop == vectorized
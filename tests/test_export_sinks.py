@@ -0,0 +1,31 @@
+import csv
+
+import pytest
+
+from services.export_sinks import CsvSink
+
+def read_rows(path) -> list:
+    with open(path, newline="") as f:
+        return list(csv.reader(f))
+
+def test_csv_sink_appends_without_repeating_the_header(tmp_path):
+    path = str(tmp_path / "breakouts.csv")
+    for run_date in ("2024-01-01", "2024-01-02"):
+        with CsvSink(path, run_date=run_date) as sink:
+            sink.write_batch({"AAA": [{"Breakout Date": "2023-12-29", "Return (%)": None}]})
+
+    assert read_rows(path) == [
+        ["Run Date", "Ticker", "Breakout Date", "Return (%)"],
+        ["2024-01-01", "AAA", "2023-12-29", ""],
+        ["2024-01-02", "AAA", "2023-12-29", ""],
+    ]
+
+def test_csv_sink_rejects_a_file_with_other_columns(tmp_path):
+    path = str(tmp_path / "breakouts.csv")
+    with CsvSink(path) as sink:
+        sink.write_batch({"AAA": [{"Breakout Date": "2023-12-29", "Return 5 Bars (%)": 1.0}]})
+
+    with CsvSink(path) as sink:
+        with pytest.raises(ValueError, match="different columns"):
+            sink.write_batch({"AAA": [{"Breakout Date": "2023-12-29", "Return 10 Bars (%)": 1.0}]})
+    assert len(read_rows(path)) == 2
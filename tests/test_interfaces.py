@@ -0,0 +1,21 @@
+import pytest
+
+from services.export_sinks import ExportSink
+from services.market_data import MarketDataProvider
+from utils.metrics import MetricsSink
+
+@pytest.mark.parametrize("base", [ExportSink, MarketDataProvider, MetricsSink])
+def test_incomplete_implementations_fail_on_instantiation(base):
+    class Incomplete(base):
+        pass
+
+    with pytest.raises(TypeError, match="abstract"):
+        Incomplete()
+
+def test_metrics_sink_needs_both_record_methods():
+    class SpansOnly(MetricsSink):
+        def record_span(self, name, seconds):
+            pass
+
+    with pytest.raises(TypeError, match="record_counter"):
+        SpansOnly()
@@ -0,0 +1,89 @@
+import io
+import json
+
+import pytest
+
+from utils import json_ingest
+
+def make_body(bars: list) -> bytes:
+    return json.dumps({
+        "meta": {"currency": "USD", "symbol": "AAA"},
+        "body": {str(bar.get("date_utc", i)): bar for i, bar in enumerate(bars)},
+    }).encode()
+
+def make_bar(day: int, **overrides) -> dict:
+    bar = {
+        "date": f"2024-01-{day:02d}", "date_utc": 1_704_067_200 + day * 86_400,
+        "open": 10.0 + day, "high": 11.0 + day, "low": 9.0 + day, "close": 10.5 + day, "volume": 1_000 * day,
+    }
+    bar.update(overrides)
+    return bar
+
+class FakeResponse:
+    """
+    Minimal `requests.Response` stand-in that records whether its body was streamed or read whole.
+    """
+    def __init__(self, content: bytes):
+        self._content = content
+        self.raw = io.BytesIO(content)
+        self.headers = {"Content-Length": str(len(content))}
+        self.read_whole = False
+        self.closed = False
+
+    @property
+    def content(self) -> bytes:
+        self.read_whole = True
+        return self._content
+
+    def close(self):
+        self.closed = True
+
+requires_ijson = pytest.mark.skipif(json_ingest.ijson is None, reason="ijson is not installed")
+
+@requires_ijson
+def test_stream_matches_whole_document_decoding():
+    content = make_body([make_bar(day) for day in (3, 1, 2)])
+    stream_header, stream_series = json_ingest.ingest_history_stream(io.BytesIO(content))
+    bytes_header, bytes_series = json_ingest.ingest_history_bytes(content)
+
+    assert stream_header == bytes_header
+    for stream_column, bytes_column in zip(stream_series.columns(), bytes_series.columns()):
+        assert stream_column.tolist() == bytes_column.tolist()
+
+@requires_ijson
+@pytest.mark.parametrize("field", ["date", "date_utc", "open", "volume"])
+def test_stream_rejects_a_bar_missing_a_field(field):
+    # The bar with the missing field follows a complete one, whose value must not be reused
+    second = make_bar(2)
+    del second[field]
+    with pytest.raises(ValueError, match=field):
+        json_ingest.ingest_history_stream(io.BytesIO(make_body([make_bar(1), second])))
+
+@requires_ijson
+def test_stream_rejects_a_null_field():
+    with pytest.raises(ValueError, match="close"):
+        json_ingest.ingest_history_stream(io.BytesIO(make_body([make_bar(1), make_bar(2, close=None)])))
+
+@requires_ijson
+def test_response_is_streamed_only_when_requested_with_stream(monkeypatch):
+    monkeypatch.setattr(json_ingest, "orjson", None)
+    content = make_body([make_bar(1), make_bar(2)])
+
+    streamed = FakeResponse(content)
+    _, series = json_ingest.ingest_history_response(streamed, streamed=True)
+    assert len(series) == 2
+    assert not streamed.read_whole and streamed.closed
+
+    buffered = FakeResponse(content)
+    _, series = json_ingest.ingest_history_response(buffered)
+    assert len(series) == 2
+    assert buffered.read_whole
+
+def test_small_streamed_response_is_decoded_whole_with_orjson(monkeypatch):
+    monkeypatch.setattr(json_ingest, "orjson", json)  # Any module with `loads` stands in
+    content = make_body([make_bar(1)])
+
+    response = FakeResponse(content)
+    _, series = json_ingest.ingest_history_response(response, streamed=True, min_bytes=len(content) + 1)
+    assert len(series) == 1
+    assert response.read_whole
@@ -0,0 +1,60 @@
+import threading
+import time
+
+import pytest
+
+from services.rate_limiter import PRIORITY_BATCH, PRIORITY_INTERACTIVE, QuotaExceededError, RateLimiter
+
+def test_sustained_rate_after_the_burst():
+    limiter = RateLimiter(rate=50, burst=1, monthly_quota=None)
+
+    start = time.monotonic()
+    for _ in range(11):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    # The first request uses the burst token, the other 10 wait 1/50 s each
+    assert 0.18 <= elapsed < 1.0
+
+def test_quota_exhaustion():
+    limiter = RateLimiter(rate=1e6, burst=1e6, monthly_quota=3)
+    for _ in range(3):
+        limiter.acquire()
+
+    assert limiter.remaining_quota() == 0
+    with pytest.raises(QuotaExceededError):
+        limiter.acquire()
+
+def test_interactive_request_is_served_before_waiting_batch_requests():
+    limiter = RateLimiter(rate=10, burst=1, monthly_quota=None)
+    limiter.acquire()  # Empty the bucket, so the next token comes 0.1 s from now
+    order = []
+    order_lock = threading.Lock()
+
+    def acquire(priority, label):
+        limiter.acquire(priority)
+        with order_lock:
+            order.append(label)
+
+    batch = [threading.Thread(target=acquire, args=(PRIORITY_BATCH, "batch")) for _ in range(2)]
+    for thread in batch:
+        thread.start()
+    time.sleep(0.02)  # Let the batch callers start waiting for the token
+    acquire(PRIORITY_INTERACTIVE, "interactive")
+    for thread in batch:
+        thread.join()
+
+    assert order == ["interactive", "batch", "batch"]
+
+def test_limiters_sharing_a_file_share_one_budget(tmp_path):
+    path = str(tmp_path / "rate_limits.sqlite3")
+    first = RateLimiter(rate=1e6, burst=1e6, monthly_quota=3, path=path)
+    second = RateLimiter(rate=1e6, burst=1e6, monthly_quota=3, path=path)
+
+    first.acquire()
+    second.acquire()
+    first.acquire()
+
+    assert second.remaining_quota() == 0
+    with pytest.raises(QuotaExceededError):
+        second.acquire()
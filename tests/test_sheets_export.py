@@ -0,0 +1,134 @@
+import json
+
+import pytest
+
+import export_stock_analysis
+from benchmarks.fake_sheets import FakeSheetsClient
+from export_stock_analysis import GoogleSheetsManager, process_tickers
+from models.breakout import MISSING_VALUE
+from models.processing_report import OUTCOME_WRITTEN, OUTCOME_EMPTY, OUTCOME_UNCHANGED
+
+def make_rows(count: int, start: int = 0) -> list:
+    return [
+        {"Breakout Date": f"2024-01-{day + 1:02d}", "Breakout Day Close": 100.0 + day, "Return (%)": None if day % 2 else 1.5}
+        for day in range(start, start + count)
+    ]
+
+def expected_values(rows: list) -> list:
+    if not rows:
+        return [["No breakout points found."]]
+    return [list(rows[0])] + [[MISSING_VALUE if value is None else value for value in row.values()] for row in rows]
+
+@pytest.fixture
+def manager():
+    return GoogleSheetsManager(None, "test", client=FakeSheetsClient(), snapshot_path=None)
+
+def test_batch_uses_one_batch_update_and_one_values_update(manager):
+    tables = {"AAA": make_rows(3), "BBB": make_rows(250), "CCC": []}
+    manager.write_worksheets(tables)
+
+    spreadsheet = manager.spreadsheet
+    assert spreadsheet.calls["batch_update"] == 1
+    assert spreadsheet.calls["values_batch_update"] == 1
+    assert spreadsheet.calls["worksheets"] == 1
+    for ticker, rows in tables.items():
+        assert spreadsheet.get_values(ticker) == expected_values(rows)
+
+def test_new_sheets_are_sized_to_their_table(manager):
+    manager.write_worksheets({"AAA": make_rows(3), "BBB": make_rows(250), "CCC": []})
+
+    spreadsheet = manager.spreadsheet
+    assert spreadsheet.grid_size("AAA") == (4, 3)
+    assert spreadsheet.grid_size("BBB") == (251, 3)
+    assert spreadsheet.grid_size("CCC") == (1, 1)
+
+def test_existing_sheets_are_resized_cleared_and_rewritten(manager):
+    manager.write_worksheets({"AAA": make_rows(10), "BBB": make_rows(2)})
+    manager.write_worksheets({"AAA": make_rows(4, start=20), "BBB": make_rows(30)})
+
+    spreadsheet = manager.spreadsheet
+    assert spreadsheet.calls["batch_update"] == 2
+    assert spreadsheet.calls["values_batch_update"] == 2
+    assert spreadsheet.calls["worksheets"] == 1  # Sheet ids are fetched once and kept up to date
+    assert spreadsheet.grid_size("AAA") == (5, 3)
+    assert spreadsheet.get_values("AAA") == expected_values(make_rows(4, start=20))
+    assert spreadsheet.grid_size("BBB") == (31, 3)
+    assert spreadsheet.get_values("BBB") == expected_values(make_rows(30))
+
+def test_ticker_titles_are_quoted(manager):
+    manager.write_worksheets({"BRK'B": make_rows(1), "BF.B": make_rows(2)})
+    assert manager.spreadsheet.get_values("BRK'B") == expected_values(make_rows(1))
+    assert manager.spreadsheet.get_values("BF.B") == expected_values(make_rows(2))
+
+def test_process_tickers_writes_one_batch_per_batch_size(manager, monkeypatch):
+    tables = {f"T{i}": make_rows(i) for i in range(5)}
+    monkeypatch.setattr(export_stock_analysis, "_fetch_breakout_rows", lambda ticker, interval: tables[ticker])
+
+    report = process_tickers(list(tables), manager, max_workers=2, batch_size=2)
+
+    spreadsheet = manager.spreadsheet
+    assert len(report.succeeded) == 5
+    assert spreadsheet.calls["batch_update"] == 3
+    assert spreadsheet.calls["values_batch_update"] == 3
+    for ticker, rows in tables.items():
+        assert spreadsheet.get_values(ticker) == expected_values(rows)
+
+def test_process_tickers_reports_outcomes_without_printing(tmp_path, monkeypatch, capsys):
+    tables = {"AAA": make_rows(3), "BBB": []}
+    monkeypatch.setattr(export_stock_analysis, "_fetch_breakout_rows", lambda ticker, interval: tables[ticker])
+    client = FakeSheetsClient()
+    snapshot_path = str(tmp_path / "snapshots.json")
+
+    first = process_tickers(list(tables), GoogleSheetsManager(None, "test", client=client, snapshot_path=snapshot_path))
+    second = process_tickers(list(tables), GoogleSheetsManager(None, "test", client=client, snapshot_path=snapshot_path))
+
+    assert {r.ticker: r.outcome for r in first.results} == {"AAA": OUTCOME_WRITTEN, "BBB": OUTCOME_EMPTY}
+    assert {r.ticker: r.outcome for r in second.results} == {"AAA": OUTCOME_UNCHANGED, "BBB": OUTCOME_UNCHANGED}
+    assert capsys.readouterr().out == ""
+
+def test_snapshots_patch_changed_and_appended_rows_only(tmp_path):
+    client = FakeSheetsClient()
+    snapshot_path = str(tmp_path / "snapshots.json")
+    manager = GoogleSheetsManager(None, "test", client=client, snapshot_path=snapshot_path)
+    manager.write_worksheets({"AAA": make_rows(50)})
+    manager.flush()
+
+    rows = make_rows(53)
+    rows[10]["Breakout Day Close"] = 0.0
+    manager = GoogleSheetsManager(None, "test", client=client, snapshot_path=snapshot_path)
+    client.spreadsheet.cells_written = 0
+    manager.write_worksheets({"AAA": rows})
+
+    spreadsheet = client.spreadsheet
+    assert spreadsheet.calls["batch_update"] == 2 and spreadsheet.calls["values_batch_update"] == 2
+    assert spreadsheet.cells_written == 4 * 3  # Row 10 and the three appended rows
+    assert spreadsheet.grid_size("AAA") == (54, 3)
+    assert spreadsheet.get_values("AAA") == expected_values(rows)
+
+def test_snapshots_hold_row_hashes_and_are_saved_on_flush(tmp_path):
+    snapshot_path = tmp_path / "snapshots.json"
+    manager = GoogleSheetsManager(None, "test", client=FakeSheetsClient(), snapshot_path=str(snapshot_path))
+    manager.write_worksheets({"AAA": make_rows(3)})
+    manager.write_worksheets({"BBB": make_rows(2)})
+    assert not snapshot_path.exists()
+
+    manager.flush()
+    snapshot = json.loads(snapshot_path.read_text())["test"]
+    assert set(snapshot) == {"AAA", "BBB"}
+    assert len(snapshot["AAA"]["rows"]) == 4 and "2024-01-01" not in snapshot_path.read_text()
+
+def test_process_tickers_saves_snapshots_when_a_batch_fails(tmp_path, monkeypatch):
+    snapshot_path = tmp_path / "snapshots.json"
+    manager = GoogleSheetsManager(None, "test", client=FakeSheetsClient(), snapshot_path=str(snapshot_path))
+    written = []
+
+    def fetch(ticker, interval):
+        if written:
+            raise KeyboardInterrupt  # Aborts the run after the first batch
+        written.append(ticker)
+        return make_rows(2)
+
+    monkeypatch.setattr(export_stock_analysis, "_fetch_breakout_rows", fetch)
+    with pytest.raises(KeyboardInterrupt):
+        process_tickers(["AAA", "BBB"], manager, max_workers=1, batch_size=1)
+    assert set(json.loads(snapshot_path.read_text())["test"]) == {"AAA"}
@@ -0,0 +1,55 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils.single_flight import SingleFlight
+
+def test_do_async_shares_one_computation():
+    flights = SingleFlight()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        threading.Event().wait(0.05)
+        return len(calls)
+
+    async def main():
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            return await asyncio.gather(*(flights.do_async("key", compute, executor=executor) for _ in range(5)))
+
+    assert asyncio.run(main()) == [1] * 5
+
+def test_do_async_with_shut_down_executor_does_not_leave_the_key_in_flight():
+    flights = SingleFlight()
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.shutdown()
+
+    async def main():
+        with pytest.raises(RuntimeError):
+            await flights.do_async("key", lambda: "stale", executor=executor)
+        # A later caller starts a new computation instead of waiting forever on the failed one
+        with ThreadPoolExecutor(max_workers=1) as live_executor:
+            return await asyncio.wait_for(flights.do_async("key", lambda: "fresh", executor=live_executor), 5)
+
+    assert asyncio.run(main()) == "fresh"
+    assert not flights._calls
+
+def test_do_async_fails_callers_when_queued_work_is_cancelled():
+    flights = SingleFlight()
+    executor = ThreadPoolExecutor(max_workers=1)
+    release = threading.Event()
+
+    async def main():
+        executor.submit(release.wait, 5)  # Occupies the only worker, so the computation stays queued
+        waiting = asyncio.ensure_future(flights.do_async("key", lambda: "never", executor=executor))
+        await asyncio.sleep(0.05)
+        executor.shutdown(wait=False, cancel_futures=True)
+        release.set()
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(waiting, 5)
+        with ThreadPoolExecutor(max_workers=1) as live_executor:
+            return await asyncio.wait_for(flights.do_async("key", lambda: "fresh", executor=live_executor), 5)
+
+    assert asyncio.run(main()) == "fresh"
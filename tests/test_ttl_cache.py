@@ -0,0 +1,45 @@
+import pytest
+
+from utils.ttl_cache import TTLCache
+
+def test_evicts_least_recently_used_entries_beyond_max_entries():
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1 and cache.get("b") is None and cache.get("c") == 3
+
+def test_evicts_least_recently_used_entries_beyond_max_size():
+    cache = TTLCache(max_entries=100, ttl_seconds=60, max_size=10, sizeof=len)
+    cache.set("a", [0] * 4)
+    cache.set("b", [0] * 4)
+    cache.get("a")
+    cache.set("c", [0] * 4)
+    assert cache.get("b") is None
+    assert cache.size == 8 and len(cache) == 2
+
+    cache.set("a", [0] * 2)  # Replacing an entry releases its old size
+    assert cache.size == 6
+
+def test_value_larger_than_max_size_is_not_kept():
+    cache = TTLCache(max_entries=100, ttl_seconds=60, max_size=10, sizeof=len)
+    cache.set("a", [0] * 5)
+    cache.set("huge", [0] * 11)
+    assert cache.get("huge") is None
+    assert cache.get("a") == [0] * 5
+    assert cache.size == 5
+
+def test_expired_and_invalidated_entries_release_their_size():
+    cache = TTLCache(max_entries=100, ttl_seconds=0, max_size=10, sizeof=len)
+    cache.set("a", [0] * 5)
+    assert cache.get("a") is None and cache.size == 0
+
+    cache = TTLCache(max_entries=100, ttl_seconds=60, max_size=10, sizeof=len)
+    cache.set("a", [0] * 5)
+    cache.invalidate("a")
+    assert cache.size == 0
+
+def test_max_size_requires_sizeof():
+    with pytest.raises(ValueError):
+        TTLCache(max_entries=1, ttl_seconds=1, max_size=1)
@@ -1,8 +1,13 @@
 # utils/data_processing.py
 
-import pandas as pd
-from typing import List
+from typing import List, TYPE_CHECKING
 from models.stock_data import StockData
+from models.price_series import PriceSeries
+from models.breakout import Breakout, TEXT_COLUMNS, INTEGER_COLUMNS, UTC_DATE_COLUMN
+from utils import metrics
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class DataProcessor:
     @staticmethod
@@ -14,12 +19,15 @@ class DataProcessor:
             stock_data (List[StockData]): List of StockData objects.
 
         Returns:
-            List[StockData]: Sorted list of StockData objects.
+            List[StockData]: Sorted list of StockData objects, or a sorted PriceSeries if one was given.
         """
-        return sorted(stock_data, key=lambda x: x.utc_date)
+        with metrics.span("sort_stock_data_by_date"):
+            if isinstance(stock_data, PriceSeries):
+                return stock_data.sorted()
+            return sorted(stock_data, key=lambda x: x.utc_date)
 
     @staticmethod
-    def format_breakout_data(breakout_rows: List[dict]) -> pd.DataFrame:
+    def format_breakout_data(breakout_rows: List[dict]) -> "pd.DataFrame":
         """
         Formats breakout data into a DataFrame.
 
@@ -29,13 +37,46 @@ class DataProcessor:
         Returns:
             pd.DataFrame: A DataFrame containing the breakout data.
         """
+        import pandas as pd
+
         if not breakout_rows:
             return pd.DataFrame()  # Return an empty DataFrame if no data is provided
 
         return pd.DataFrame(breakout_rows)
 
     @staticmethod
-    def convert_stock_data_to_dataframe(stock_data: List[StockData]) -> pd.DataFrame:
+    def breakouts_to_dataframe(breakouts: List[Breakout], include_utc_date: bool = False) -> "pd.DataFrame":
+        """
+        Converts breakouts to a DataFrame with typed columns, in one pass per column.
+
+        Prices, volumes and returns are numeric columns, with NaN where a value is not known yet.
+
+        Parameters:
+            breakouts (List[Breakout]): Breakouts that share the same horizons.
+            include_utc_date (bool): If True, add the UTC timestamp of each breakout bar as a
+                final UTC_DATE_COLUMN column (int64), e.g. to locate the bars in a PriceSeries.
+
+        Returns:
+            pd.DataFrame: A DataFrame with the same columns as `Breakout.to_dict`.
+        """
+        import numpy as np
+        import pandas as pd
+
+        if not breakouts:
+            return pd.DataFrame()
+
+        columns = Breakout.to_columns(breakouts)
+        for name, values in columns.items():
+            if name in INTEGER_COLUMNS:
+                columns[name] = np.array(values, dtype=np.int64)
+            elif name not in TEXT_COLUMNS:
+                columns[name] = np.array(values, dtype=np.float64)  # None becomes NaN
+        if include_utc_date:
+            columns[UTC_DATE_COLUMN] = np.array([b.breakout_utc_date for b in breakouts], dtype=np.int64)
+        return pd.DataFrame(columns, copy=False)
+
+    @staticmethod
+    def convert_stock_data_to_dataframe(stock_data: List[StockData]) -> "pd.DataFrame":
         """
         Converts a list of StockData objects to a Pandas DataFrame.
 
@@ -45,9 +86,14 @@ class DataProcessor:
         Returns:
             pd.DataFrame: A DataFrame containing the stock data.
         """
+        import pandas as pd
+
         if not stock_data:
             return pd.DataFrame()  # Return an empty DataFrame if no data is provided
 
+        if isinstance(stock_data, PriceSeries):
+            return stock_data.to_dataframe()
+
         return pd.DataFrame([{
             "Date": stock.date,
             "UTC Date": stock.utc_date,
@@ -0,0 +1,60 @@
+# utils/downsampling.py
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+def min_max_indices(values: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Picks the positions of the lowest and highest value in each of `max_points // 2`
+    equal-width buckets, so spikes and dips survive downsampling.
+
+    Parameters:
+        values (np.ndarray): Series to downsample.
+        max_points (int): Maximum number of positions returned.
+
+    Returns:
+        np.ndarray: Sorted, unique positions into `values`.
+    """
+    n = len(values)
+    buckets = max(1, max_points // 2)
+    if n <= max_points:
+        return np.arange(n)
+
+    # Pad to whole buckets with NaN; only the last bucket is padded, and never entirely
+    size = -(-n // buckets)
+    buckets = -(-n // size)
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = values
+    padded = padded.reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    lows = offsets + np.nanargmin(padded, axis=1)
+    highs = offsets + np.nanargmax(padded, axis=1)
+    return np.unique(np.concatenate((lows, highs)))
+
+def downsample_indices(
+    columns: Sequence[np.ndarray],
+    max_points: int,
+    keep: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Chooses the positions to plot for one or more aligned series: the min/max positions of
+    each column (sharing the point budget), the first and last position, and every position in `keep`.
+
+    Parameters:
+        columns (Sequence[np.ndarray]): Aligned series, e.g. closes and volumes.
+        max_points (int): Point budget, before adding the positions in `keep`.
+        keep (Optional[np.ndarray]): Positions that must always be included (e.g. breakout bars).
+
+    Returns:
+        np.ndarray: Sorted, unique positions.
+    """
+    n = len(columns[0]) if columns else 0
+    if n == 0:
+        return np.arange(0)
+    per_column = max(2, max_points // len(columns))
+    parts = [min_max_indices(np.asarray(column, dtype=np.float64), per_column) for column in columns]
+    parts.append(np.array([0, n - 1]))
+    if keep is not None:
+        parts.append(np.asarray(keep, dtype=np.int64))
+    return np.unique(np.concatenate(parts))
@@ -0,0 +1,74 @@
+# utils/intervals.py
+
+import re
+from typing import Sequence, Tuple, Union
+from config.constants import INTERVAL_MINUTES, TRADING_MINUTES_PER_DAY, TRADING_DAYS_PER_YEAR
+
+_DURATION_PATTERN = re.compile(r"^\s*(\d+)\s*(bars?|m|h|d|wk|mo)?\s*$")
+_UNIT_MINUTES = {
+    "m": 1,
+    "h": 60,
+    "d": TRADING_MINUTES_PER_DAY,
+    "wk": 5 * TRADING_MINUTES_PER_DAY,
+    "mo": 21 * TRADING_MINUTES_PER_DAY,
+}
+
+def interval_minutes(interval: str) -> int:
+    """
+    Returns the trading minutes covered by one bar of `interval`.
+
+    Raises:
+        ValueError: If the interval is not supported.
+    """
+    try:
+        return INTERVAL_MINUTES[interval]
+    except KeyError:
+        raise ValueError(f"Unsupported interval '{interval}', expected one of {tuple(INTERVAL_MINUTES)}")
+
+def periods_per_year(interval: str) -> float:
+    """
+    Returns the number of bars of `interval` in a trading year (252 for "1d", 12 for "1mo").
+
+    Raises:
+        ValueError: If the interval is not supported.
+    """
+    return TRADING_DAYS_PER_YEAR * TRADING_MINUTES_PER_DAY / interval_minutes(interval)
+
+def to_bars(span: Union[int, str], interval: str) -> int:
+    """
+    Converts a window or horizon to a number of bars of `interval`.
+
+    Parameters:
+        span (Union[int, str]): A bar count (20, "20", "20bars") or a duration in trading time
+            ("90m", "4h", "20d", "2wk", "3mo"; a day is one regular session).
+        interval (str): The bar interval (e.g., "5m").
+
+    Returns:
+        int: The number of bars, at least 1.
+
+    Raises:
+        ValueError: If the span or interval cannot be interpreted.
+    """
+    if isinstance(span, bool):
+        raise ValueError(f"Invalid window or horizon {span!r}")
+    if isinstance(span, int):
+        bars = span
+    else:
+        match = _DURATION_PATTERN.match(str(span))
+        if match is None:
+            raise ValueError(f"Invalid window or horizon '{span}', expected bars (e.g. 20) or a duration (e.g. '4h', '20d')")
+        count, unit = int(match.group(1)), match.group(2)
+        if unit is None or unit.startswith("bar"):
+            bars = count
+        else:
+            bars = round(count * _UNIT_MINUTES[unit] / interval_minutes(interval))
+            bars = max(bars, 1) if count else 0
+    if bars < 1:
+        raise ValueError(f"Window or horizon {span!r} must cover at least one bar")
+    return bars
+
+def horizons_to_bars(horizons: Sequence[Union[int, str]], interval: str) -> Tuple[int, ...]:
+    """
+    Converts forward horizons to sorted, distinct bar counts of `interval`.
+    """
+    return tuple(sorted({to_bars(horizon, interval) for horizon in horizons}))
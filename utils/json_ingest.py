@@ -0,0 +1,189 @@
+# utils/json_ingest.py
+"""
+Decodes history API responses straight into PriceSeries column buffers.
+
+Two optional parsers are used when installed: `ijson` streams the response body event by
+event, so no per-bar dictionaries are ever built, and `orjson` speeds up whole-document
+decoding. Without either, the standard library `json` module is used.
+"""
+
+import json
+from array import array
+from typing import BinaryIO, Tuple
+import numpy as np
+from models.price_series import PriceSeries
+from utils import metrics
+from config.constants import STREAM_INGEST_MIN_BYTES
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+_FIELDS = {"date": 0, "date_utc": 1, "open": 2, "high": 3, "low": 4, "close": 5, "volume": 6}
+_FIELD_NAMES = list(_FIELDS)
+
+def loads(content: bytes):
+    """
+    Decodes a JSON document with orjson if available, falling back to the standard library.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def ingest_history_bytes(content: bytes) -> Tuple[dict, PriceSeries]:
+    """
+    Decodes a complete history response held in memory.
+
+    Parameters:
+        content (bytes): The raw response body.
+
+    Returns:
+        tuple: (header with every top-level key except "body", PriceSeries sorted by `utc_date`).
+    """
+    data = loads(content)
+    body = data.pop("body", None) or {}
+    series = PriceSeries.from_api_body(body) if body else PriceSeries.empty()
+    return data, series
+
+def ingest_history_stream(stream: BinaryIO) -> Tuple[dict, PriceSeries]:
+    """
+    Decodes a history response incrementally from a binary stream into typed column buffers.
+
+    Requires ijson; falls back to reading the whole stream and `ingest_history_bytes` otherwise.
+
+    Parameters:
+        stream (BinaryIO): File-like object yielding the raw response body.
+
+    Returns:
+        tuple: (header with the top-level "meta", "success" and "message" values, PriceSeries sorted by `utc_date`).
+
+    Raises:
+        ValueError: If a bar is missing a field or has a null one.
+    """
+    if ijson is None:
+        return ingest_history_bytes(stream.read())
+
+    header = {}
+    dates = []
+    utc_dates, volumes = array("q"), array("q")
+    opens, highs, lows, closes = array("d"), array("d"), array("d"), array("d")
+    current = [None] * 7
+    depth = 0
+    section = key = None
+    index = None
+
+    # basic_parse skips ijson's prefix bookkeeping; the nesting depth tells where each
+    # event belongs: 1 = top level, 2 = inside "meta" or "body", 3 = inside one bar
+    for event, value in ijson.basic_parse(stream, use_float=True):
+        if event == "map_key":
+            if depth == 3:
+                index = _FIELDS.get(value)
+            elif depth == 1:
+                section = value
+            else:
+                key = value
+        elif event == "start_map" or event == "start_array":
+            depth += 1
+            if depth == 2 and section == "meta":
+                header["meta"] = {}
+            elif depth == 3 and section == "body":
+                current = [None] * 7
+                index = None
+        elif event == "end_map" or event == "end_array":
+            if depth == 3 and section == "body":
+                if None in current:
+                    missing = _FIELD_NAMES[current.index(None)]
+                    raise ValueError(f"Bar {len(dates) + 1} of the response has no '{missing}' value")
+                dates.append(current[0])
+                utc_dates.append(int(current[1]))
+                opens.append(float(current[2]))
+                highs.append(float(current[3]))
+                lows.append(float(current[4]))
+                closes.append(float(current[5]))
+                volumes.append(int(current[6]))
+            depth -= 1
+        elif depth == 3:
+            if index is not None:
+                current[index] = value
+                index = None
+        elif depth == 2:
+            if section == "meta":
+                header["meta"][key] = value
+        elif depth == 1 and section != "body":
+            header[section] = value
+
+    series = PriceSeries(
+        np.array(dates, dtype=object),
+        np.frombuffer(utc_dates, dtype=np.int64),
+        np.frombuffer(opens, dtype=np.float64),
+        np.frombuffer(highs, dtype=np.float64),
+        np.frombuffer(lows, dtype=np.float64),
+        np.frombuffer(closes, dtype=np.float64),
+        np.frombuffer(volumes, dtype=np.int64),
+    )
+    return header, series.sorted()
+
+class _CountingReader:
+    """
+    Wraps a binary stream and counts the bytes read through it.
+    """
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.stream.read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+def _should_stream(response, streamed: bool, min_bytes: int) -> bool:
+    """
+    Streams unread bodies when ijson is installed, unless orjson is available and the body is
+    known to be smaller than `min_bytes` (whole-document orjson decoding is faster there).
+    """
+    if ijson is None or not streamed:
+        return False
+    if orjson is None:
+        return True
+    length = response.headers.get("Content-Length")
+    return length is None or not length.isdigit() or int(length) >= min_bytes
+
+def ingest_history_response(
+    response, streamed: bool = False, min_bytes: int = STREAM_INGEST_MIN_BYTES
+) -> Tuple[dict, PriceSeries]:
+    """
+    Decodes a `requests` response, streaming large bodies when ijson is installed.
+
+    Parameters:
+        response (requests.Response): The history API response.
+        streamed (bool): True if the response was requested with `stream=True` and its body
+            has not been read yet; otherwise the body is decoded in one go.
+        min_bytes (int): Smallest body streamed when orjson could decode it whole instead.
+
+    Returns:
+        tuple: (header, PriceSeries sorted by `utc_date`).
+
+    Raises:
+        ValueError: If a bar of a streamed body is missing a field or has a null one.
+    """
+    if _should_stream(response, streamed, min_bytes):
+        response.raw.decode_content = True
+        reader = _CountingReader(response.raw)
+        try:
+            header, series = ingest_history_stream(reader)
+        finally:
+            response.close()
+        metrics.incr("bytes_downloaded", reader.bytes_read)
+    else:
+        content = response.content
+        metrics.incr("bytes_downloaded", len(content))
+        header, series = ingest_history_bytes(content)
+
+    metrics.incr("bars_parsed", len(series))
+    return header, series
@@ -0,0 +1,163 @@
+# utils/metrics.py
+
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Optional
+
+class MetricsSink(ABC):
+    """
+    Receives timing spans and counter increments. Subclasses decide where they go.
+    """
+    @abstractmethod
+    def record_span(self, name: str, seconds: float) -> None:
+        pass
+
+    @abstractmethod
+    def record_counter(self, name: str, value: float) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+class InMemorySink(MetricsSink):
+    """
+    Keeps every span duration and counter total in memory, e.g. for tests and benchmarks.
+    """
+    def __init__(self):
+        self.spans = defaultdict(list)
+        self.counters = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record_span(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.spans[name].append(seconds)
+
+    def record_counter(self, name: str, value: float) -> None:
+        with self._lock:
+            self.counters[name] += value
+
+class LogSink(MetricsSink):
+    """
+    Emits one structured (JSON) log line per span and counter increment.
+    """
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO):
+        self.logger = logger or logging.getLogger("ticker.metrics")
+        self.level = level
+
+    def record_span(self, name: str, seconds: float) -> None:
+        self.logger.log(self.level, json.dumps({"type": "span", "name": name, "seconds": round(seconds, 6)}))
+
+    def record_counter(self, name: str, value: float) -> None:
+        self.logger.log(self.level, json.dumps({"type": "counter", "name": name, "value": value}))
+
+class PrometheusTextFileSink(InMemorySink):
+    """
+    Aggregates spans and counters and writes them in the Prometheus text exposition format,
+    e.g. for the node_exporter textfile collector. The file is rewritten on `flush()`.
+    """
+    def __init__(self, path: str, prefix: str = "ticker"):
+        super().__init__()
+        self.path = path
+        self.prefix = prefix
+
+    def flush(self) -> None:
+        with self._lock:
+            spans = {name: (len(durations), sum(durations)) for name, durations in self.spans.items()}
+            counters = dict(self.counters)
+
+        lines = [
+            f"# TYPE {self.prefix}_span_seconds summary",
+        ]
+        for name, (count, total) in sorted(spans.items()):
+            lines.append(f'{self.prefix}_span_seconds_sum{{span="{name}"}} {total}')
+            lines.append(f'{self.prefix}_span_seconds_count{{span="{name}"}} {count}')
+        for name, value in sorted(counters.items()):
+            lines.append(f"# TYPE {self.prefix}_{name}_total counter")
+            lines.append(f"{self.prefix}_{name}_total {value}")
+
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(temporary_path, self.path)
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        sink = _sink
+        if sink is not None:
+            sink.record_span(self.name, time.perf_counter() - self.start)
+        return False
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_SPAN = _NullSpan()
+_sink: Optional[MetricsSink] = None
+
+def configure(sink: Optional[MetricsSink]) -> None:
+    """
+    Installs the process-wide metrics sink. Pass None to disable metrics (the default).
+    """
+    global _sink
+    _sink = sink
+
+def get_sink() -> Optional[MetricsSink]:
+    return _sink
+
+def create_sink(spec: str) -> MetricsSink:
+    """
+    Builds a sink from a short specification: "log", "memory" or "prometheus:<path>".
+    """
+    if spec == "log":
+        return LogSink()
+    if spec == "memory":
+        return InMemorySink()
+    if spec.startswith("prometheus:"):
+        return PrometheusTextFileSink(spec.split(":", 1)[1])
+    raise ValueError(f"Unknown metrics sink '{spec}', expected 'log', 'memory' or 'prometheus:<path>'")
+
+def span(name: str):
+    """
+    Returns a context manager that records how long its block takes.
+
+    When metrics are disabled this is a shared no-op object, so instrumented code pays
+    only a function call and a None check.
+    """
+    if _sink is None:
+        return _NULL_SPAN
+    return _Span(name)
+
+def incr(name: str, value: float = 1) -> None:
+    """
+    Adds `value` to the counter `name`, if metrics are enabled.
+    """
+    sink = _sink
+    if sink is not None:
+        sink.record_counter(name, value)
+
+def flush() -> None:
+    """
+    Flushes the configured sink, if any.
+    """
+    sink = _sink
+    if sink is not None:
+        sink.flush()
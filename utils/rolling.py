@@ -0,0 +1,143 @@
+# utils/rolling.py
+
+import numpy as np
+
+def trailing_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Computes the mean of the `window` values preceding each position, via cumulative sums.
+
+    Parameters:
+        values (np.ndarray): Integer or float series.
+        window (int): Number of preceding values to average.
+
+    Returns:
+        np.ndarray: Array of length len(values) - window, where element k is the mean of
+        values[k:k + window], i.e. the trailing mean for position k + window.
+    """
+    sums = np.concatenate(([0], np.cumsum(values)))
+    return (sums[window:-1] - sums[:-window - 1]) / window
+
+def day_over_day_change(closes: np.ndarray) -> tuple:
+    """
+    Computes the relative change of each close versus the previous one.
+
+    Parameters:
+        closes (np.ndarray): Close prices.
+
+    Returns:
+        tuple: (changes, valid) arrays of length len(closes); `valid` is False for the first
+        bar and wherever the previous close is zero, and `changes` is 0 there.
+    """
+    changes = np.zeros(len(closes))
+    valid = np.zeros(len(closes), dtype=bool)
+    if len(closes) > 1:
+        previous_closes = closes[:-1]
+        valid[1:] = previous_closes != 0
+        np.divide(closes[1:] - previous_closes, previous_closes, out=changes[1:], where=valid[1:])
+    return changes, valid
+
+def forward_returns(closes: np.ndarray, horizon: int) -> np.ndarray:
+    """
+    Computes the percentage return from each close to the close `horizon` bars later.
+
+    Parameters:
+        closes (np.ndarray): Close prices.
+        horizon (int): Number of bars to look ahead.
+
+    Returns:
+        np.ndarray: Returns in percent, NaN where the series ends too soon.
+    """
+    future_closes = np.full(len(closes), np.nan)
+    if horizon < len(closes):
+        future_closes[:len(closes) - horizon] = closes[horizon:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return ((future_closes - closes) / closes) * 100
+
+def sliding_max(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Computes the maximum of every `window`-long slice in O(n), independent of the window size.
+
+    Uses the van Herk/Gil-Werman method: prefix and suffix maxima within fixed blocks of
+    `window` values are combined so that each slice needs a single comparison.
+
+    Parameters:
+        values (np.ndarray): Float series.
+        window (int): Slice length (>= 1).
+
+    Returns:
+        np.ndarray: Array of length max(0, len(values) - window + 1), where element k is
+        the maximum of values[k:k + window].
+    """
+    n = len(values)
+    if window > n:
+        return np.empty(0)
+    blocks = -(-n // window)
+    padded = np.full(blocks * window, -np.inf)
+    padded[:n] = values
+    padded = padded.reshape(blocks, window)
+    prefix = np.maximum.accumulate(padded, axis=1).ravel()
+    suffix = np.maximum.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()
+    return np.maximum(suffix[:n - window + 1], prefix[window - 1:n])
+
+def sliding_min(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Computes the minimum of every `window`-long slice in O(n); see `sliding_max`.
+    """
+    return -sliding_max(-np.asarray(values, dtype=np.float64), window)
+
+def forward_excursions(closes: np.ndarray, highs: np.ndarray, lows: np.ndarray, horizon: int) -> tuple:
+    """
+    Computes the maximum favorable and adverse excursion over the next `horizon` bars.
+
+    Parameters:
+        closes (np.ndarray): Close prices, the reference for each position.
+        highs (np.ndarray): High prices.
+        lows (np.ndarray): Low prices.
+        horizon (int): Number of bars to look ahead (>= 1).
+
+    Returns:
+        tuple: (mfe, mae) arrays in percent, where mfe[i] uses the highest high and mae[i]
+        the lowest low of bars i+1 .. i+horizon; NaN where the series ends too soon.
+    """
+    n = len(closes)
+    highest = np.full(n, np.nan)
+    lowest = np.full(n, np.nan)
+    if horizon < n:
+        highest[:n - horizon] = sliding_max(highs[1:], horizon)
+        lowest[:n - horizon] = sliding_min(lows[1:], horizon)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return ((highest - closes) / closes) * 100, ((lowest - closes) / closes) * 100
+
+def breakout_mask(
+    volumes: np.ndarray,
+    closes: np.ndarray,
+    volume_threshold: float,
+    price_threshold: float,
+    window: int
+) -> tuple:
+    """
+    Flags breakout bars: volume strictly above `volume_threshold` times the trailing
+    `window`-bar average, and a close change versus the previous bar of at least
+    `price_threshold`. The first `window` bars only seed the average.
+
+    Parameters:
+        volumes (np.ndarray): Volumes sorted by date.
+        closes (np.ndarray): Close prices sorted by date.
+        volume_threshold (float): Volume multiple a breakout bar must exceed.
+        price_threshold (float): Minimum close change for a breakout bar.
+        window (int): Number of preceding bars averaged.
+
+    Returns:
+        tuple: (mask, avg_volumes, price_changes) for bars window .. n-1, where element k
+        describes bar k + window. All are empty if there are not more than `window` bars.
+    """
+    if len(volumes) <= window:
+        return np.zeros(0, dtype=bool), np.empty(0), np.empty(0)
+    avg_volumes = trailing_mean(volumes, window)
+    price_changes, valid = day_over_day_change(closes)
+    mask = (
+        valid[window:]
+        & (volumes[window:] > volume_threshold * avg_volumes)
+        & (price_changes[window:] >= price_threshold)
+    )
+    return mask, avg_volumes, price_changes[window:]
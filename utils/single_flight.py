@@ -0,0 +1,111 @@
+# utils/single_flight.py
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Hashable, Optional
+
+from utils import metrics
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls: while a computation for a key is in flight, further
+    callers with the same key wait for it and share its result (or exception) instead of
+    starting their own.
+
+    Threads and asyncio tasks share the same in-flight calls, so a coroutine can join a
+    computation started by a thread and vice versa. Nothing is cached once a call finishes.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}  # key -> Future of the in-flight computation
+
+    def do(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Runs `compute` for `key` on the calling thread, or waits for the call already in flight.
+
+        Parameters:
+            key (Hashable): Identifies calls that produce the same result.
+            compute (Callable[[], Any]): The computation.
+
+        Returns:
+            Any: The result of the (possibly shared) computation.
+        """
+        future, leader = self._join(key)
+        if not leader:
+            return future.result()
+        return self._run(key, future, compute)
+
+    async def do_async(self, key: Hashable, compute: Callable[[], Any], executor: Optional[Executor] = None) -> Any:
+        """
+        Awaitable version of `do`; a blocking `compute` runs in `executor` (the event loop's
+        default executor if None) so the event loop is never blocked. It runs in a copy of the
+        caller's context, so context variables such as the request priority carry over.
+
+        Cancelling the awaiting task does not cancel the computation, which other callers may share.
+        If the computation cannot be submitted, or the executor drops it before it starts (e.g.
+        on `shutdown(cancel_futures=True)`), every caller waiting on it gets the error.
+        """
+        future, leader = self._join(key)
+        if leader:
+            context = contextvars.copy_context()
+            try:
+                task = asyncio.get_running_loop().run_in_executor(
+                    executor, context.run, self._run_quietly, key, future, compute
+                )
+            except BaseException as e:
+                self._abandon(key, future, e)
+                raise
+            task.add_done_callback(lambda task: task.cancelled() and self._abandon(
+                key, future, RuntimeError("The computation was cancelled before it started")
+            ))
+        return await asyncio.wrap_future(future)
+
+    def _join(self, key: Hashable) -> tuple:
+        """
+        Returns the future of the call in flight for `key`, registering a new one if there is none.
+
+        Returns:
+            tuple: (future, True if the caller must run the computation).
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                metrics.incr("single_flight_shared")
+                return future, False
+            future = Future()
+            self._calls[key] = future
+            return future, True
+
+    def _run(self, key: Hashable, future: Future, compute: Callable[[], Any]) -> Any:
+        try:
+            result = compute()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def _abandon(self, key: Hashable, future: Future, error: BaseException) -> None:
+        """
+        Fails a call whose computation will never run, so later callers start a new one.
+        """
+        if not future.done():
+            future.set_exception(error)
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def _run_quietly(self, key: Hashable, future: Future, compute: Callable[[], Any]) -> None:
+        """
+        Runs the computation in an executor, leaving its outcome to the future only.
+        """
+        try:
+            self._run(key, future, compute)
+        except BaseException:
+            pass
@@ -0,0 +1,103 @@
+# utils/ttl_cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+_MISSING = object()
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache with per-entry expiry and least-recently-used eviction.
+    """
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        max_size: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None
+    ):
+        """
+        Initializes the TTLCache.
+
+        Parameters:
+            max_entries (int): Maximum number of entries; the least recently used entry is evicted first.
+            ttl_seconds (float): Seconds after which an entry expires.
+            max_size (Optional[int]): Maximum total size of the entries, as measured by `sizeof`.
+                Least recently used entries are evicted until the total fits; a value larger
+                than `max_size` on its own is not kept.
+            sizeof (Optional[Callable[[Any], int]]): Size of a value (e.g., `len`). Required with `max_size`.
+        """
+        if max_size is not None and sizeof is None:
+            raise ValueError("TTLCache needs `sizeof` to enforce `max_size`")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.sizeof = sizeof
+        self.size = 0  # Total size of the entries, if `sizeof` is set
+        self._entries = OrderedDict()  # key -> (expires_at, value, size)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value for `key`, or `default` if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                self._remove(key)
+                return default
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Stores `value` under `key`, evicting the least recently used entries if the cache is full.
+        """
+        size = self.sizeof(value) if self.sizeof is not None else 0
+        with self._lock:
+            self._remove(key)
+            if self.max_size is not None and size > self.max_size:
+                return  # Too large to keep; evicting the other entries would not make room
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value, size)
+            self.size += size
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or (self.max_size is not None and self.size > self.max_size)
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Returns the cached value for `key`, computing and storing it on a miss.
+
+        Exceptions raised by `compute` propagate and nothing is cached.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Removes one entry, or every entry if no key is given.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self.size = 0
+            else:
+                self._remove(key)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[2]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)